@@ -0,0 +1,57 @@
+"""Import cost of the headless packages vs. the GUI entry points.
+
+Each import runs in a fresh interpreter, and the best of several runs is
+reported. The run fails when a headless package pulls in tkinter,
+matplotlib or NumPy.
+
+    python -m benchmarks.bench_import
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+HEADLESS = ("process_scheduler", "disk_scheduler", "system_simulator")
+GUI = ("gui",)
+HEAVY_MODULES = ("tkinter", "matplotlib", "numpy")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module, repeat):
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                                capture_output=True, text=True, check=True).stdout
+        run = json.loads(output)
+        if best is None or run["seconds"] < best["seconds"]:
+            best = run
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    failures = []
+    for module in HEADLESS + GUI:
+        run = measure(module, args.repeat)
+        heavy = ", ".join(run["heavy"]) or "-"
+        print(f"{module:<20} {run['seconds'] * 1000:8.1f} ms   heavy modules: {heavy}")
+        if module in HEADLESS and run["heavy"]:
+            failures.append(module)
+
+    for module in failures:
+        print(f"FAIL {module} imports {', '.join(HEAVY_MODULES)} at import time")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
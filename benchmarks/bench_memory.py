@@ -0,0 +1,45 @@
+"""Memory used by dict-based vs. slotted/array-backed schedules.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory
+"""
+import tracemalloc
+
+from process_scheduler.models import Process, Schedule
+from process_scheduler.scheduler import round_robin_scheduling
+
+
+def measure(build):
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def main(n_processes=1000, burst_time=2000, time_quantum=2):
+    workload = [Process(pid, 0, burst_time) for pid in range(n_processes)]
+    schedule = round_robin_scheduling(workload, time_quantum)["schedule"]
+    pids, starts, ends = list(schedule.process_ids), list(schedule.start_times), list(schedule.end_times)
+
+    rows = [
+        ("schedule: list of dicts",
+         measure(lambda: [{"process_id": p, "start_time": s, "end_time": e}
+                          for p, s, e in zip(pids, starts, ends)])),
+        ("schedule: Schedule", measure(lambda: Schedule(pids, starts, ends))),
+        ("processes: list of dicts",
+         measure(lambda: [{"process_id": i, "arrival_time": 0, "burst_time": burst_time, "priority": 0}
+                          for i in range(len(schedule))])),
+        ("processes: list of Process",
+         measure(lambda: [Process(i, 0, burst_time) for i in range(len(schedule))])),
+    ]
+
+    print(f"{len(schedule):,} Round Robin slices / objects")
+    for name, size in rows:
+        print(f"{name:<28} {size / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Empirical scaling of every process and disk algorithm.
+
+Seeded workloads of increasing size are generated in several shapes, each
+algorithm is timed on them, and the growth exponent k in time ~ n^k is fitted
+by least squares on log-log data. A run fails when an exponent exceeds the
+stored baseline (or the worst case claimed in ALGORITHM_COMPLEXITY) by more
+than the tolerance.
+
+    python -m benchmarks.bench_scaling                   # check against baseline
+    python -m benchmarks.bench_scaling --update-baseline # record a new baseline
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from functools import partial
+
+from disk_scheduler.algorithms import ALGORITHMS as DISK_SCHEDULERS
+from process_scheduler.models import Process
+from process_scheduler.scheduler import ALGORITHMS, ALGORITHM_COMPLEXITY
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+SIZES = (1000, 2000, 4000, 8000, 16000)
+
+# Requests are drawn from tracks 0..65535
+DISK_ALGORITHMS = {
+    "LOOK": DISK_SCHEDULERS["LOOK"],
+    "C-LOOK": DISK_SCHEDULERS["C-LOOK"],
+    "SSTF": DISK_SCHEDULERS["SSTF"],
+    "SCAN": partial(DISK_SCHEDULERS["SCAN"], disk_size=65536),
+    "C-SCAN": partial(DISK_SCHEDULERS["C-SCAN"], disk_size=65536),
+    "N-step SCAN": partial(DISK_SCHEDULERS["N-step SCAN"], disk_size=65536, n=64),
+    "FSCAN": partial(DISK_SCHEDULERS["FSCAN"], disk_size=65536)
+}
+DISK_COMPLEXITY = "O(n log n)"
+
+
+def all_at_once(n, rng):
+    return [Process(i, 0, rng.randint(1, 20)) for i in range(n)]
+
+
+def sparse(n, rng):
+    processes = []
+    time = 0
+    for i in range(n):
+        time += int(rng.expovariate(1 / 30))
+        processes.append(Process(i, time, rng.randint(1, 20), rng.randint(0, 9)))
+    return processes
+
+
+def heavy_tailed(n, rng):
+    return [Process(i, rng.randint(0, 10 * n), min(int(rng.paretovariate(1.2) * 2), 10000), rng.randint(0, 9))
+            for i in range(n)]
+
+
+# shape -> (workload generator, Round Robin quantum, algorithms or None for all)
+SHAPES = {
+    "all_at_once": (all_at_once, 4, None),
+    "sparse": (sparse, 4, None),
+    "tiny_quantum": (all_at_once, 1, ["Round Robin"]),
+    "heavy_tailed": (heavy_tailed, 4, None)
+}
+
+
+def best_time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fit_exponent(sizes, times):
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / \
+           sum((x - mean_x) ** 2 for x in xs)
+
+
+def claimed_exponent(complexity):
+    """Polynomial degree of a claimed bound; log factors count as degree 0."""
+    return 2.0 if "n²" in complexity else 1.0
+
+
+def run(sizes=SIZES, repeat=3, seed=0):
+    results = {}
+    for shape, (generate, quantum, names) in SHAPES.items():
+        workloads = [generate(n, random.Random(seed + n)) for n in sizes]
+        for name, scheduler in ALGORITHMS.items():
+            if names is not None and name not in names:
+                continue
+            if name == "Round Robin":
+                run_one = lambda w: scheduler(w, quantum)
+            else:
+                run_one = scheduler
+            times = [best_time(lambda: run_one(w), repeat) for w in workloads]
+            results[f"{shape}/{name}"] = {
+                "times": times,
+                "exponent": fit_exponent(sizes, times),
+                "claimed": ALGORITHM_COMPLEXITY[name]["time"]["worst"]
+            }
+
+    for name, algorithm in DISK_ALGORITHMS.items():
+        requests = [[random.Random(seed + n).randint(0, 65535) for _ in range(n)] for n in sizes]
+        times = [best_time(lambda: algorithm(r, 32768), repeat) for r in requests]
+        results[f"disk/{name}"] = {
+            "times": times,
+            "exponent": fit_exponent(sizes, times),
+            "claimed": DISK_COMPLEXITY
+        }
+    return results
+
+
+def check(results, baseline, tolerance):
+    failures = []
+    for key, row in results.items():
+        limit = claimed_exponent(row["claimed"]) + tolerance
+        if key in baseline:
+            limit = min(limit, baseline[key] + tolerance)
+        if row["exponent"] > limit:
+            failures.append(f"{key}: exponent {row['exponent']:.2f} > {limit:.2f}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=0.35)
+    parser.add_argument("--output", default="scaling_results.json",
+                        help="where to save this run's results")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.seed)
+    for key, row in results.items():
+        print(f"{key:<36} k={row['exponent']:5.2f}  claimed {row['claimed']}")
+
+    with open(args.output, "w") as f:
+        json.dump({"sizes": args.sizes, "seed": args.seed, "results": results}, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({key: round(row["exponent"], 3) for key, row in results.items()}, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    failures = check(results, baseline, args.tolerance)
+    for failure in failures:
+        print("REGRESSION", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""Load test for the local scheduling service (service.py).
+
+Starts the service in a subprocess (or targets a running one with --url or
+--unix), opens --clients keep-alive connections and has each send requests
+back to back for --duration seconds. Reports requests/second, latency
+percentiles and how many requests were rejected (503) or timed out (504).
+Payloads are drawn from --distinct seeded workloads, so a small value
+measures the result cache and a large one the worker pool.
+
+    python -m benchmarks.bench_service --clients 32 --duration 10
+    python -m benchmarks.bench_service --distinct 4 --kind disk
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+from process_scheduler.metrics import percentile
+
+SERVICE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "service.py")
+
+
+def make_payloads(kind, distinct, size, seed):
+    rng = random.Random(seed)
+    payloads = []
+    for _ in range(distinct):
+        if kind == "process":
+            processes = [[pid, rng.randrange(size * 2), rng.randint(1, 20), rng.randint(0, 5)]
+                         for pid in range(1, size + 1)]
+            processes.sort(key=lambda row: row[1])
+            body = {"algorithm": rng.choice(["FCFS", "SRTF", "Round Robin", "CFS"]),
+                    "params": {"time_quantum": 4}, "processes": processes}
+            path = "/process"
+        else:
+            body = {"algorithm": rng.choice(["LOOK", "C-LOOK", "SSTF", "C-SCAN"]),
+                    "head": rng.randrange(200), "options": {"disk_size": 200},
+                    "requests": [rng.randrange(200) for _ in range(size)]}
+            path = "/disk"
+        payloads.append((path, json.dumps(body).encode()))
+    return payloads
+
+
+async def request(reader, writer, path, body, host):
+    """Send one POST and read the whole response; returns the status code."""
+    writer.write(f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, headers.get("connection") != "close"
+
+
+async def client(connect, host, payloads, deadline, rng, latencies, statuses):
+    reader, writer = await connect()
+    try:
+        while time.perf_counter() < deadline:
+            path, body = rng.choice(payloads)
+            start = time.perf_counter()
+            status, keep_alive = await request(reader, writer, path, body, host)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+            if status == 503:
+                await asyncio.sleep(0.01)
+            if not keep_alive:
+                writer.close()
+                reader, writer = await connect()
+    finally:
+        writer.close()
+
+
+async def load(connect, host, payloads, clients, duration, seed):
+    latencies = []
+    statuses = Counter()
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(client(connect, host, payloads, deadline, random.Random(seed + i),
+                                  latencies, statuses) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "ok_per_second": statuses[200] / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "statuses": dict(statuses)
+    }
+
+
+def start_service(options):
+    """Run service.py on a free port; returns (process, url)."""
+    process = subprocess.Popen([sys.executable, SERVICE, "--port", "0", *options],
+                               stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("Listening on "):
+        process.kill()
+        raise RuntimeError("service did not start")
+    return process, line.split()[-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="running service, e.g. http://127.0.0.1:8750")
+    parser.add_argument("--unix", help="running service on a Unix socket")
+    parser.add_argument("--kind", choices=("process", "disk"), default="process")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--distinct", type=int, default=1000,
+                        help="different payloads; small values hit the cache")
+    parser.add_argument("--size", type=int, default=200, help="processes or requests per payload")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--service-args", nargs=argparse.REMAINDER, default=[],
+                        help="arguments for the service started when no --url/--unix is given")
+    args = parser.parse_args(argv)
+
+    service = None
+    if args.unix:
+        def connect():
+            return asyncio.open_unix_connection(args.unix)
+        host = "localhost"
+    else:
+        url = args.url
+        if url is None:
+            service, url = start_service(args.service_args)
+        parts = urlsplit(url)
+
+        def connect():
+            return asyncio.open_connection(parts.hostname, parts.port)
+        host = parts.netloc
+
+    try:
+        payloads = make_payloads(args.kind, args.distinct, args.size, args.seed)
+        result = asyncio.run(load(connect, host, payloads, args.clients, args.duration, args.seed))
+    finally:
+        if service is not None:
+            service.terminate()
+            service.wait()
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
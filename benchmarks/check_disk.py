@@ -0,0 +1,170 @@
+"""Cross-check the disk algorithms against a unit-step reference.
+
+The reference moves the head one track at a time and serves every request on
+the track it is on, so it has no bisects or closed forms to get wrong. Random
+small workloads (with duplicates and requests on the head's track) are run
+through LOOK, C-LOOK, SCAN, C-SCAN, N-step SCAN, FSCAN and, when NumPy is
+installed, the batch LOOK/C-LOOK movement. simulate_disk with every request
+arriving at time 0 must then serve the same sequence with the same movement
+as each algorithm, SSTF included. Any difference fails the run.
+
+    python -m benchmarks.check_disk --trials 20000
+"""
+import argparse
+import random
+import sys
+from collections import Counter
+
+from disk_scheduler.algorithms import run_algorithm
+from disk_scheduler.simulation import simulate_disk, DiskModel
+
+
+def unit_step(requests, head, direction, disk_size, policy):
+    """(sequence, total_movement, path, final direction) of one sweep policy."""
+    pending = Counter(requests)
+    remaining = len(requests)
+    position = head
+    step = 1 if direction == "right" else -1
+    sequence, path = [], []
+    movement = 0
+    while True:
+        served = pending.pop(position, 0)
+        sequence += [position] * served
+        path += [position] * served
+        remaining -= served
+        if not remaining:
+            break
+        if not any((track - position) * step > 0 for track in pending):
+            edge = disk_size - 1 if step > 0 else 0
+            if policy in ("SCAN", "C-SCAN") and position != edge:
+                position += step
+                movement += 1
+                continue
+            if policy == "C-SCAN":
+                path += [edge, disk_size - 1 - edge]
+                movement += disk_size - 1
+                position = disk_size - 1 - edge
+                continue
+            if policy == "C-LOOK":
+                far = min(pending) if step > 0 else max(pending)
+                movement += abs(far - position)
+                position = far
+                continue
+            if policy == "SCAN":
+                path.append(edge)
+            step = -step
+        position += step
+        movement += 1
+    return sequence, movement, path, "right" if step > 0 else "left"
+
+
+def sweeps(batches, head, direction, disk_size):
+    """N-step SCAN / FSCAN reference: one unit-step SCAN per batch."""
+    sequence, path = [], []
+    movement = 0
+    for batch in batches:
+        served, moved, stops, direction = unit_step(batch, head, direction, disk_size, "SCAN")
+        sequence += served
+        path += stops
+        movement += moved
+        if stops:
+            head = stops[-1]
+    return sequence, movement, path
+
+
+def fscan_batches(requests, arrivals, head, direction, disk_size):
+    """Split requests into the frozen queues FSCAN sweeps (time = tracks moved)."""
+    order = sorted(range(len(requests)), key=arrivals.__getitem__)
+    batches = []
+    time = 0
+    i = 0
+    while i < len(order):
+        time = max(time, arrivals[order[i]])
+        j = i
+        while j < len(order) and arrivals[order[j]] <= time:
+            j += 1
+        batch = [requests[k] for k in order[i:j]]
+        _, moved, stops, direction = unit_step(batch, head, direction, disk_size, "SCAN")
+        if stops:
+            head = stops[-1]
+        time += moved
+        batches.append(batch)
+        i = j
+    return batches
+
+
+def check(requests, head, direction, disk_size, n, arrivals, batch_movement):
+    """Differences between the algorithms and the reference, as messages."""
+    failures = []
+    expected = {}
+    for policy in ("LOOK", "C-LOOK", "SCAN", "C-SCAN"):
+        expected[policy] = unit_step(requests, head, direction, disk_size, policy)[:3]
+    expected["N-step SCAN"] = sweeps([requests[i:i + n] for i in range(0, len(requests), n)],
+                                     head, direction, disk_size)
+    expected["FSCAN"] = sweeps(fscan_batches(requests, arrivals, head, direction, disk_size),
+                               head, direction, disk_size)
+    for name, (sequence, movement, path) in expected.items():
+        result = run_algorithm(name, requests, head, direction, disk_size=disk_size, n=n,
+                               arrival_times=arrivals)
+        got = (result["sequence"], result["total_movement"], result.get("path", path))
+        if got != (sequence, movement, path):
+            failures.append(f"{name}: got {got}, expected {(sequence, movement, path)}")
+    if batch_movement is not None:
+        for name in ("LOOK", "C-LOOK"):
+            movement = int(batch_movement[name](requests, [head], direction)[0])
+            if movement != expected[name][1]:
+                failures.append(f"{name} batch: got {movement}, expected {expected[name][1]}")
+    return failures + check_simulation(requests, head, direction, disk_size, n)
+
+
+def check_simulation(requests, head, direction, disk_size, n):
+    """Differences between simulate_disk with no arrival gaps and the algorithms."""
+    failures = []
+    model = DiskModel(disk_size=disk_size)
+    for name in ("LOOK", "C-LOOK", "SSTF", "SCAN", "C-SCAN", "N-step SCAN", "FSCAN"):
+        static = run_algorithm(name, requests, head, direction, disk_size=disk_size, n=n)
+        simulated = simulate_disk([0] * len(requests), requests, name, head, direction, model, n=n)
+        got = ([requests[index] for index in simulated["order"]], simulated["total_movement"])
+        if got != (static["sequence"], static["total_movement"]):
+            failures.append(f"{name} simulation: got {got}, expected "
+                            f"{(static['sequence'], static['total_movement'])}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        from disk_scheduler.batch import look_batch, c_look_batch
+        batch_movement = {"LOOK": look_batch, "C-LOOK": c_look_batch}
+    except ImportError:
+        batch_movement = None
+
+    rng = random.Random(args.seed)
+    failed = 0
+    for _ in range(args.trials):
+        disk_size = rng.randint(1, 40)
+        head = rng.randrange(disk_size)
+        requests = [rng.randrange(disk_size) for _ in range(rng.randint(0, 12))]
+        if requests and rng.random() < 0.5:
+            requests.insert(rng.randrange(len(requests) + 1), head)
+        direction = rng.choice(("left", "right"))
+        arrivals = [rng.randrange(2 * disk_size) for _ in requests]
+        failures = check(requests, head, direction, disk_size, rng.randint(1, 4), arrivals,
+                         batch_movement)
+        if failures:
+            failed += 1
+            if failed <= 5:
+                print(f"FAIL requests={requests} head={head} direction={direction} "
+                      f"disk_size={disk_size}")
+                for failure in failures:
+                    print("    " + failure)
+    print(f"{args.trials} workloads, {failed} with differences")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,364 @@
+"""Command-line batch runner.
+
+    python cli.py process workload.csv -a FCFS -a "Round Robin" --quantum 4
+    cat workload.csv | python cli.py process -a SRTF --format csv
+    python cli.py disk requests.csv --head 53 -a all
+    python cli.py disk requests.csv --head 53 -a FSCAN --disk-size 5000
+
+Schedule slices and per-process metrics are written to stdout as JSON lines
+(or CSV rows) while the schedule is being computed, so the tool can sit in a
+pipeline over traces too large to buffer. Process workloads are read lazily
+and must be ordered by arrival time. Workload files may be CSV or binary
+traces (see workload.traces); "-" or no file reads CSV from stdin.
+
+With several algorithms each one runs in its own worker process. Their output
+is interleaved in chunks of whole lines, each tagged with the algorithm name.
+Run summaries are JSON lines on stdout, or on stderr with --format csv.
+"""
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import queue
+import shutil
+import sys
+import tempfile
+
+from disk_scheduler.algorithms import ALGORITHMS as DISK_ALGORITHMS, run_algorithm
+from process_scheduler.models import Process
+from process_scheduler.streaming import (
+    RunningMetrics,
+    fcfs_stream,
+    round_robin_stream,
+    sjf_stream,
+    srtf_stream,
+    priority_stream,
+    cfs_stream,
+    mlfq_stream
+)
+
+# Lines a worker buffers before handing them to the parent
+CHUNK_LINES = 1000
+# Pending chunks per run; a slow reader blocks the workers instead of filling memory
+MAX_PENDING_CHUNKS = 64
+
+PROCESS_STREAMS = {
+    "FCFS": lambda arrivals, params, metrics: fcfs_stream(arrivals, metrics),
+    "SJF": lambda arrivals, params, metrics: sjf_stream(arrivals, metrics),
+    "Priority": lambda arrivals, params, metrics: priority_stream(arrivals, False, metrics),
+    "Preemptive Priority": lambda arrivals, params, metrics: priority_stream(arrivals, True, metrics),
+    "Round Robin": lambda arrivals, params, metrics: round_robin_stream(
+        arrivals, params["quantum"], metrics),
+    "SRTF": lambda arrivals, params, metrics: srtf_stream(arrivals, metrics),
+    "CFS": lambda arrivals, params, metrics: cfs_stream(
+        arrivals, params["target_latency"], params["min_granularity"], metrics),
+    "MLFQ": lambda arrivals, params, metrics: mlfq_stream(
+        arrivals, tuple(params["mlfq_quanta"]), params["boost_interval"], metrics)
+}
+
+PROCESS_FIELDS = ["algorithm", "record", "process_id", "start_time", "end_time", "arrival_time",
+                  "completion_time", "waiting_time", "turnaround_time", "response_time"]
+DISK_FIELDS = ["algorithm", "record", "index", "track", "seek"]
+
+
+class Writer:
+    """Formats records as JSON lines or CSV rows and hands them to sink in chunks."""
+
+    def __init__(self, fmt, fields, sink):
+        self.fmt = fmt
+        self.sink = sink
+        self.buffer = io.StringIO()
+        self.lines = 0
+        if fmt == "csv":
+            self.csv = csv.DictWriter(self.buffer, fields, lineterminator="\n")
+
+    def write(self, record):
+        if self.fmt == "csv":
+            self.csv.writerow(record)
+        else:
+            self.buffer.write(json.dumps(record) + "\n")
+        self.lines += 1
+        if self.lines >= CHUNK_LINES:
+            self.flush()
+
+    def summary(self, record):
+        if self.fmt == "csv":
+            sys.stderr.write(json.dumps(record) + "\n")
+        else:
+            self.write(record)
+
+    def flush(self):
+        if self.lines:
+            self.sink(self.buffer.getvalue())
+            self.buffer.seek(0)
+            self.buffer.truncate()
+            self.lines = 0
+
+
+def is_binary_trace(path):
+    from workload.traces import MAGIC
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def csv_rows(lines, name="<stdin>", columns=1):
+    """Integer rows of a CSV stream; a non-numeric first row is a header.
+
+    A bad row, or one with fewer than columns values, raises ValueError
+    naming the file and line.
+    """
+    first = True
+    reader = csv.reader(lines)
+    for row in reader:
+        if not row:
+            continue
+        try:
+            values = [int(v) for v in row]
+        except ValueError:
+            if not first:
+                raise ValueError(f"{name}, line {reader.line_num}: expected integers, "
+                                 f"got {','.join(row)!r}")
+            continue
+        finally:
+            first = False
+        if len(values) < columns:
+            raise ValueError(f"{name}, line {reader.line_num}: expected at least {columns} "
+                             f"values, got {len(values)}")
+        yield values
+
+
+def read_csv(path, source, columns=1):
+    """csv_rows of stdin ("-") or a file; errors name source (stdin when spooled)."""
+    if path == "-":
+        yield from csv_rows(sys.stdin, columns=columns)
+    else:
+        with open(path, newline="") as f:
+            yield from csv_rows(f, source or path, columns)
+
+
+def read_processes(path, source=None):
+    if path != "-" and is_binary_trace(path):
+        from workload import load_process_trace
+        trace = load_process_trace(path)
+        for start in range(0, len(trace), CHUNK_LINES):
+            for row in trace[start:start + CHUNK_LINES].tolist():
+                yield Process(*row)
+    else:
+        for values in read_csv(path, source, columns=3):
+            yield Process(*values[:4])
+
+
+def read_requests(path, source=None):
+    """(tracks, timestamps); CSV rows are either track or timestamp,track."""
+    if path != "-" and is_binary_trace(path):
+        from workload import load_disk_trace
+        trace = load_disk_trace(path)
+        return trace["track"].tolist(), trace["timestamp"].tolist()
+    rows = list(read_csv(path, source))
+    return [values[-1] for values in rows], [values[0] if len(values) > 1 else 0 for values in rows]
+
+
+def run_process(name, path, params, writer):
+    completed = []
+    metrics = RunningMetrics(on_complete=lambda pid, stats: completed.append((pid, stats)))
+    records = params["records"]
+    for pid, start, end in PROCESS_STREAMS[name](read_processes(path, params.get("source")),
+                                                  params, metrics):
+        if records != "processes":
+            writer.write({"algorithm": name, "record": "slice", "process_id": pid,
+                          "start_time": start, "end_time": end})
+        if records != "slices":
+            for pid, stats in completed:
+                writer.write({"algorithm": name, "record": "process", "process_id": pid, **stats})
+        completed.clear()
+    writer.summary({"algorithm": name, "record": "summary", **metrics.snapshot()})
+
+
+def disk_records(name, result, head):
+    """request and turn records for a disk result, in the order the head moves."""
+    position = head
+    index = 0
+    # SCAN-style paths also stop at the disk edges where the head turns
+    requests = iter(result["sequence"])
+    pending = next(requests, None)
+    for track in result.get("path", result["sequence"]):
+        if track == pending:
+            yield {"algorithm": name, "record": "request", "index": index,
+                   "track": track, "seek": abs(track - position)}
+            index += 1
+            pending = next(requests, None)
+        else:
+            yield {"algorithm": name, "record": "turn", "track": track,
+                   "seek": abs(track - position)}
+        position = track
+
+
+def disk_summary(name, result):
+    return {"algorithm": name, "record": "summary", "requests": len(result["sequence"]),
+            "total_movement": result["total_movement"], "direction": result["direction"]}
+
+
+def run_disk(name, path, params, writer):
+    tracks, timestamps = read_requests(path, params.get("source"))
+    head = params["head"]
+    result = run_algorithm(name, tracks, head, params["direction"], disk_size=params["disk_size"],
+                           n=params["n"], arrival_times=timestamps)
+    for record in disk_records(name, result, head):
+        writer.write(record)
+    writer.summary(disk_summary(name, result))
+
+
+RUNNERS = {
+    "process": (run_process, PROCESS_FIELDS),
+    "disk": (run_disk, DISK_FIELDS)
+}
+
+
+def worker(kind, name, path, params, fmt, results):
+    run, fields = RUNNERS[kind]
+    try:
+        writer = Writer(fmt, fields, lambda text: results.put(("data", name, text)))
+        run(name, path, params, writer)
+        writer.flush()
+        results.put(("done", name, None))
+    except Exception as e:
+        results.put(("error", name, str(e)))
+
+
+def run_parallel(kind, names, path, params, fmt, max_workers):
+    """Run each algorithm in its own process and copy their chunks to stdout."""
+    results = multiprocessing.Queue(MAX_PENDING_CHUNKS)
+    pending = list(names)
+    running = {}
+    errors = []
+    try:
+        while pending or running:
+            while pending and len(running) < max_workers:
+                name = pending.pop(0)
+                running[name] = multiprocessing.Process(
+                    target=worker, args=(kind, name, path, params, fmt, results), daemon=True)
+                running[name].start()
+            try:
+                status, name, payload = results.get(timeout=1)
+            except queue.Empty:
+                # A worker that died without reporting (e.g. killed) counts as failed
+                for name, process in list(running.items()):
+                    if process.exitcode not in (None, 0):
+                        errors.append(f"{name}: worker exited with code {process.exitcode}")
+                        del running[name]
+                continue
+            if status == "data":
+                sys.stdout.write(payload)
+                continue
+            if status == "error":
+                errors.append(f"{name}: {payload}")
+            running.pop(name).join()
+    finally:
+        for process in running.values():
+            process.terminate()
+    return errors
+
+
+def run_sequential(kind, names, path, params, fmt):
+    run_one, fields = RUNNERS[kind]
+    errors = []
+    for name in names:
+        writer = Writer(fmt, fields, sys.stdout.write)
+        try:
+            run_one(name, path, params, writer)
+        except (OSError, ValueError) as e:
+            errors.append(f"{name}: {e}")
+        writer.flush()
+    return errors
+
+
+def run(kind, names, path, params, fmt, max_workers):
+    if fmt == "csv":
+        sys.stdout.write(",".join(RUNNERS[kind][1]) + "\n")
+    spooled = None
+    if path == "-" and len(names) > 1:
+        # Every algorithm needs its own pass over the input
+        with tempfile.NamedTemporaryFile("wb", suffix=".csv", delete=False) as f:
+            shutil.copyfileobj(sys.stdin.buffer, f)
+        path = spooled = f.name
+        params = {**params, "source": "<stdin>"}
+    try:
+        if len(names) == 1 or max_workers == 1:
+            return run_sequential(kind, names, path, params, fmt)
+        return run_parallel(kind, names, path, params, fmt, max_workers)
+    finally:
+        if spooled is not None:
+            os.remove(spooled)
+
+
+def resolve(names, available, parser):
+    """Map case-insensitive names ("round-robin", "c_look", "all") to algorithm keys."""
+    def normalize(name):
+        return name.lower().replace("-", " ").replace("_", " ")
+
+    lookup = {normalize(key): key for key in available}
+    if any(normalize(name) == "all" for name in names):
+        return list(available)
+    resolved = []
+    for name in names:
+        if normalize(name) not in lookup:
+            parser.error(f"unknown algorithm {name!r} (choose from {', '.join(available)} or all)")
+        resolved.append(lookup[normalize(name)])
+    return resolved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run scheduling algorithms over a workload file or stdin")
+    subparsers = parser.add_subparsers(dest="kind", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("workload", nargs="?", default="-",
+                        help="CSV or binary trace file; '-' or omitted reads CSV from stdin")
+    common.add_argument("-a", "--algorithm", action="append", default=[],
+                        help="algorithm to run; repeat for several, or 'all'")
+    common.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    common.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="algorithms run in parallel")
+
+    process = subparsers.add_parser("process", parents=[common],
+                                    help="CPU scheduling over pid,arrival,burst[,priority] rows")
+    process.add_argument("--records", choices=("all", "slices", "processes"), default="all",
+                         help="which records to stream besides the summary")
+    process.add_argument("--quantum", type=int, default=2, help="Round Robin time quantum")
+    process.add_argument("--target-latency", type=int, default=20, help="CFS scheduling period")
+    process.add_argument("--min-granularity", type=int, default=4, help="CFS minimum timeslice")
+    process.add_argument("--mlfq-quanta", type=int, nargs="+", default=[2, 4, 8],
+                         help="MLFQ quantum per level, highest priority first")
+    process.add_argument("--boost-interval", type=int, default=100,
+                         help="MLFQ priority boost period (0 disables)")
+
+    disk = subparsers.add_parser("disk", parents=[common],
+                                 help="disk scheduling over track or timestamp,track rows")
+    disk.add_argument("--head", type=int, default=0, help="initial head position")
+    disk.add_argument("--direction", choices=("right", "left"), default="right")
+    disk.add_argument("--disk-size", type=int, default=200,
+                      help="tracks on the disk, for SCAN, C-SCAN, N-step SCAN and FSCAN")
+    disk.add_argument("-n", type=int, default=10, help="N-step SCAN batch size")
+
+    args = parser.parse_args(argv)
+    available = PROCESS_STREAMS if args.kind == "process" else DISK_ALGORITHMS
+    names = resolve(args.algorithm or [next(iter(available))], available, parser)
+    params = {key: value for key, value in vars(args).items()
+              if key not in ("kind", "workload", "algorithm", "format", "workers")}
+
+    try:
+        errors = run(args.kind, names, args.workload, params, args.format, max(1, args.workers))
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Downstream closed early (e.g. piped into head); silence the final flush
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    for error in errors:
+        print(f"error: {error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,34 @@
-from .algorithms import look_algorithm, c_look_algorithm
-from .visualization import plot_disk_movement
-from .tab import DiskSchedulerTab  
\ No newline at end of file
+import importlib
+
+from .algorithms import (
+    look_algorithm,
+    c_look_algorithm,
+    sstf_algorithm,
+    scan_algorithm,
+    c_scan_algorithm,
+    n_step_scan_algorithm,
+    fscan_algorithm,
+    run_algorithm,
+    RequestIndex
+)
+from .simulation import simulate_disk, DiskModel
+from .raid import simulate_array, map_requests
+
+# Names backed by NumPy, matplotlib or tkinter, imported on first access
+_LAZY = {
+    "look_batch": ".batch",
+    "c_look_batch": ".batch",
+    "plot_disk_movement": ".visualization",
+    "DiskSchedulerTab": ".tab"
+}
+
+def __getattr__(name):
+    # Resolved on first access so importing the package stays headless
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
\ No newline at end of file
@@ -1,49 +1,316 @@
-def look_algorithm(requests, head, direction="right"):
-    sequence = []
-    left = [r for r in requests if r < head]
-    right = [r for r in requests if r >= head]
-    
-    left.sort(reverse=True)
-    right.sort()
-    
-    if direction == "right":
-        sequence.extend(right)
-        sequence.extend(left)
-    else:
-        sequence.extend(left)
-        sequence.extend(right)
+from bisect import bisect_left, bisect_right
+
+from process_scheduler.instrumentation import counters_of, phase, sort
+
+
+class RequestIndex:
+    """Track requests sorted once, for evaluating many head positions.
+
+    Splitting at the head is a bisect, and since the head sweeps
+    monotonically through each side the total movement only depends on the
+    extremes of each run, so *_movement is O(log n). look, c_look and scan
+    build the full service sequence in O(n) without re-sorting.
+
+    Requests on the head's own track are served first, with no movement,
+    whichever way the head is moving. SCAN and C-SCAN travel to the disk edge
+    (track 0 or disk_size - 1) before turning back, but only when requests
+    remain behind the head.
+    C-SCAN's return trip from one edge to the other counts as movement.
+    """
+
+    def __init__(self, requests, counters=None):
+        self.tracks = list(requests)
+        sort(self.tracks, counters)
+
+    def __len__(self):
+        return len(self.tracks)
+
+    def split(self, head, direction="right"):
+        """Index splitting the requests below the head from those above it.
+
+        Requests on the head's track go on the side the head is moving
+        towards, so they come first in the sequence.
+        """
+        if direction == "right":
+            return bisect_left(self.tracks, head)
+        return bisect_right(self.tracks, head)
+
+    def runs(self, head, direction="right", circular=False):
+        """(first, last) of each monotonic sweep, in service order."""
+        tracks = self.tracks
+        i = self.split(head, direction)
+        below = i > 0
+        above = i < len(tracks)
+        if direction == "right":
+            runs = [(tracks[i], tracks[-1]) if above else None,
+                    ((tracks[0], tracks[i - 1]) if circular else (tracks[i - 1], tracks[0])) if below else None]
+        else:
+            runs = [(tracks[i - 1], tracks[0]) if below else None,
+                    ((tracks[-1], tracks[i]) if circular else (tracks[i], tracks[-1])) if above else None]
+        return [run for run in runs if run is not None]
+
+    def sequence(self, head, direction="right", circular=False):
+        tracks = self.tracks
+        i = self.split(head, direction)
+        below, above = tracks[:i], tracks[i:]
+        if direction == "right":
+            return above + (below if circular else below[::-1])
+        return below[::-1] + (above[::-1] if circular else above)
+
+    def ahead(self, head, direction="right"):
+        """Number of requests served before the head turns."""
+        i = self.split(head, direction)
+        return len(self.tracks) - i if direction == "right" else i
+
+    def edges(self, head, direction="right", disk_size=200, circular=False):
+        """Edge tracks SCAN (one) or C-SCAN (two) visits before turning, if any."""
+        check_bounds(self.tracks, head, disk_size)
+        if self.ahead(head, direction) == len(self.tracks):
+            return []
+        far, near = (disk_size - 1, 0) if direction == "right" else (0, disk_size - 1)
+        return [far, near] if circular else [far]
+
+    def scan_runs(self, head, direction="right", disk_size=200, circular=False):
+        runs = self.runs(head, direction, circular)
+        edges = self.edges(head, direction, disk_size, circular)
+        if edges:
+            runs.insert(len(runs) - 1, (edges[0], edges[-1]))
+        return runs
+
+    def scan_path(self, head, direction="right", disk_size=200, circular=False):
+        """Every track the head stops at: requests plus the edges it turns at."""
+        sequence = self.sequence(head, direction, circular)
+        ahead = self.ahead(head, direction)
+        return sequence[:ahead] + self.edges(head, direction, disk_size, circular) + sequence[ahead:]
+
+    def look_movement(self, head, direction="right"):
+        return path_length(head, self.runs(head, direction))
+
+    def c_look_movement(self, head, direction="right"):
+        return path_length(head, self.runs(head, direction, circular=True))
+
+    def scan_movement(self, head, direction="right", disk_size=200):
+        return path_length(head, self.scan_runs(head, direction, disk_size))
+
+    def c_scan_movement(self, head, direction="right", disk_size=200):
+        return path_length(head, self.scan_runs(head, direction, disk_size, circular=True))
+
+    def look(self, head, direction="right", instrument=None):
+        return self._result(head, direction, False, instrument)
+
+    def c_look(self, head, direction="right", instrument=None):
+        return self._result(head, direction, True, instrument)
+
+    def scan(self, head, direction="right", disk_size=200, instrument=None):
+        return self._scan_result(head, direction, disk_size, False, instrument)
+
+    def c_scan(self, head, direction="right", disk_size=200, instrument=None):
+        return self._scan_result(head, direction, disk_size, True, instrument)
+
+    def _scan_result(self, head, direction, disk_size, circular, instrument):
+        with phase(instrument, "scheduling"):
+            path = self.scan_path(head, direction, disk_size, circular)
+            sequence = self.sequence(head, direction, circular)
+        with phase(instrument, "metrics"):
+            total_movement = path_length(head, self.scan_runs(head, direction, disk_size, circular))
+        return finish({
+            "sequence": sequence,
+            "total_movement": total_movement,
+            "direction": direction,
+            "path": path
+        }, instrument)
+
+    def _result(self, head, direction, circular, instrument):
+        with phase(instrument, "scheduling"):
+            sequence = self.sequence(head, direction, circular)
+        with phase(instrument, "metrics"):
+            total_movement = path_length(head, self.runs(head, direction, circular))
+        return finish({
+            "sequence": sequence,
+            "total_movement": total_movement,
+            "direction": direction
+        }, instrument)
+
+
+def path_length(head, runs):
+    """Head movement from head through each (first, last) run in order."""
+    total = 0
+    position = head
+    for first, last in runs:
+        total += abs(first - position) + abs(last - first)
+        position = last
+    return total
+
+def check_bounds(tracks, head, disk_size):
+    # tracks is sorted
+    if not 0 <= head < disk_size or (tracks and (tracks[0] < 0 or tracks[-1] >= disk_size)):
+        raise ValueError(f"Head and requests must lie within tracks 0..{disk_size - 1}")
+
+def look_algorithm(requests, head, direction="right", instrument=None):
+    with phase(instrument, "scheduling"):
+        index = RequestIndex(requests, counters_of(instrument))
+    return index.look(head, direction, instrument)
+
+def c_look_algorithm(requests, head, direction="right", instrument=None):
+    with phase(instrument, "scheduling"):
+        index = RequestIndex(requests, counters_of(instrument))
+    return index.c_look(head, direction, instrument)
+
+def sstf_algorithm(requests, head, direction="right", instrument=None):
+    """Shortest Seek Time First.
+
+    The requests already served always form a contiguous block of the sorted
+    tracks around the head, so the closest pending request is one of the two
+    tracks just outside that block: each pick is O(1) after the O(n log n)
+    sort. Ties go to the side the head is moving towards, starting with
+    direction.
+    """
+    counters = counters_of(instrument)
+    with phase(instrument, "scheduling"):
+        tracks = RequestIndex(requests, counters).tracks
+        below = bisect_left(tracks, head) - 1
+        above = below + 1
+        position = head
+        rightward = direction == "right"
+        sequence = []
+        while below >= 0 or above < len(tracks):
+            if counters is not None:
+                counters["comparisons"] += 1
+            if below < 0:
+                take_above = True
+            elif above >= len(tracks):
+                take_above = False
+            else:
+                down, up = position - tracks[below], tracks[above] - position
+                take_above = up < down or (up == down and rightward)
+            if take_above:
+                track = tracks[above]
+                above += 1
+            else:
+                track = tracks[below]
+                below -= 1
+            if track != position:
+                rightward = track > position
+            sequence.append(track)
+            position = track
     
-    total_movement = abs(head - sequence[0])
-    for i in range(1, len(sequence)):
-        total_movement += abs(sequence[i] - sequence[i-1])
+    with phase(instrument, "metrics"):
+        total_movement = sum(abs(b - a) for a, b in zip([head] + sequence, sequence))
     
-    return {
+    return finish({
         "sequence": sequence,
         "total_movement": total_movement,
         "direction": direction
-    }
+    }, instrument)
 
-def c_look_algorithm(requests, head, direction="right"):
-    sequence = []
-    left = [r for r in requests if r < head]
-    right = [r for r in requests if r >= head]
-    
-    left.sort()
-    right.sort()
-    
-    if direction == "right":
-        sequence.extend(right)
-        sequence.extend(left)
-    else:
-        sequence.extend(left[::-1])
-        sequence.extend(right[::-1])
-    
-    total_movement = abs(head - sequence[0])
-    for i in range(1, len(sequence)):
-        total_movement += abs(sequence[i] - sequence[i-1])
+def scan_algorithm(requests, head, direction="right", disk_size=200, instrument=None):
+    with phase(instrument, "scheduling"):
+        index = RequestIndex(requests, counters_of(instrument))
+    return index.scan(head, direction, disk_size, instrument)
+
+def c_scan_algorithm(requests, head, direction="right", disk_size=200, instrument=None):
+    with phase(instrument, "scheduling"):
+        index = RequestIndex(requests, counters_of(instrument))
+    return index.c_scan(head, direction, disk_size, instrument)
+
+class _Sweeps:
+    """Accumulates consecutive SCAN sweeps over batches of requests."""
+
+    def __init__(self, head, direction, disk_size, instrument):
+        self.position = head
+        self.direction = direction
+        self.disk_size = disk_size
+        self.instrument = instrument
+        self.sequence = []
+        self.path = []
+        self.total_movement = 0
+
+    def sweep(self, batch):
+        """Serve batch with one SCAN from the current position; returns the movement."""
+        instrument = self.instrument
+        with phase(instrument, "scheduling"):
+            index = RequestIndex(batch, counters_of(instrument))
+            path = index.scan_path(self.position, self.direction, self.disk_size)
+            self.sequence += index.sequence(self.position, self.direction)
+        with phase(instrument, "metrics"):
+            movement = index.scan_movement(self.position, self.direction, self.disk_size)
+        if index.ahead(self.position, self.direction) < len(index):
+            self.direction = "left" if self.direction == "right" else "right"
+        if path:
+            self.position = path[-1]
+        self.path += path
+        self.total_movement += movement
+        return movement
+
+    def result(self, direction):
+        return finish({
+            "sequence": self.sequence,
+            "total_movement": self.total_movement,
+            "direction": direction,
+            "path": self.path
+        }, self.instrument)
+
+def n_step_scan_algorithm(requests, head, direction="right", disk_size=200, n=10, instrument=None):
+    """N-step SCAN: requests are taken n at a time, in arrival order, and each
+    batch is served by one SCAN sweep before the next batch is considered."""
+    if n < 1:
+        raise ValueError("n must be at least 1")
+    requests = list(requests)
+    sweeps = _Sweeps(head, direction, disk_size, instrument)
+    for start in range(0, len(requests), n):
+        sweeps.sweep(requests[start:start + n])
+    return sweeps.result(direction)
+
+def fscan_algorithm(requests, head, direction="right", disk_size=200, arrival_times=None, instrument=None):
+    """FSCAN: the queue being swept is frozen and requests that arrive during
+    the sweep wait in a second queue for the next one.
+
+    Time is counted in tracks moved (one unit per track, no transfer time).
+    Without arrival_times every request is present at time 0, so this is a
+    single SCAN.
+    """
+    requests = list(requests)
+    arrivals = [0] * len(requests) if arrival_times is None else list(arrival_times)
+    if len(arrivals) != len(requests):
+        raise ValueError("arrival_times must match requests")
+    order = sorted(range(len(requests)), key=arrivals.__getitem__)
     
-    return {
-        "sequence": sequence,
-        "total_movement": total_movement,
-        "direction": direction
-    }
\ No newline at end of file
+    sweeps = _Sweeps(head, direction, disk_size, instrument)
+    time = 0
+    i = 0
+    while i < len(order):
+        # An idle head waits for the next arrival
+        time = max(time, arrivals[order[i]])
+        j = i
+        while j < len(order) and arrivals[order[j]] <= time:
+            j += 1
+        time += sweeps.sweep([requests[k] for k in order[i:j]])
+        i = j
+    return sweeps.result(direction)
+
+ALGORITHMS = {
+    "LOOK": look_algorithm,
+    "C-LOOK": c_look_algorithm,
+    "SSTF": sstf_algorithm,
+    "SCAN": scan_algorithm,
+    "C-SCAN": c_scan_algorithm,
+    "N-step SCAN": n_step_scan_algorithm,
+    "FSCAN": fscan_algorithm
+}
+# Keyword options each algorithm takes besides requests, head and direction
+OPTIONS = {
+    "SCAN": ("disk_size",),
+    "C-SCAN": ("disk_size",),
+    "N-step SCAN": ("disk_size", "n"),
+    "FSCAN": ("disk_size", "arrival_times")
+}
+
+def run_algorithm(name, requests, head, direction="right", instrument=None, **options):
+    """Run ALGORITHMS[name], passing only the options it takes."""
+    options = {key: value for key, value in options.items() if key in OPTIONS.get(name, ())}
+    return ALGORITHMS[name](requests, head, direction, instrument=instrument, **options)
+
+def finish(result, instrument):
+    if instrument is not None:
+        result["stats"] = instrument.finish(result)
+    return result
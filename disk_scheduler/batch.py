@@ -0,0 +1,69 @@
+"""Vectorized (NumPy) LOOK and C-LOOK head movement.
+
+Each function sorts the requests once and returns the total head movement
+for every (head, direction) pair in one pass, using the same closed form as
+RequestIndex: every sweep is monotonic, so only the extremes on each side of
+the head matter.
+"""
+import numpy as np
+
+
+def _sides(requests, heads, right):
+    tracks = np.sort(np.asarray(requests, dtype=np.int64))
+    # Requests on the head's track go on the side the head is moving towards
+    split = np.where(right, np.searchsorted(tracks, heads, side="left"),
+                     np.searchsorted(tracks, heads, side="right"))
+    below = split > 0
+    above = split < len(tracks)
+    if len(tracks) == 0:
+        # Nothing to serve; the track values are never used
+        tracks = np.zeros(1, dtype=np.int64)
+    # Last request below the split and first one above it
+    nearest_below = tracks[np.maximum(split - 1, 0)]
+    nearest_above = tracks[np.minimum(split, len(tracks) - 1)]
+    return tracks[0], tracks[-1], nearest_below, nearest_above, below, above
+
+
+def _rightward(directions, shape):
+    directions = np.asarray(directions)
+    if directions.dtype.kind in "US":
+        directions = directions == "right"
+    return np.broadcast_to(directions.astype(bool), shape)
+
+
+def _path_length(heads, runs):
+    # runs: (first, last, present) arrays, visited in order
+    total = np.zeros(heads.shape, dtype=np.int64)
+    position = heads
+    for first, last, present in runs:
+        step = np.abs(first - position) + np.abs(last - first)
+        total += np.where(present, step, 0)
+        position = np.where(present, last, position)
+    return total
+
+
+def _movement(requests, heads, directions, circular):
+    heads = np.asarray(heads, dtype=np.int64)
+    right = _rightward(directions, heads.shape)
+    lowest, highest, nearest_below, nearest_above, below, above = _sides(requests, heads, right)
+    if circular:
+        right_runs = [(nearest_above, highest, above), (lowest, nearest_below, below)]
+        left_runs = [(nearest_below, lowest, below), (highest, nearest_above, above)]
+    else:
+        right_runs = [(nearest_above, highest, above), (nearest_below, lowest, below)]
+        left_runs = [(nearest_below, lowest, below), (nearest_above, highest, above)]
+    return np.where(right, _path_length(heads, right_runs), _path_length(heads, left_runs))
+
+
+def look_batch(requests, heads, directions="right"):
+    """Total LOOK head movement for each head position.
+
+    directions is "right"/"left", a boolean (True = right), or an array of
+    either that broadcasts against heads.
+    """
+    return _movement(requests, heads, directions, circular=False)
+
+
+def c_look_batch(requests, heads, directions="right"):
+    """Total C-LOOK head movement for each head position (see look_batch)."""
+    return _movement(requests, heads, directions, circular=True)
@@ -0,0 +1,147 @@
+"""Disk arrays: logical blocks striped or mirrored over simulated spindles.
+
+Each request is one logical block. map_requests turns a block stream into
+one (timestamps, tracks) stream per member disk, simulate_array runs
+simulate_disk on every member in a worker process and combines the results.
+
+RAID-0 stripes blocks over all disks in stripe_size-block chunks. RAID-1
+mirrors every block on all disks. RAID-10 stripes over mirrored pairs
+(disks 0-1, 2-3, ...). Writes go to every copy and finish when the slowest
+copy does; reads go to one copy, alternating between mirrors.
+"""
+from .simulation import simulate_disk, DiskModel, _distribution
+
+LEVELS = ("RAID-0", "RAID-1", "RAID-10")
+
+
+def check_layout(level, disks, stripe_size):
+    if level not in LEVELS:
+        raise ValueError(f"Unknown RAID level: {level}")
+    if stripe_size < 1:
+        raise ValueError("stripe_size must be at least 1")
+    if level == "RAID-0" and disks < 1:
+        raise ValueError("RAID-0 needs at least one disk")
+    if level == "RAID-1" and disks < 2:
+        raise ValueError("RAID-1 needs at least two disks")
+    if level == "RAID-10" and (disks < 4 or disks % 2):
+        raise ValueError("RAID-10 needs an even number of disks, at least four")
+
+
+def map_requests(timestamps, blocks, level="RAID-0", disks=4, stripe_size=16,
+                 blocks_per_track=64, disk_size=200, writes=None):
+    """Split logical block requests into per-disk streams.
+
+    Returns one (timestamps, tracks, requests) triple of lists per disk,
+    where requests[k] is the index of the logical request served by the
+    k-th entry. writes is an optional per-request flag; without it every
+    request is a read.
+    """
+    check_layout(level, disks, stripe_size)
+    if len(timestamps) != len(blocks):
+        raise ValueError("timestamps and blocks must have the same length")
+    capacity = disk_size * blocks_per_track
+    # Disks a stripe is spread over, and mirror copies of each
+    copies = {"RAID-0": 1, "RAID-1": disks, "RAID-10": 2}[level]
+    width = disks // copies
+    streams = [([], [], []) for _ in range(disks)]
+    for index, block in enumerate(blocks):
+        stripe, offset = divmod(block, stripe_size)
+        group, row = stripe % width, stripe // width
+        track = (row * stripe_size + offset) // blocks_per_track
+        if block < 0 or track >= disk_size:
+            raise ValueError(f"Block {block} is outside the array (capacity "
+                             f"{capacity * width} blocks)")
+        first = group * copies
+        if copies == 1:
+            members = (first,)
+        elif writes is not None and writes[index]:
+            members = range(first, first + copies)
+        else:
+            members = (first + index % copies,)
+        for disk in members:
+            disk_timestamps, disk_tracks, requests = streams[disk]
+            disk_timestamps.append(timestamps[index])
+            disk_tracks.append(track)
+            requests.append(index)
+    return streams
+
+
+def _simulate_member(timestamps, tracks, options):
+    return simulate_disk(timestamps, tracks, **options)
+
+
+def simulate_array(timestamps, blocks, level="RAID-0", disks=4, stripe_size=16,
+                   blocks_per_track=64, policy="LOOK", head=0, direction="right",
+                   model=None, writes=None, n=10, max_workers=None):
+    """Simulate an array of identical disks, each running its own policy.
+
+    Members are simulated in a process pool (inline with max_workers=1, which
+    also allows a model with an unpicklable seek_time). The result has the
+    array-level latency distribution, IOPS and makespan, a "disks" list of
+    per-member summaries and an "imbalance" dict: max/mean ratios of
+    requests and busy time across members (1.0 is perfectly even) and the
+    busiest disk.
+    """
+    model = model or DiskModel()
+    streams = map_requests(timestamps, blocks, level, disks, stripe_size, blocks_per_track,
+                           model.disk_size, writes)
+    options = {"policy": policy, "head": head, "direction": direction, "model": model, "n": n}
+
+    if max_workers == 1:
+        members = [_simulate_member(t, k, options) for t, k, _ in streams]
+    else:
+        # Imported here to keep the package import light
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_simulate_member, t, k, options) for t, k, _ in streams]
+            members = [future.result() for future in futures]
+
+    # A request is done when its last copy is
+    latencies = [0.0] * len(blocks)
+    for (_, _, requests), member in zip(streams, members):
+        for request, latency in zip(requests, member["latencies"]):
+            if latency > latencies[request]:
+                latencies[request] = latency
+
+    if len(blocks):
+        start = min(timestamps)
+        makespan = max(timestamps[i] + latencies[i] for i in range(len(blocks))) - start
+    else:
+        makespan = 0.0
+    summaries = []
+    for disk, member in enumerate(members):
+        summaries.append({
+            "disk": disk,
+            "requests": member["completed"],
+            "busy_time": member["busy_time"],
+            "utilization": member["busy_time"] / makespan if makespan > 0 else 0.0,
+            "iops": member["completed"] / (makespan / 1000) if makespan > 0 else 0.0,
+            "latency": member["latency"],
+            "total_movement": member["total_movement"],
+            "avg_queue_depth": member["avg_queue_depth"],
+            "max_queue_depth": member["max_queue_depth"]
+        })
+
+    return {
+        "level": level,
+        "policy": policy,
+        "completed": len(blocks),
+        "makespan": makespan,
+        "iops": len(blocks) / (makespan / 1000) if makespan > 0 else 0.0,
+        "latency": _distribution(latencies),
+        "latencies": latencies,
+        "disks": summaries,
+        "imbalance": imbalance(summaries)
+    }
+
+
+def imbalance(summaries):
+    """max/mean of requests and busy time over the members, and the busiest one."""
+    result = {}
+    for key in ("requests", "busy_time"):
+        values = [summary[key] for summary in summaries]
+        mean = sum(values) / len(values) if values else 0
+        result[key] = max(values) / mean if mean else 1.0
+    busiest = max(summaries, key=lambda summary: summary["busy_time"], default=None)
+    result["busiest"] = None if busiest is None else busiest["disk"]
+    return result
@@ -0,0 +1,264 @@
+"""Discrete-event simulation of one disk serving timestamped requests.
+
+Unlike the functions in algorithms.py, which order a fixed request set and
+count tracks, requests here arrive over time and the policy picks the next
+one from whatever is pending when the disk becomes free, so new requests
+join a sweep in progress (except under FSCAN and N-step SCAN, which freeze
+their batches). Requests on the head's track are taken first whichever way
+it is moving, so when everything arrives at once each policy serves the
+same sequence with the same movement as its function in algorithms.py
+(benchmarks/check_disk.py checks this). Service time is seek + rotational
+delay + transfer, from a DiskModel. All times are in milliseconds.
+
+The disk serves one request at a time, so the next event is always either
+the next arrival or the current completion and no event heap is needed.
+Pending requests are bucketed by track, so every pick is a bisect over the
+occupied tracks.
+"""
+import math
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+
+from process_scheduler.instrumentation import phase
+from process_scheduler.metrics import percentile
+
+POLICIES = ("FCFS", "SSTF", "LOOK", "C-LOOK", "SCAN", "C-SCAN", "N-step SCAN", "FSCAN")
+# Policies that sweep a frozen batch while new arrivals wait for the next one
+BATCHED = ("N-step SCAN", "FSCAN")
+
+
+class DiskModel:
+    """Service-time model of a drive.
+
+    The default seek curve is settle_time + (full_stroke - settle_time) *
+    sqrt(distance / (disk_size - 1)), the usual square-root shape of
+    short seeks; pass seek_time(distance) to use another. Without sector
+    positions the rotational delay is the average half rotation. With them
+    the platter angle is tracked and the delay is the exact wait for the
+    sector to come round after the seek.
+    """
+
+    def __init__(self, disk_size=200, rpm=7200, sectors_per_track=500, transfer_rate=150.0,
+                 request_size=4096, settle_time=1.0, full_stroke=15.0, seek_time=None):
+        if disk_size < 1 or rpm <= 0 or transfer_rate <= 0:
+            raise ValueError("disk_size, rpm and transfer_rate must be positive")
+        self.disk_size = disk_size
+        self.rotation_time = 60000 / rpm
+        self.sectors_per_track = sectors_per_track
+        self.transfer_rate = transfer_rate
+        self.request_size = request_size
+        self.settle_time = settle_time
+        self.full_stroke = full_stroke
+        if seek_time is not None:
+            self.seek_time = seek_time
+
+    def seek_time(self, distance):
+        if distance == 0:
+            return 0.0
+        span = max(self.disk_size - 1, 1)
+        return self.settle_time + (self.full_stroke - self.settle_time) * math.sqrt(distance / span)
+
+    def rotational_delay(self, time, sector=None):
+        if sector is None:
+            return self.rotation_time / 2
+        angle = (time / self.rotation_time) % 1.0
+        return ((sector / self.sectors_per_track - angle) % 1.0) * self.rotation_time
+
+    def transfer_time(self, size=None):
+        # transfer_rate is MB/s, i.e. 1000 bytes per millisecond per MB/s
+        return (self.request_size if size is None else size) / (self.transfer_rate * 1000)
+
+
+def _distribution(values):
+    values = sorted(values)
+    return {
+        "mean": sum(values) / len(values) if values else 0.0,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": values[-1] if values else 0
+    }
+
+
+def simulate_disk(timestamps, tracks, policy="LOOK", head=0, direction="right", model=None,
+                  sectors=None, sizes=None, n=10, instrument=None):
+    """Serve tracks[i] arriving at timestamps[i] and report latency and IOPS.
+
+    sectors and sizes are optional per-request sector positions and byte
+    counts for the rotation and transfer model. n is the N-step SCAN batch
+    size. The result has latency and wait distributions (mean, p50, p95,
+    p99, max), per-request "latencies" and "waits" in input order, the
+    service "order" as request indices, and "turns": edge stops made by SCAN
+    and C-SCAN.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown disk policy: {policy}")
+    if len(timestamps) != len(tracks):
+        raise ValueError("timestamps and tracks must have the same length")
+    if policy == "N-step SCAN" and n < 1:
+        raise ValueError("n must be at least 1")
+    model = model or DiskModel()
+    disk_size = model.disk_size
+    edge = disk_size - 1
+    if not 0 <= head <= edge or any(not 0 <= track <= edge for track in tracks):
+        raise ValueError(f"Head and requests must lie within tracks 0..{edge}")
+
+    count = len(tracks)
+    rightward = direction == "right"
+    latencies = array("d", bytes(8 * count))
+    waits = array("d", bytes(8 * count))
+    order = array("q")
+    turns = []
+
+    arrivals = sorted(range(count), key=timestamps.__getitem__)
+    # Pending requests: a FIFO deque of indices per track, plus the occupied
+    # tracks in sorted order, so a pick depends on disk_size, not on how deep
+    # the queue is. FCFS just uses one deque.
+    fifo = deque()
+    buckets = {}
+    occupied = []
+    # waiting: arrivals held back from the frozen batch (N-step SCAN, FSCAN)
+    waiting = deque()
+    busy = False
+    done_at = 0.0
+    serving = None
+    busy_time = 0.0
+    total_movement = 0
+    queued = 0
+    depth_area = 0.0
+    max_depth = 0
+    last_time = 0.0
+    first_arrival = None
+
+    def enqueue(index):
+        track = tracks[index]
+        bucket = buckets.get(track)
+        if bucket is None:
+            bucket = buckets[track] = deque()
+            insort(occupied, track)
+        bucket.append(index)
+
+    def take(position):
+        track = occupied[position]
+        bucket = buckets[track]
+        index = bucket.popleft()
+        if not bucket:
+            del buckets[track]
+            del occupied[position]
+        return track, index
+
+    def pick():
+        """Remove and return the next (track, index), or a turn as (edge, None)."""
+        nonlocal rightward
+        if policy == "FCFS":
+            index = fifo.popleft()
+            return tracks[index], index
+        if policy in BATCHED and not occupied:
+            for _ in range(len(waiting) if policy == "FSCAN" else min(n, len(waiting))):
+                enqueue(waiting.popleft())
+        above = bisect_left(occupied, head)
+        at_or_below = bisect_right(occupied, head) - 1
+        if policy == "SSTF":
+            if above == len(occupied):
+                return take(at_or_below)
+            if at_or_below < 0 or occupied[above] == head:
+                return take(above)
+            down, up = head - occupied[at_or_below], occupied[above] - head
+            # Ties go the way the head last moved, as in sstf_algorithm
+            rightward = up < down or (up == down and rightward)
+            return take(above if rightward else at_or_below)
+        ahead = above < len(occupied) if rightward else at_or_below >= 0
+        if ahead:
+            return take(above if rightward else at_or_below)
+        if policy == "LOOK":
+            rightward = not rightward
+            return take(above if rightward else at_or_below)
+        if policy == "C-LOOK":
+            # Jump to the far end and keep the direction
+            return take(0 if rightward else len(occupied) - 1)
+        # SCAN family: run on to the edge before turning back
+        far = edge if rightward else 0
+        if head != far:
+            return far, None
+        if policy == "C-SCAN":
+            return (0 if rightward else edge), None
+        rightward = not rightward
+        return pick()
+
+    def start(time):
+        nonlocal busy, done_at, serving, busy_time, total_movement, head, queued
+        track, index = pick()
+        distance = abs(track - head)
+        service = model.seek_time(distance)
+        if index is not None:
+            service += model.rotational_delay(time + service, None if sectors is None else sectors[index])
+            service += model.transfer_time(None if sizes is None else sizes[index])
+            waits[index] = time - timestamps[index]
+            order.append(index)
+            queued -= 1
+        else:
+            turns.append(track)
+        total_movement += distance
+        head = track
+        busy = True
+        done_at = time + service
+        serving = index
+        busy_time += service
+
+    time = 0.0
+    position = 0
+    with phase(instrument, "scheduling"):
+        while position < count or busy:
+            # An arrival at the same instant as a completion is queued first
+            if position < count and (not busy or timestamps[arrivals[position]] <= done_at):
+                index = arrivals[position]
+                position += 1
+                time = timestamps[index]
+                depth_area += queued * (time - last_time)
+                if first_arrival is None:
+                    first_arrival = time
+                if policy == "FCFS":
+                    fifo.append(index)
+                elif policy in BATCHED:
+                    waiting.append(index)
+                else:
+                    enqueue(index)
+                queued += 1
+                max_depth = max(max_depth, queued)
+                # Let every arrival at this instant queue before the disk picks
+                if position < count and timestamps[arrivals[position]] == time:
+                    last_time = time
+                    continue
+            else:
+                time = done_at
+                depth_area += queued * (time - last_time)
+                busy = False
+                if serving is not None:
+                    latencies[serving] = time - timestamps[serving]
+            last_time = time
+            if not busy and queued:
+                start(time)
+
+    with phase(instrument, "metrics"):
+        makespan = time - first_arrival if first_arrival is not None else 0.0
+        result = {
+            "policy": policy,
+            "completed": len(order),
+            "makespan": makespan,
+            "iops": len(order) / (makespan / 1000) if makespan > 0 else 0.0,
+            "busy_time": busy_time,
+            "utilization": busy_time / makespan if makespan > 0 else 0.0,
+            "latency": _distribution(latencies),
+            "wait": _distribution(waits),
+            "total_movement": total_movement,
+            "avg_queue_depth": depth_area / makespan if makespan > 0 else 0.0,
+            "max_queue_depth": max_depth,
+            "latencies": latencies,
+            "waits": waits,
+            "order": order,
+            "turns": turns
+        }
+    if instrument is not None:
+        result["stats"] = instrument.finish(result)
+    return result
@@ -1,12 +1,23 @@
+import queue
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
-from .algorithms import look_algorithm, c_look_algorithm
-from .visualization import plot_disk_movement
+from tkinter import ttk, messagebox, filedialog
+from process_scheduler.instrumentation import Instrumentation, format_stats
+from workload import load_disk_trace
+from .algorithms import ALGORITHMS, run_algorithm
+
+# Longest service sequence printed in full in the results box
+MAX_SEQUENCE_SHOWN = 1000
+# Milliseconds between checks on a running worker
+POLL_MS = 50
 
 class DiskSchedulerTab:
     def __init__(self, parent):
         self.frame = ttk.Frame(parent)
         self.frame.config(padding=20)
+        self.trace = None
+        self.worker = None
+        self.messages = queue.Queue()
         
         # Header
         header = tk.Frame(self.frame, bg="#4a6fa5")
@@ -26,6 +37,11 @@ class DiskSchedulerTab:
         self.requests_entry.grid(row=0, column=1, pady=5)
         self.requests_entry.insert(0, "98, 183, 37, 122, 14, 124, 65, 67")
         
+        trace_frame = tk.Frame(input_frame)
+        trace_frame.grid(row=0, column=2, sticky="w", padx=5)
+        ttk.Button(trace_frame, text="Load Trace", command=self.load_trace).pack(side="left")
+        ttk.Button(trace_frame, text="Clear Trace", command=self.clear_trace).pack(side="left", padx=5)
+        
         # Head Position
         tk.Label(input_frame, text="Initial Head Position:").grid(row=1, column=0, sticky="e", padx=5)
         self.head_entry = ttk.Entry(input_frame, width=10)
@@ -33,19 +49,42 @@ class DiskSchedulerTab:
         self.head_entry.insert(0, "53")
         
         # Algorithm Selection
-        tk.Label(input_frame, text="Algorithm:").grid(row=2, column=0, sticky="e", padx=5)
+        tk.Label(input_frame, text="Algorithm:").grid(row=2, column=0, sticky="ne", padx=5)
         self.algorithm_var = tk.StringVar(value="LOOK")
-        ttk.Radiobutton(input_frame, text="LOOK", variable=self.algorithm_var, value="LOOK").grid(row=2, column=1, sticky="w")
-        ttk.Radiobutton(input_frame, text="C-LOOK", variable=self.algorithm_var, value="C-LOOK").grid(row=3, column=1, sticky="w")
+        algo_frame = tk.Frame(input_frame)
+        algo_frame.grid(row=2, column=1, sticky="w")
+        for i, name in enumerate(ALGORITHMS):
+            ttk.Radiobutton(algo_frame, text=name, variable=self.algorithm_var,
+                          value=name).grid(row=i // 4, column=i % 4, sticky="w", padx=(0, 10))
         
-        # Direction (for LOOK)
+        # Direction (initial sweep direction; SSTF uses it to break ties)
         tk.Label(input_frame, text="Initial Direction:").grid(row=4, column=0, sticky="e", padx=5)
         self.direction_var = tk.StringVar(value="right")
         ttk.Combobox(input_frame, textvariable=self.direction_var, 
                     values=["right", "left"], width=7).grid(row=4, column=1, sticky="w")
         
+        # Disk size (SCAN family) and batch size (N-step SCAN)
+        tk.Label(input_frame, text="Disk Size (tracks):").grid(row=5, column=0, sticky="e", padx=5)
+        self.disk_size_entry = ttk.Entry(input_frame, width=10)
+        self.disk_size_entry.grid(row=5, column=1, sticky="w", pady=5)
+        self.disk_size_entry.insert(0, "200")
+        
+        tk.Label(input_frame, text="N (N-step SCAN):").grid(row=6, column=0, sticky="e", padx=5)
+        self.n_entry = ttk.Entry(input_frame, width=10)
+        self.n_entry.grid(row=6, column=1, sticky="w", pady=5)
+        self.n_entry.insert(0, "10")
+        
         # Run Button
-        ttk.Button(self.frame, text="Run Disk Scheduling", command=self.run_scheduler).pack(pady=20)
+        run_frame = tk.Frame(self.frame)
+        run_frame.pack(pady=20)
+        self.run_btn = ttk.Button(run_frame, text="Run Disk Scheduling", command=self.run_scheduler)
+        self.run_btn.pack(side="left", padx=5)
+        self.count_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(run_frame, text="Count operations",
+                       variable=self.count_var).pack(side="left", padx=5)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(run_frame, text="Profile",
+                       variable=self.profile_var).pack(side="left", padx=5)
         
         # Results Frame
         results_frame = tk.LabelFrame(self.frame, text="Results",
@@ -59,28 +98,100 @@ class DiskSchedulerTab:
         
         scrollbar.pack(side="right", fill="y")
         self.results_text.pack(fill="both", expand=True)
+        
+        # Status Bar
+        self.status_var = tk.StringVar(value="Ready")
+        ttk.Label(self.frame, textvariable=self.status_var, relief="sunken",
+                anchor="w").pack(fill="x", pady=(10, 0))
     
+    def load_trace(self):
+        path = filedialog.askopenfilename(
+            title="Load disk request trace",
+            filetypes=[("Trace files", "*.csv *.bin *.trace"), ("All files", "*")])
+        if not path:
+            return
+        try:
+            self.trace = load_disk_trace(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Trace Error", f"Could not load trace: {e}")
+            return
+        self.requests_entry.config(state="normal")
+        self.requests_entry.delete(0, tk.END)
+        self.requests_entry.insert(0, f"<{len(self.trace)} requests from trace>")
+        self.requests_entry.config(state="disabled")
+
+    def clear_trace(self):
+        self.trace = None
+        self.requests_entry.config(state="normal")
+        self.requests_entry.delete(0, tk.END)
+
     def run_scheduler(self):
+        if self.worker is not None:
+            return
         try:
-            requests = [int(r.strip()) for r in self.requests_entry.get().split(",")]
-            head = int(self.head_entry.get())
-            
-            if self.algorithm_var.get() == "LOOK":
-                result = look_algorithm(requests, head, self.direction_var.get())
+            options = {"disk_size": int(self.disk_size_entry.get()), "n": int(self.n_entry.get())}
+            if self.trace is not None:
+                requests = self.trace["track"].tolist()
+                # FSCAN queues requests by their timestamps
+                options["arrival_times"] = self.trace["timestamp"].tolist()
             else:
-                result = c_look_algorithm(requests, head, self.direction_var.get())
-            
-            # Update results
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, f"Algorithm: {self.algorithm_var.get()}\n")
-            self.results_text.insert(tk.END, f"Initial Head Position: {head}\n")
-            if 'direction' in result:
-                self.results_text.insert(tk.END, f"Direction: {result['direction'].capitalize()}\n")
-            self.results_text.insert(tk.END, f"\nService Sequence:\n{result['sequence']}\n")
-            self.results_text.insert(tk.END, f"\nTotal Head Movement: {result['total_movement']} tracks")
-            
-            # Show visualization
-            plot_disk_movement(head, result)
-            
+                requests = [int(r.strip()) for r in self.requests_entry.get().split(",")]
+            head = int(self.head_entry.get())
         except ValueError:
-            messagebox.showerror("Input Error", "Please enter valid numbers!")
\ No newline at end of file
+            messagebox.showerror("Input Error", "Please enter valid numbers!")
+            return
+        algorithm = self.algorithm_var.get()
+        direction = self.direction_var.get()
+        instrument = Instrumentation(count=self.count_var.get(), profile=self.profile_var.get())
+        
+        self.messages = queue.Queue()
+        self.worker = threading.Thread(target=self.work,
+                                       args=(algorithm, requests, head, direction, options, instrument),
+                                       daemon=True)
+        self.run_btn.config(state="disabled")
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, f"Running {algorithm} on {len(requests)} requests...")
+        self.status_var.set(f"Running {algorithm}...")
+        self.worker.start()
+        self.frame.after(POLL_MS, self.poll_worker, algorithm, head)
+
+    def work(self, algorithm, requests, head, direction, options, instrument):
+        # Runs on the worker thread: only talk to Tk through self.messages
+        try:
+            result = run_algorithm(algorithm, requests, head, direction, instrument, **options)
+            self.messages.put(("done", result))
+        except Exception as e:
+            self.messages.put(("error", e))
+
+    def poll_worker(self, algorithm, head):
+        try:
+            kind, payload = self.messages.get_nowait()
+        except queue.Empty:
+            self.frame.after(POLL_MS, self.poll_worker, algorithm, head)
+            return
+        self.worker = None
+        self.run_btn.config(state="normal")
+        self.results_text.delete(1.0, tk.END)
+        if kind == "error":
+            messagebox.showerror("Error", f"Disk scheduling failed: {payload}")
+            self.status_var.set("Error during disk scheduling")
+            return
+        result = payload
+        
+        # Update results
+        self.results_text.insert(tk.END, f"Algorithm: {algorithm}\n")
+        self.results_text.insert(tk.END, f"Initial Head Position: {head}\n")
+        if 'direction' in result:
+            self.results_text.insert(tk.END, f"Direction: {result['direction'].capitalize()}\n")
+        sequence = result['sequence']
+        if len(sequence) > MAX_SEQUENCE_SHOWN:
+            sequence = f"{sequence[:MAX_SEQUENCE_SHOWN]} ... ({len(result['sequence'])} requests)"
+        self.results_text.insert(tk.END, f"\nService Sequence:\n{sequence}\n")
+        self.results_text.insert(tk.END, f"\nTotal Head Movement: {result['total_movement']} tracks")
+        if "profile" in result["stats"]:
+            self.results_text.insert(tk.END, f"\n\nProfile:\n{result['stats']['profile']}")
+        self.status_var.set(f"{algorithm} completed | {format_stats(result['stats'])}")
+        
+        # Show visualization (matplotlib is only imported on first use)
+        from .visualization import plot_disk_movement
+        plot_disk_movement(head, result, algorithm)
\ No newline at end of file
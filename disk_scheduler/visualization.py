@@ -2,8 +2,12 @@ import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
 import numpy as np
 
-def plot_disk_movement(initial_head, result):
-    sequence = [initial_head] + result["sequence"]
+# Label at most this many points; large traces would be unreadable anyway
+MAX_ANNOTATIONS = 200
+
+def plot_disk_movement(initial_head, result, algorithm=None):
+    # SCAN-style results include the disk edges the head turned at
+    sequence = [initial_head] + result.get("path", result["sequence"])
     x = range(len(sequence))
     y = sequence
     
@@ -19,6 +23,8 @@ def plot_disk_movement(initial_head, result):
     
     ax.scatter(x, y, c='red', zorder=2)
     for i, (xi, yi) in enumerate(zip(x, y)):
+        if i >= MAX_ANNOTATIONS:
+            break
         if i == 0:
             ax.annotate(f'Start: {yi}', (xi, yi), textcoords="offset points", xytext=(0,10), ha='center')
         else:
@@ -26,7 +32,7 @@ def plot_disk_movement(initial_head, result):
     
     ax.set_xlim(-0.5, len(sequence)-0.5)
     ax.set_ylim(min(y)-10, max(y)+10)
-    ax.set_title(f"Disk Head Movement ({'LOOK' if 'direction' in result else 'C-LOOK'})")
+    ax.set_title(f"Disk Head Movement ({algorithm})" if algorithm else "Disk Head Movement")
     ax.set_xlabel("Step")
     ax.set_ylabel("Track Number")
     ax.grid(True)
@@ -1,9 +1,49 @@
+import importlib
+
 from .scheduler import (
     fcfs_scheduling,
     round_robin_scheduling,
     sjf_scheduling,
     priority_scheduling,
-    srtf_scheduling
+    srtf_scheduling,
+    cfs_scheduling,
+    mlfq_scheduling,
+    SchedulingCancelled
 )
-from .visualization import plot_schedule
-from .tab import ProcessSchedulerTab
\ No newline at end of file
+from .models import Process, Schedule
+from .instrumentation import Instrumentation
+from .metrics import compute_metrics, MetricsAggregator
+from .smp import smp_scheduling
+from .incremental import IncrementalScheduler
+from .streaming import (
+    RunningMetrics,
+    fcfs_stream,
+    round_robin_stream,
+    sjf_stream,
+    srtf_stream,
+    priority_stream,
+    cfs_stream,
+    mlfq_stream
+)
+
+# Names backed by NumPy, matplotlib or tkinter, imported on first access
+_LAZY = {
+    "fcfs_batch": ".batch",
+    "sjf_batch": ".batch",
+    "priority_batch": ".batch",
+    "ProcessTableModel": ".table",
+    "plot_schedule": ".visualization",
+    "export_schedule": ".visualization",
+    "ProcessSchedulerTab": ".tab"
+}
+
+def __getattr__(name):
+    # Resolved on first access so importing the package stays headless
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
\ No newline at end of file
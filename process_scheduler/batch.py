@@ -0,0 +1,89 @@
+"""Columnar (NumPy) variants of the non-preemptive schedulers.
+
+Each function takes parallel arrays of process attributes and returns the
+schedule as arrays in execution order, so no per-process dicts are created.
+"""
+import heapq
+
+import numpy as np
+
+from .models import Schedule
+from .scheduler import ALGORITHM_COMPLEXITY
+
+
+def _run_in_order(process_ids, arrival_times, burst_times, order, algorithm):
+    arrival = np.asarray(arrival_times, dtype=np.int64)[order]
+    burst = np.asarray(burst_times, dtype=np.int64)[order]
+
+    # end[k] = max(0, max over j <= k of (arrival[j] - busy[j-1])) + busy[k],
+    # where busy is the running sum of bursts in execution order.
+    busy = np.cumsum(burst)
+    offset = np.maximum.accumulate(arrival - (busy - burst))
+    end_time = busy + np.maximum(offset, 0)
+    start_time = end_time - burst
+
+    return {
+        "process_id": np.asarray(process_ids)[order],
+        "start_time": start_time,
+        "end_time": end_time,
+        "waiting_times": start_time - arrival,
+        "turnaround_times": end_time - arrival,
+        "complexity": ALGORITHM_COMPLEXITY[algorithm]
+    }
+
+
+def _ready_queue_order(arrival_times, burst_times, keys):
+    """Execution order of the arrival-aware non-preemptive engine.
+
+    Only the order is decided here (heap over ready processes); the start and
+    end times are then filled in by the vectorized scan.
+    """
+    by_arrival = np.argsort(arrival_times, kind="stable").tolist()
+    arrival = np.asarray(arrival_times).tolist()
+    burst = np.asarray(burst_times).tolist()
+    keys = np.asarray(keys).tolist()
+
+    n = len(by_arrival)
+    order = []
+    ready = []
+    i = 0
+    time = 0
+    while len(order) < n:
+        if not ready and arrival[by_arrival[i]] > time:
+            time = arrival[by_arrival[i]]
+        while i < n and arrival[by_arrival[i]] <= time:
+            j = by_arrival[i]
+            heapq.heappush(ready, (keys[j], i, j))
+            i += 1
+        _, _, j = heapq.heappop(ready)
+        order.append(j)
+        time += burst[j]
+    return np.array(order, dtype=np.int64)
+
+
+def fcfs_batch(process_ids, arrival_times, burst_times):
+    order = np.argsort(arrival_times, kind="stable")
+    return _run_in_order(process_ids, arrival_times, burst_times, order, "FCFS")
+
+
+def sjf_batch(process_ids, arrival_times, burst_times):
+    order = _ready_queue_order(arrival_times, burst_times, burst_times)
+    return _run_in_order(process_ids, arrival_times, burst_times, order, "SJF")
+
+
+def priority_batch(process_ids, arrival_times, burst_times, priorities):
+    order = _ready_queue_order(arrival_times, burst_times, priorities)
+    return _run_in_order(process_ids, arrival_times, burst_times, order, "Priority")
+
+
+def as_result(batch):
+    """Convert a batch result to the dict-based result shape used by plot_schedule."""
+    columns = [np.ascontiguousarray(batch[name], dtype=np.int64)
+               for name in ("process_id", "start_time", "end_time")]
+    process_ids = columns[0].tolist()
+    return {
+        "schedule": Schedule.from_arrays(*columns),
+        "waiting_times": dict(zip(process_ids, batch["waiting_times"].tolist())),
+        "turnaround_times": dict(zip(process_ids, batch["turnaround_times"].tolist())),
+        "complexity": batch["complexity"]
+    }
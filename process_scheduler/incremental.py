@@ -0,0 +1,203 @@
+"""Incremental re-scheduling after edits to the workload.
+
+An IncrementalScheduler keeps the processes sorted by arrival, the schedule
+of the last run and the engine checkpoints recorded while producing it. The
+schedule up to any time t depends only on the processes arriving by t, so
+adding or removing a process that arrives at T keeps every slice up to the
+last checkpoint taken before T and re-simulates only from there. FCFS needs
+no snapshots: its only state is the end of the previous slice, so it
+restarts exactly at the first process arriving at T.
+
+The metrics are kept up to date the same way: the discarded slices are
+taken back out of a MetricsAggregator and the new ones added, and only the
+processes they ran are refreshed in the result. An edit therefore costs time
+in proportion to the re-simulated part, not to the whole workload.
+"""
+import bisect
+from functools import partial
+from itertools import chain
+
+from .instrumentation import counters_of, phase
+from .metrics import MetricsAggregator
+from .models import Schedule, as_processes
+from .scheduler import (
+    build_result,
+    collect,
+    fcfs_slices,
+    round_robin_slices,
+    ready_queue_slices,
+    shortest_burst,
+    highest_priority,
+    shortest_remaining,
+    _cfs_slices,
+    _mlfq_slices,
+    _merged
+)
+
+# algorithm -> params -> engine taking (arrivals, resume=, checkpoints=)
+ENGINES = {
+    "SJF": lambda params: partial(ready_queue_slices, key=shortest_burst),
+    "Priority": lambda params: partial(ready_queue_slices, key=highest_priority),
+    "Preemptive Priority": lambda params: partial(ready_queue_slices, key=highest_priority,
+                                                  preemptive=True),
+    "SRTF": lambda params: partial(ready_queue_slices, key=shortest_remaining, preemptive=True),
+    "Round Robin": lambda params: partial(round_robin_slices,
+                                          time_quantum=params.get("time_quantum", 2)),
+    "CFS": lambda params: partial(_cfs_slices,
+                                  target_latency=params.get("target_latency", 20),
+                                  min_granularity=params.get("min_granularity", 4)),
+    "MLFQ": lambda params: partial(_mlfq_slices,
+                                   quanta=tuple(params.get("quanta", (2, 4, 8))),
+                                   boost_interval=params.get("boost_interval", 100))
+}
+# Engines whose back-to-back slices of one process are joined in results
+MERGED = ("CFS", "MLFQ")
+
+
+class IncrementalScheduler:
+    """Single-CPU schedule that is updated, not recomputed, when processes change.
+
+    params are the algorithm's keyword arguments (time_quantum, target_latency,
+    min_granularity, quanta, boost_interval). add, remove and update return
+    the same result dict as the matching *_scheduling function, plus
+    "incremental": {"reused": slices kept, "recomputed": slices simulated}.
+    With an instrument, the queue counters cover only the re-simulated part.
+    The schedule and the per-process metric dicts of a result are updated in
+    place by later edits; copy them to keep a snapshot.
+    """
+
+    def __init__(self, algorithm="FCFS", processes=(), progress=None, instrument=None, **params):
+        if algorithm != "FCFS" and algorithm not in ENGINES:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.params = params
+        self.engine = None if algorithm == "FCFS" else ENGINES[algorithm](params)
+        self.processes = sorted(as_processes(processes), key=lambda x: x.arrival_time)
+        self.arrival_times = [p.arrival_time for p in self.processes]
+        self.slices = Schedule()
+        # CFS and MLFQ results show self.slices with back-to-back slices joined
+        self.merged = Schedule()
+        # (slices_yielded, time, state) engine snapshots, ordered by time
+        self.checkpoints = []
+        self.metrics = MetricsAggregator(self.processes)
+        self.metric_values = None
+        self.last_result = self.reschedule(None, progress=progress, instrument=instrument)
+
+    def add(self, process, progress=None, instrument=None):
+        return self.update(added=[process], progress=progress, instrument=instrument)
+
+    def remove(self, process_id, progress=None, instrument=None):
+        return self.update(removed=[process_id], progress=progress, instrument=instrument)
+
+    def update(self, added=(), removed=(), progress=None, instrument=None):
+        """Apply several edits and re-simulate once from the earliest one.
+
+        Removals are applied before additions and unknown ids are ignored.
+        If progress raises SchedulingCancelled the previous state is kept.
+        """
+        known = self.metrics.arrival_times
+        removed = {pid for pid in removed if pid in known}
+        added = as_processes(added)
+        times = [known[pid] for pid in removed] + [p.arrival_time for p in added]
+        if not times:
+            return self.last_result
+        self.last_result = self.reschedule(min(times), removed, added, progress, instrument)
+        return self.last_result
+
+    def reschedule(self, edit_time, removed=(), added=(), progress=None, instrument=None):
+        """Re-simulate from the last checkpoint before edit_time (None: from scratch).
+
+        Every removed or added process arrives at edit_time or later, so the
+        processes and slices before the resume point are the same before and
+        after the edit; nothing is changed until the engine has finished.
+        """
+        checkpoints = []
+        if edit_time is None:
+            kept, consumed, resume = 0, 0, None
+        elif self.engine is None:
+            # FCFS emits one slice per process in arrival order
+            kept = consumed = bisect.bisect_left(self.arrival_times, edit_time)
+            resume = self.slices.end_times[kept - 1] if kept else 0
+        else:
+            times = [time for _, time, _ in self.checkpoints]
+            checkpoints = self.checkpoints[:bisect.bisect_left(times, edit_time)]
+            resume = checkpoints[-1] if checkpoints else None
+            kept = resume[0] if resume else 0
+            consumed = bisect.bisect_right(self.arrival_times, resume[1]) if resume else 0
+
+        arrivals = [p for p in self.processes[consumed:] if p.process_id not in removed]
+        if added:
+            arrival_times = [p.arrival_time for p in arrivals]
+            for process in added:
+                index = bisect.bisect_right(arrival_times, process.arrival_time)
+                arrivals.insert(index, process)
+                arrival_times.insert(index, process.arrival_time)
+        counters = counters_of(instrument)
+        if self.engine is None:
+            slices = fcfs_slices(iter(arrivals), resume or 0, counters)
+        else:
+            slices = self.engine(iter(arrivals), resume=resume, checkpoints=checkpoints,
+                                 counters=counters)
+        suffix = collect(slices, arrivals, progress, instrument)
+
+        self.processes[consumed:] = arrivals
+        self.arrival_times[consumed:] = [p.arrival_time for p in arrivals]
+        self.checkpoints = checkpoints
+        discarded = self.slices[kept:]
+        for column, values in zip((self.slices.process_ids, self.slices.start_times,
+                                   self.slices.end_times),
+                                  (suffix.process_ids, suffix.start_times, suffix.end_times)):
+            del column[kept:]
+            column.extend(values)
+
+        with phase(instrument, "metrics"):
+            self._update_metrics(kept, discarded, suffix, removed, added)
+            schedule = self.slices
+            if self.algorithm in MERGED:
+                self._update_merged(kept, suffix)
+                schedule = self.merged
+        result = build_result(schedule, self.processes, self.algorithm, instrument,
+                              metrics=self.metric_values)
+        result["incremental"] = {"reused": kept, "recomputed": len(suffix)}
+        return result
+
+    def _update_metrics(self, kept, discarded, suffix, removed, added):
+        metrics = self.metrics
+        if self.metric_values is None:
+            for pid, start, end in suffix:
+                metrics.add(pid, start, end)
+            self.metric_values = metrics.result()
+            return
+        changed = metrics.rewind(discarded, self.slices.process_ids[kept - 1] if kept else None)
+        for pid in removed:
+            del metrics.arrival_times[pid]
+        for process in added:
+            metrics.arrival_times[process.process_id] = process.arrival_time
+        for pid, start, end in suffix:
+            metrics.add(pid, start, end)
+        changed.update(suffix.process_ids)
+        changed.update(removed)
+        changed.update(p.process_id for p in added)
+        # The first process to arrive is almost always scheduled, and the
+        # slices are in time order
+        first_arrival = next((p.arrival_time for p in self.processes if p.process_id in metrics.stats),
+                             None)
+        last_end = self.slices.end_times[-1] if self.slices else None
+        metrics.update_result(self.metric_values, changed, first_arrival, last_end)
+
+    def _update_merged(self, kept, suffix):
+        merged = self.merged
+        count = 0
+        tail = []
+        if kept:
+            # The merged slice holding slice kept - 1 now ends with it and may
+            # join the first new slice
+            count = bisect.bisect_right(merged.start_times, self.slices.start_times[kept - 1]) - 1
+            tail = [(merged.process_ids[count], merged.start_times[count],
+                     self.slices.end_times[kept - 1])]
+        for column in (merged.process_ids, merged.start_times, merged.end_times):
+            del column[count:]
+        merged.extend(_merged(chain(tail, suffix)))
+
+    def result(self):
+        return self.last_result
@@ -0,0 +1,206 @@
+"""Per-run operation counters, phase timers and profiling hooks.
+
+Schedulers take an optional instrument=Instrumentation(...) argument. Without
+one they run their plain code paths; with one they count queue operations,
+time each phase and add a "stats" dict to their result:
+
+    {"counters": {"queue_pushes": ..., "queue_pops": ..., "comparisons": ...,
+                  "iterations": ..., "slices": ..., "context_switches": ...},
+     "phases": {"scheduling": {"wall": seconds, "cpu": seconds},
+                "metrics": {"wall": seconds, "cpu": seconds}},
+     "profile": "<cProfile report>"}      # only with profile=True
+
+comparisons counts ordering comparisons between queued entries (heap sifts,
+sorting and the single-CPU preemption check), not bookkeeping such as
+arrival-time checks.
+"""
+import heapq
+import time
+from collections import Counter, deque
+from contextlib import contextmanager, nullcontext
+from functools import cmp_to_key
+
+# Lines of the cProfile report kept in stats["profile"]
+PROFILE_LINES = 25
+
+
+class Instrumentation:
+    """Collects counters and phase timings for one scheduling run.
+
+    count=False keeps only the phase timers, so the schedulers run their
+    uninstrumented code. hook(event, data) is called with ("phase",
+    {"name", "wall", "cpu"}) as each phase ends and ("finish", stats) once
+    the result is complete. profile=True runs cProfile during the phases.
+    """
+
+    def __init__(self, count=True, profile=False, hook=None):
+        self.counters = Counter() if count else None
+        self.phases = {}
+        self.hook = hook
+        self.profiler = None
+        if profile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+
+    @contextmanager
+    def phase(self, name):
+        wall, cpu = time.perf_counter(), time.process_time()
+        if self.profiler is not None:
+            self.profiler.enable()
+        try:
+            yield
+        finally:
+            if self.profiler is not None:
+                self.profiler.disable()
+            timing = self.phases.setdefault(name, {"wall": 0.0, "cpu": 0.0})
+            timing["wall"] += time.perf_counter() - wall
+            timing["cpu"] += time.process_time() - cpu
+            if self.hook is not None:
+                self.hook("phase", {"name": name, **timing})
+
+    def finish(self, result):
+        """Fill the counters derived from a result and return the stats dict."""
+        if self.counters is not None:
+            if "schedule" in result:
+                self.counters["slices"] = len(result["schedule"])
+            if "context_switches" in result:
+                self.counters["context_switches"] = result["context_switches"]
+            if "sequence" in result:
+                self.counters["requests"] = len(result["sequence"])
+        stats = {
+            "counters": dict(self.counters or {}),
+            "phases": {name: dict(timing) for name, timing in self.phases.items()}
+        }
+        if self.profiler is not None:
+            stats["profile"] = self.profile_report()
+        if self.hook is not None:
+            self.hook("finish", stats)
+        return stats
+
+    def profile_report(self, limit=PROFILE_LINES):
+        import io
+        import pstats
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+        return out.getvalue()
+
+
+# Counters shown by format_stats, in order
+SUMMARY_COUNTERS = ("iterations", "queue_pushes", "queue_pops", "comparisons")
+
+
+def format_stats(stats):
+    """One-line summary of a stats dict for a status bar."""
+    parts = [f"{name.capitalize()} {timing['wall'] * 1000:.1f} ms"
+             for name, timing in stats["phases"].items()]
+    counters = stats["counters"]
+    parts += [f"{name.replace('_', ' ').capitalize()}: {counters[name]:,}"
+              for name in SUMMARY_COUNTERS if name in counters]
+    return " | ".join(parts)
+
+
+def phase(instrument, name):
+    """instrument.phase(name), or a no-op context without an instrument."""
+    return nullcontext() if instrument is None else instrument.phase(name)
+
+
+def counters_of(instrument):
+    return None if instrument is None else instrument.counters
+
+
+def sort(items, counters=None, reverse=False):
+    """items.sort(), counting comparisons when counters is given."""
+    if counters is None:
+        items.sort(reverse=reverse)
+        return
+
+    def compare(a, b):
+        counters["comparisons"] += 1
+        return (a > b) - (a < b)
+
+    items.sort(key=cmp_to_key(compare), reverse=reverse)
+
+
+def heap_ops(counters):
+    """(heappush, heappop) for a ready-queue heap.
+
+    Without counters these are heapq's C functions. With counters they are
+    Python versions of the same sift algorithm, so the heap evolves exactly
+    as it would uninstrumented, but every push, pop and comparison is counted.
+    """
+    if counters is None:
+        return heapq.heappush, heapq.heappop
+
+    def sift_down(heap, start, pos):
+        item = heap[pos]
+        while pos > start:
+            parent_pos = (pos - 1) >> 1
+            parent = heap[parent_pos]
+            counters["comparisons"] += 1
+            if item < parent:
+                heap[pos] = parent
+                pos = parent_pos
+                continue
+            break
+        heap[pos] = item
+
+    def sift_up(heap, pos):
+        end = len(heap)
+        start = pos
+        item = heap[pos]
+        child = 2 * pos + 1
+        while child < end:
+            right = child + 1
+            if right < end:
+                counters["comparisons"] += 1
+                if not heap[child] < heap[right]:
+                    child = right
+            heap[pos] = heap[child]
+            pos = child
+            child = 2 * pos + 1
+        heap[pos] = item
+        sift_down(heap, start, pos)
+
+    def push(heap, item):
+        counters["queue_pushes"] += 1
+        heap.append(item)
+        sift_down(heap, 0, len(heap) - 1)
+
+    def pop(heap):
+        counters["queue_pops"] += 1
+        last = heap.pop()
+        if heap:
+            item = heap[0]
+            heap[0] = last
+            sift_up(heap, 0)
+            return item
+        return last
+
+    return push, pop
+
+
+class CountingDeque(deque):
+    """deque that counts appends as queue pushes and poplefts as pops."""
+
+    def __init__(self, iterable=(), counters=None):
+        super().__init__(iterable)
+        self.counters = counters
+
+    def append(self, item):
+        self.counters["queue_pushes"] += 1
+        super().append(item)
+
+    def appendleft(self, item):
+        self.counters["queue_pushes"] += 1
+        super().appendleft(item)
+
+    def popleft(self):
+        self.counters["queue_pops"] += 1
+        return super().popleft()
+
+
+def queue_factory(counters):
+    """deque, or a CountingDeque bound to counters."""
+    if counters is None:
+        return deque
+    return lambda iterable=(): CountingDeque(iterable, counters)
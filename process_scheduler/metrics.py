@@ -0,0 +1,136 @@
+from .models import as_process
+
+
+class MetricsAggregator:
+    """Collects per-process metrics in a single pass over schedule slices.
+
+    Slices can be fed in as the scheduler produces them; per-process state is
+    just the first start, last end and executed time, so nothing is re-scanned.
+    """
+
+    def __init__(self, processes):
+        self.arrival_times = {}
+        for process in processes:
+            process = as_process(process)
+            self.arrival_times[process.process_id] = process.arrival_time
+        self.stats = {}
+        self.busy_time = 0
+        self.context_switches = 0
+        self.last_pid = None
+
+    def add(self, pid, start, end):
+        stats = self.stats.get(pid)
+        if stats is None:
+            self.stats[pid] = [start, end, end - start]
+        else:
+            if end > stats[1]:
+                stats[1] = end
+            stats[2] += end - start
+
+        self.busy_time += end - start
+        if self.last_pid is not None and pid != self.last_pid:
+            self.context_switches += 1
+        self.last_pid = pid
+
+    def rewind(self, slices, last_pid):
+        """Take back slices, the last ones added, returning the ids they ran.
+
+        last_pid is the process of the slice before them. A process with
+        slices on both sides of the cut has its end time restored only by
+        the next add, so it must run again (as when re-simulating from an
+        engine checkpoint).
+        """
+        first_starts = {}
+        previous = last_pid
+        for pid, start, end in slices:
+            self.stats[pid][2] -= end - start
+            first_starts.setdefault(pid, start)
+            self.busy_time -= end - start
+            if previous is not None and pid != previous:
+                self.context_switches -= 1
+            previous = pid
+        for pid, start in first_starts.items():
+            stats = self.stats[pid]
+            if stats[0] == start:
+                del self.stats[pid]
+            else:
+                stats[1] = stats[0]
+        self.last_pid = last_pid
+        return set(first_starts)
+
+    def result(self):
+        waiting_times = {}
+        turnaround_times = {}
+        response_times = {}
+        first_arrival = None
+        last_end = None
+
+        for pid, arrival in self.arrival_times.items():
+            stats = self.stats.get(pid)
+            if stats is None:
+                waiting_times[pid] = 0
+                continue
+            first_start, end, executed = stats
+            turnaround_times[pid] = end - arrival
+            waiting_times[pid] = end - arrival - executed
+            response_times[pid] = first_start - arrival
+
+            if first_arrival is None or arrival < first_arrival:
+                first_arrival = arrival
+            if last_end is None or end > last_end:
+                last_end = end
+
+        span = last_end - first_arrival if turnaround_times else 0
+        return {
+            "waiting_times": waiting_times,
+            "turnaround_times": turnaround_times,
+            "response_times": response_times,
+            "context_switches": self.context_switches,
+            "cpu_utilization": self.busy_time / span if span > 0 else 0.0,
+            "throughput": len(turnaround_times) / span if span > 0 else 0.0
+        }
+
+    def update_result(self, result, pids, first_arrival, last_end):
+        """Bring a result() dict up to date after the slices or arrivals of pids changed.
+
+        first_arrival and last_end bound the scheduled span, which result()
+        finds by scanning every process.
+        """
+        waiting_times = result["waiting_times"]
+        turnaround_times = result["turnaround_times"]
+        response_times = result["response_times"]
+        for pid in pids:
+            arrival = self.arrival_times.get(pid)
+            stats = self.stats.get(pid)
+            if stats is None or arrival is None:
+                turnaround_times.pop(pid, None)
+                response_times.pop(pid, None)
+                if arrival is None:
+                    waiting_times.pop(pid, None)
+                else:
+                    waiting_times[pid] = 0
+                continue
+            first_start, end, executed = stats
+            turnaround_times[pid] = end - arrival
+            waiting_times[pid] = end - arrival - executed
+            response_times[pid] = first_start - arrival
+
+        span = last_end - first_arrival if turnaround_times else 0
+        result["context_switches"] = self.context_switches
+        result["cpu_utilization"] = self.busy_time / span if span > 0 else 0.0
+        result["throughput"] = len(turnaround_times) / span if span > 0 else 0.0
+
+
+def compute_metrics(schedule, processes):
+    aggregator = MetricsAggregator(processes)
+    for pid, start, end in schedule:
+        aggregator.add(pid, start, end)
+    return aggregator.result()
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
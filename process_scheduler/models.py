@@ -0,0 +1,125 @@
+from array import array
+
+
+class Process:
+    """A process to be scheduled. Slotted so large workloads stay compact."""
+
+    __slots__ = ("process_id", "arrival_time", "burst_time", "priority")
+
+    def __init__(self, process_id, arrival_time, burst_time, priority=0):
+        self.process_id = process_id
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+
+    def __repr__(self):
+        return (f"Process(process_id={self.process_id}, arrival_time={self.arrival_time}, "
+                f"burst_time={self.burst_time}, priority={self.priority})")
+
+    def __eq__(self, other):
+        if not isinstance(other, Process):
+            return NotImplemented
+        return (self.process_id, self.arrival_time, self.burst_time, self.priority) == \
+               (other.process_id, other.arrival_time, other.burst_time, other.priority)
+
+    def to_dict(self):
+        return {
+            "process_id": self.process_id,
+            "arrival_time": self.arrival_time,
+            "burst_time": self.burst_time,
+            "priority": self.priority
+        }
+
+
+def as_process(process):
+    if isinstance(process, Process):
+        return process
+    return Process(process["process_id"], process["arrival_time"],
+                   process["burst_time"], process.get("priority", 0))
+
+
+def as_processes(processes):
+    return [as_process(p) for p in processes]
+
+
+def processes_from_records(records):
+    """Process objects from (pid, arrival, burst, priority) records such as a loaded trace."""
+    return [Process(*row) for row in records.tolist()]
+
+
+class Schedule:
+    """Schedule slices stored as parallel array('q') columns.
+
+    Iterating yields (process_id, start_time, end_time) tuples and slicing
+    returns another Schedule, so no per-slice dicts are ever created.
+    """
+
+    __slots__ = ("process_ids", "start_times", "end_times")
+
+    def __init__(self, process_ids=(), start_times=(), end_times=()):
+        self.process_ids = array("q", process_ids)
+        self.start_times = array("q", start_times)
+        self.end_times = array("q", end_times)
+
+    @classmethod
+    def from_arrays(cls, process_ids, start_times, end_times):
+        """Build from contiguous int64 buffers (e.g. NumPy arrays) without per-row copies."""
+        schedule = cls()
+        schedule.process_ids.frombytes(memoryview(process_ids).cast("B"))
+        schedule.start_times.frombytes(memoryview(start_times).cast("B"))
+        schedule.end_times.frombytes(memoryview(end_times).cast("B"))
+        return schedule
+
+    def append(self, process_id, start_time, end_time):
+        self.process_ids.append(process_id)
+        self.start_times.append(start_time)
+        self.end_times.append(end_time)
+
+    def extend(self, slices):
+        append_pid = self.process_ids.append
+        append_start = self.start_times.append
+        append_end = self.end_times.append
+        for pid, start, end in slices:
+            append_pid(pid)
+            append_start(start)
+            append_end(end)
+
+    def __len__(self):
+        return len(self.process_ids)
+
+    def __iter__(self):
+        return zip(self.process_ids, self.start_times, self.end_times)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Schedule(self.process_ids[index], self.start_times[index], self.end_times[index])
+        return (self.process_ids[index], self.start_times[index], self.end_times[index])
+
+    def __eq__(self, other):
+        if not isinstance(other, Schedule):
+            return NotImplemented
+        return (self.process_ids == other.process_ids and
+                self.start_times == other.start_times and
+                self.end_times == other.end_times)
+
+    def __repr__(self):
+        return f"Schedule({len(self)} slices)"
+
+    def to_dicts(self):
+        return [{"process_id": pid, "start_time": start, "end_time": end}
+                for pid, start, end in self]
+
+    def write_csv(self, file):
+        file.write("process_id,start_time,end_time\n")
+        for pid, start, end in self:
+            file.write(f"{pid},{start},{end}\n")
+
+    def tobytes(self):
+        return self.process_ids.tobytes() + self.start_times.tobytes() + self.end_times.tobytes()
+
+    @classmethod
+    def frombytes(cls, data):
+        columns = array("q")
+        columns.frombytes(data)
+        n = len(columns) // 3
+        return cls(columns[:n], columns[n:2 * n], columns[2 * n:])
@@ -1,3 +1,9 @@
+from functools import partial
+
+from .instrumentation import counters_of, heap_ops, phase, queue_factory
+from .metrics import compute_metrics
+from .models import Schedule, as_processes
+
 ALGORITHM_COMPLEXITY = {
     "FCFS": {
         "time": {
@@ -10,9 +16,9 @@ ALGORITHM_COMPLEXITY = {
     },
     "Round Robin": {
         "time": {
-            "best": "O(n) [large quantum]",
-            "average": "O(n log n)",
-            "worst": "O(n²) [small quantum]"
+            "best": "O(n log n) [large quantum]",
+            "average": "O(n log n + s) [s = slices]",
+            "worst": "O(n log n + s) [small quantum]"
         },
         "space": "O(n)",
         "description": "Fair but high context switching overhead"
@@ -20,8 +26,8 @@ ALGORITHM_COMPLEXITY = {
     "SJF": {
         "time": {
             "best": "O(n log n)",
-            "average": "O(n²)",
-            "worst": "O(n²)"
+            "average": "O(n log n)",
+            "worst": "O(n log n)"
         },
         "space": "O(n)",
         "description": "Optimal for minimizing waiting time"
@@ -35,226 +41,477 @@ ALGORITHM_COMPLEXITY = {
         "space": "O(n)",
         "description": "Can lead to starvation of low-priority processes"
     },
+    "Preemptive Priority": {
+        "time": {
+            "best": "O(n log n)",
+            "average": "O(n log n)",
+            "worst": "O(n log n)"
+        },
+        "space": "O(n)",
+        "description": "Higher-priority arrivals preempt the running process"
+    },
     "SRTF": {
         "time": {
             "best": "O(n log n)",
-            "average": "O(n²)",
-            "worst": "O(n²)"
+            "average": "O(n log n)",
+            "worst": "O(n log n)"
         },
         "space": "O(n)",
         "description": "Preemptive SJF - optimal but complex"
+    },
+    "CFS": {
+        "time": {
+            "best": "O(n log n)",
+            "average": "O((n + s) log n) [s = slices]",
+            "worst": "O((n + s) log n) [s = slices]"
+        },
+        "space": "O(n)",
+        "description": "Weighted fair share by virtual runtime, as in Linux"
+    },
+    "MLFQ": {
+        "time": {
+            "best": "O(n log n)",
+            "average": "O(n log n + s) [s = slices]",
+            "worst": "O(n log n + s) [s = slices]"
+        },
+        "space": "O(n)",
+        "description": "Favours short and interactive jobs without knowing burst times"
     }
 }
 
-def calculate_waiting_time(schedule, processes):
-    waiting_times = {}
-    original_processes = {p["process_id"]: p for p in processes}
-    
-    for pid, process in original_processes.items():
-        waiting_time = 0
-        last_time = process["arrival_time"]
-        
-        executions = sorted([e for e in schedule if e["process_id"] == pid], 
-                          key=lambda x: x["start_time"])
-        
-        for exec in executions:
-            if exec["start_time"] > last_time:
-                waiting_time += exec["start_time"] - last_time
-            last_time = max(last_time, exec["end_time"])
-        
-        waiting_times[pid] = waiting_time
-    
-    return waiting_times
+def build_result(schedule, processes, algorithm, instrument=None, metrics=None):
+    # metrics: the compute_metrics dict, when the caller has kept it up to date
+    with phase(instrument, "metrics"):
+        result = {"schedule": schedule}
+        result.update(compute_metrics(schedule, processes) if metrics is None else metrics)
+        result["complexity"] = ALGORITHM_COMPLEXITY[algorithm]
+    if instrument is not None:
+        result["stats"] = instrument.finish(result)
+    return result
 
-def calculate_turnaround_time(schedule, processes):
-    turnaround_times = {}
-    original_processes = {p["process_id"]: p for p in processes}
-    
-    for pid, process in original_processes.items():
-        executions = [e for e in schedule if e["process_id"] == pid]
-        if not executions:
-            continue
-        last_execution = max(executions, key=lambda x: x["end_time"])
-        turnaround_times[pid] = last_execution["end_time"] - process["arrival_time"]
+def by_arrival(processes):
+    return iter(sorted(processes, key=lambda x: x.arrival_time))
+
+# Slices between progress callbacks
+PROGRESS_INTERVAL = 4096
+
+class SchedulingCancelled(Exception):
+    """Raised from a progress callback to stop a run early."""
+
+def collect(slices, processes, progress=None, instrument=None):
+    """Gather slices into a Schedule.
+
+    If given, progress(done, total) is called every PROGRESS_INTERVAL slices
+    and once at the end, with the CPU time scheduled so far and the total
+    burst time. It may raise SchedulingCancelled to abandon the run. The
+    engines run lazily, so this is the instrument's "scheduling" phase.
+    """
+    with phase(instrument, "scheduling"):
+        return _collect(slices, processes, progress)
+
+def _collect(slices, processes, progress):
+    schedule = Schedule()
+    if progress is None:
+        schedule.extend(slices)
+        return schedule
     
-    return turnaround_times
+    total = sum(p.burst_time for p in processes)
+    done = 0
+    append = schedule.append
+    for count, (pid, start, end) in enumerate(slices, 1):
+        append(pid, start, end)
+        done += end - start
+        if count % PROGRESS_INTERVAL == 0:
+            progress(done, total)
+    progress(done, total)
+    return schedule
 
-def fcfs_scheduling(processes):
-    processes_sorted = sorted(processes, key=lambda x: x['arrival_time'])
-    time = 0
-    schedule = []
-
-    for process in processes_sorted:
-        start_time = max(time, process["arrival_time"])
-        end_time = start_time + process["burst_time"]
-        schedule.append({
-            "process_id": process["process_id"],
-            "start_time": start_time,
-            "end_time": end_time
-        })
+# The *_slices generators below are the scheduling engines. They pull
+# processes lazily from an iterator ordered by arrival time and yield
+# (process_id, start_time, end_time) slices as soon as each one is final.
+#
+# The preemptive engines can also snapshot themselves for incremental.py:
+# given a checkpoints list they append (slices_yielded, time, state) at
+# points where every arrival up to time has been pulled and no later one,
+# and resume=<one of those tuples> continues from it with the arrivals after
+# time. Snapshots are spaced so copying the ready queue stays O(1) per slice.
+#
+# counters (see instrumentation.py) switches the engines to counting queue
+# operations; loop iterations are counted at the top of each main loop.
+CHECKPOINT_INTERVAL = 256
+
+def checkpoint_due(count, last, queued):
+    return count - last >= max(CHECKPOINT_INTERVAL, queued)
+
+def fcfs_slices(arrivals, time=0, counters=None):
+    for process in arrivals:
+        if counters is not None:
+            counters["iterations"] += 1
+        start_time = max(time, process.arrival_time)
+        end_time = start_time + process.burst_time
+        yield (process.process_id, start_time, end_time)
         time = end_time
 
-    return {
-        "schedule": schedule,
-        "waiting_times": calculate_waiting_time(schedule, processes),
-        "turnaround_times": calculate_turnaround_time(schedule, processes),
-        "complexity": ALGORITHM_COMPLEXITY["FCFS"]
-    }
+def fcfs_scheduling(processes, progress=None, instrument=None):
+    processes = as_processes(processes)
+    slices = fcfs_slices(by_arrival(processes), counters=counters_of(instrument))
+    schedule = collect(slices, processes, progress, instrument)
+    return build_result(schedule, processes, "FCFS", instrument)
 
     
-def round_robin_scheduling(processes, time_quantum=2):
-    if not processes:
-        return {"schedule": [], "waiting_times": {}, "turnaround_times": {}, "complexity": ALGORITHM_COMPLEXITY["Round Robin"]}
-    
-    remaining_processes = [p.copy() for p in processes]
-    remaining_processes.sort(key=lambda x: x['arrival_time'])
+def round_robin_slices(arrivals, time_quantum=2, resume=None, checkpoints=None, counters=None):
+    if time_quantum < 1:
+        raise ValueError("time_quantum must be at least 1")
+    arrivals = iter(arrivals)
+    upcoming = next(arrivals, None)
     
-    time = 0
-    schedule = []
-    queue = []
+    # Queue entries are (process, remaining_time) so the inputs are never copied
+    make_queue = queue_factory(counters)
+    count, time, queue = 0, 0, make_queue()
+    if resume is not None:
+        count, time, state = resume
+        queue = make_queue(state)
+    last_checkpoint = count
     
-    while remaining_processes or queue:
-        while remaining_processes and remaining_processes[0]['arrival_time'] <= time:
-            queue.append(remaining_processes.pop(0))
+    while upcoming is not None or queue:
+        if counters is not None:
+            counters["iterations"] += 1
+        while upcoming is not None and upcoming.arrival_time <= time:
+            queue.append((upcoming, upcoming.burst_time))
+            upcoming = next(arrivals, None)
+        if checkpoints is not None and checkpoint_due(count, last_checkpoint, len(queue)):
+            checkpoints.append((count, time, list(queue)))
+            last_checkpoint = count
         
         if not queue:
-            time = remaining_processes[0]['arrival_time']
+            time = upcoming.arrival_time
             continue
             
-        process = queue.pop(0)
+        process, remaining = queue.popleft()
         start_time = time
-        executed_time = min(time_quantum, process["burst_time"])
+        executed_time = min(time_quantum, remaining)
         end_time = start_time + executed_time
         
-        schedule.append({
-            "process_id": process["process_id"],
-            "start_time": start_time,
-            "end_time": end_time
-        })
+        yield (process.process_id, start_time, end_time)
+        count += 1
         
-        process["burst_time"] -= executed_time
+        remaining -= executed_time
         time = end_time
         
-        while remaining_processes and remaining_processes[0]['arrival_time'] <= time:
-            queue.append(remaining_processes.pop(0))
+        while upcoming is not None and upcoming.arrival_time <= time:
+            queue.append((upcoming, upcoming.burst_time))
+            upcoming = next(arrivals, None)
         
-        if process["burst_time"] > 0:
-            queue.append(process)
-    
-    return {
-        "schedule": schedule,
-        "waiting_times": calculate_waiting_time(schedule, processes),
-        "turnaround_times": calculate_turnaround_time(schedule, processes),
-        "complexity": ALGORITHM_COMPLEXITY["Round Robin"]
-    }
+        if remaining > 0:
+            queue.append((process, remaining))
 
+def round_robin_scheduling(processes, time_quantum=2, progress=None, instrument=None):
+    processes = as_processes(processes)
+    slices = round_robin_slices(by_arrival(processes), time_quantum, counters=counters_of(instrument))
+    schedule = collect(slices, processes, progress, instrument)
+    return build_result(schedule, processes, "Round Robin", instrument)
 
-def sjf_scheduling(processes, preemptive=False):
-    if not processes:
-        return {"schedule": [], "waiting_times": {}, "turnaround_times": {}}
-    
-    if preemptive:
-        return srtf_scheduling(processes)
+
+def ready_queue_slices(arrivals, key, preemptive=False, resume=None, checkpoints=None, counters=None):
+    """Shared engine for SJF, Priority and SRTF.
+
+    Processes are moved into a heap keyed by key(process, remaining_time) as
+    the clock passes their arrival, and the CPU always runs the best ready
+    process. With preemptive=True an arrival with a strictly better key
+    preempts the running process.
+    """
+    arrivals = iter(arrivals)
+    upcoming = next(arrivals, None)
+    push, pop = heap_ops(counters)
     
-    processes_sorted = sorted(processes, key=lambda x: (x['burst_time'], x['arrival_time']))
+    # Ready queue entries are (key, seq, remaining_time, process); seq keeps
+    # ties in the order processes entered the queue.
+    ready = []
+    seq = 0
+    count = 0
     time = 0
-    schedule = []
-    
-    for process in processes_sorted:
-        start_time = max(time, process["arrival_time"])
-        end_time = start_time + process["burst_time"]
-        schedule.append({
-            "process_id": process["process_id"],
-            "start_time": start_time,
-            "end_time": end_time
-        })
-        time = end_time
+    current = None
+    current_remaining = 0
+    current_start = 0
+    if resume is not None:
+        count, time, (ready, seq, current, current_remaining, current_start) = resume
+        ready = ready[:]
+    last_checkpoint = count
     
-    return {
-        "schedule": schedule,
-        "waiting_times": calculate_waiting_time(schedule, processes),
-        "turnaround_times": calculate_turnaround_time(schedule, processes),
-        "complexity": ALGORITHM_COMPLEXITY["SJF"]
+    while upcoming is not None or ready or current is not None:
+        if counters is not None:
+            counters["iterations"] += 1
+        if checkpoints is not None and checkpoint_due(count, last_checkpoint, len(ready)):
+            checkpoints.append((count, time, (ready[:], seq, current, current_remaining, current_start)))
+            last_checkpoint = count
+        if current is not None:
+            finish = time + current_remaining
+            if not preemptive or upcoming is None or finish <= upcoming.arrival_time:
+                # Run the current process to completion
+                yield (current.process_id, current_start, finish)
+                count += 1
+                time = finish
+                current = None
+            else:
+                current_remaining -= upcoming.arrival_time - time
+                time = upcoming.arrival_time
+        elif not ready:
+            # CPU idle: jump straight to the next arrival
+            time = max(time, upcoming.arrival_time)
+        
+        while upcoming is not None and upcoming.arrival_time <= time:
+            new_process = upcoming
+            upcoming = next(arrivals, None)
+            new_key = key(new_process, new_process.burst_time)
+            push(ready, (new_key, seq, new_process.burst_time, new_process))
+            seq += 1
+            if current is None or not preemptive:
+                continue
+            if counters is not None:
+                counters["comparisons"] += 1
+            if new_key < key(current, current_remaining):
+                yield (current.process_id, current_start, time)
+                count += 1
+                push(ready, (key(current, current_remaining), seq, current_remaining, current))
+                seq += 1
+                current = None
+        
+        if current is None and ready:
+            _, _, current_remaining, current = pop(ready)
+            current_start = time
 
-    }
 
-def priority_scheduling(processes):
-    processes_sorted = sorted(processes, key=lambda x: (x['priority'], x['arrival_time']))
-    time = 0
-    schedule = []
-    
-    for process in processes_sorted:
-        start_time = max(time, process["arrival_time"])
-        end_time = start_time + process["burst_time"]
-        schedule.append({
-            "process_id": process["process_id"],
-            "start_time": start_time,
-            "end_time": end_time
-        })
-        time = end_time
+def shortest_burst(process, remaining):
+    return process.burst_time
+
+def highest_priority(process, remaining):
+    return process.priority
+
+def shortest_remaining(process, remaining):
+    return remaining
+
+
+def sjf_scheduling(processes, preemptive=False, progress=None, instrument=None):
+    if preemptive:
+        return srtf_scheduling(processes, progress, instrument)
     
-    return {
-        "schedule": schedule,
-        "waiting_times": calculate_waiting_time(schedule, processes),
-        "turnaround_times": calculate_turnaround_time(schedule, processes),
-        "complexity": ALGORITHM_COMPLEXITY["Priority"]
-    }
+    processes = as_processes(processes)
+    slices = ready_queue_slices(by_arrival(processes), shortest_burst, counters=counters_of(instrument))
+    schedule = collect(slices, processes, progress, instrument)
+    return build_result(schedule, processes, "SJF", instrument)
 
-def srtf_scheduling(processes):
+def priority_scheduling(processes, preemptive=False, progress=None, instrument=None):
+    processes = as_processes(processes)
+    slices = ready_queue_slices(by_arrival(processes), highest_priority, preemptive,
+                                counters=counters_of(instrument))
+    schedule = collect(slices, processes, progress, instrument)
+    return build_result(schedule, processes, "Preemptive Priority" if preemptive else "Priority", instrument)
+
+def srtf_scheduling(processes, progress=None, instrument=None):
     """Shortest Remaining Time First (preemptive SJF)"""
-    if not processes:
-        return {"schedule": [], "waiting_times": {}, "turnaround_times": {}}
-    
-    remaining_processes = [p.copy() for p in processes]
-    remaining_processes.sort(key=lambda x: x['arrival_time'])
+    processes = as_processes(processes)
+    slices = ready_queue_slices(by_arrival(processes), shortest_remaining, preemptive=True,
+                                counters=counters_of(instrument))
+    schedule = collect(slices, processes, progress, instrument)
+    return build_result(schedule, processes, "SRTF", instrument)
+
+
+# Linux sched_prio_to_weight: load weight for nice -20 .. 19
+NICE_TO_WEIGHT = [
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15
+]
+NICE_0_WEIGHT = 1024
+
+def nice_weight(priority):
+    return NICE_TO_WEIGHT[min(max(priority, -20), 19) + 20]
+
+def _merged(slices):
+    """Join back-to-back slices of the same process."""
+    last = None
+    for pid, start, end in slices:
+        if last is not None and last[0] == pid and last[2] == start:
+            last = (pid, last[1], end)
+            continue
+        if last is not None:
+            yield last
+        last = (pid, start, end)
+    if last is not None:
+        yield last
+
+def _cfs_slices(arrivals, target_latency, min_granularity, resume=None, checkpoints=None, counters=None):
+    arrivals = iter(arrivals)
+    upcoming = next(arrivals, None)
+    push, pop = heap_ops(counters)
     
+    # Run queue ordered by virtual runtime: (vruntime, seq, remaining, process, weight)
+    ready = []
+    seq = 0
+    count = 0
     time = 0
-    schedule = []
-    current_process = None
-    queue = []
+    min_vruntime = 0
+    total_weight = 0
+    if resume is not None:
+        count, time, (ready, seq, min_vruntime, total_weight) = resume
+        ready = ready[:]
+    last_checkpoint = count
     
-    while remaining_processes or queue or current_process:
-        while remaining_processes and remaining_processes[0]['arrival_time'] <= time:
-            new_process = remaining_processes.pop(0)
-            queue.append(new_process)
-            if current_process and new_process['burst_time'] < current_process['burst_time']:
-                if schedule and schedule[-1]["process_id"] == current_process["process_id"]:
-                    schedule[-1]["end_time"] = time
-                queue.append(current_process)
-                current_process = None
+    while upcoming is not None or ready:
+        if counters is not None:
+            counters["iterations"] += 1
+        while upcoming is not None and upcoming.arrival_time <= time:
+            weight = nice_weight(upcoming.priority)
+            push(ready, (min_vruntime, seq, upcoming.burst_time, upcoming, weight))
+            seq += 1
+            total_weight += weight
+            upcoming = next(arrivals, None)
+        if checkpoints is not None and checkpoint_due(count, last_checkpoint, len(ready)):
+            checkpoints.append((count, time, (ready[:], seq, min_vruntime, total_weight)))
+            last_checkpoint = count
         
-        if not current_process and queue:
-            queue.sort(key=lambda x: x['burst_time'])
-            current_process = queue.pop(0)
-            schedule.append({
-                "process_id": current_process["process_id"],
-                "start_time": time,
-                "end_time": time
-            })
+        if not ready:
+            time = upcoming.arrival_time
+            continue
         
-        if current_process:
-            current_process['burst_time'] -= 1
-            time += 1
-            schedule[-1]["end_time"] = time
-            
-            if current_process['burst_time'] == 0:
-                current_process = None
+        vruntime, _, remaining, process, weight = pop(ready)
+        period = max(target_latency, (len(ready) + 1) * min_granularity)
+        timeslice = max(1, -(-period * weight // total_weight))
+        ran = min(timeslice, remaining)
+        yield (process.process_id, time, time + ran)
+        count += 1
         
-        elif remaining_processes:
-            time = remaining_processes[0]['arrival_time']
-    
-    # Merge adjacent intervals for same process
-    merged_schedule = []
-    for event in schedule:
-        if merged_schedule and merged_schedule[-1]["process_id"] == event["process_id"] and \
-           merged_schedule[-1]["end_time"] == event["start_time"]:
-            merged_schedule[-1]["end_time"] = event["end_time"]
+        time += ran
+        remaining -= ran
+        vruntime += ran * NICE_0_WEIGHT / weight
+        if remaining > 0:
+            push(ready, (vruntime, seq, remaining, process, weight))
+            seq += 1
         else:
-            merged_schedule.append(event)
+            total_weight -= weight
+        if ready:
+            min_vruntime = max(min_vruntime, ready[0][0])
+
+def cfs_slices(arrivals, target_latency=20, min_granularity=4, counters=None):
+    """Completely Fair Scheduler model.
+
+    Each process accrues virtual runtime scaled by the load weight of its
+    priority, used as a nice value (-20..19). The process with the smallest
+    vruntime runs next, for its weighted share of the scheduling period
+    max(target_latency, runnable * min_granularity). New arrivals start at the
+    queue's minimum vruntime and are considered at the next slice boundary.
+    """
+    return _merged(_cfs_slices(arrivals, target_latency, min_granularity, counters=counters))
+
+def cfs_scheduling(processes, target_latency=20, min_granularity=4, progress=None, instrument=None):
+    processes = as_processes(processes)
+    slices = cfs_slices(by_arrival(processes), target_latency, min_granularity, counters_of(instrument))
+    schedule = collect(slices, processes, progress, instrument)
+    return build_result(schedule, processes, "CFS", instrument)
+
+
+def check_mlfq(quanta, boost_interval):
+    if not quanta:
+        raise ValueError("MLFQ needs at least one level")
+    if any(quantum < 1 for quantum in quanta):
+        raise ValueError("MLFQ quanta must all be at least 1")
+    if boost_interval < 0:
+        raise ValueError("boost_interval must not be negative")
+
+def _mlfq_slices(arrivals, quanta, boost_interval, resume=None, checkpoints=None, counters=None):
+    check_mlfq(quanta, boost_interval)
+    arrivals = iter(arrivals)
+    upcoming = next(arrivals, None)
+    make_queue = queue_factory(counters)
     
-    return {
-        "schedule": merged_schedule,
-        "waiting_times": calculate_waiting_time(merged_schedule, processes),
-        "turnaround_times": calculate_turnaround_time(merged_schedule, processes),
-        "complexity": ALGORITHM_COMPLEXITY["SRTF"]
-    }
\ No newline at end of file
+    # Jobs are [process, remaining_time, level, time_used_at_level]
+    queues = [make_queue() for _ in quanta]
+    lowest = len(quanta) - 1
+    count = 0
+    time = 0
+    next_boost = boost_interval
+    if resume is not None:
+        count, time, (saved, next_boost) = resume
+        queues = [make_queue(list(job) for job in queue) for queue in saved]
+    last_checkpoint = count
+    
+    while upcoming is not None or any(queues):
+        if counters is not None:
+            counters["iterations"] += 1
+        while upcoming is not None and upcoming.arrival_time <= time:
+            queues[0].append([upcoming, upcoming.burst_time, 0, 0])
+            upcoming = next(arrivals, None)
+        if checkpoints is not None and checkpoint_due(count, last_checkpoint, sum(map(len, queues))):
+            checkpoints.append((count, time, ([[list(job) for job in queue] for queue in queues], next_boost)))
+            last_checkpoint = count
+        
+        if boost_interval and time >= next_boost:
+            # Priority boost: move every job back to the top level
+            for queue in queues[1:]:
+                while queue:
+                    job = queue.popleft()
+                    job[2] = job[3] = 0
+                    queues[0].append(job)
+            next_boost += ((time - next_boost) // boost_interval + 1) * boost_interval
+        
+        level = next((i for i, queue in enumerate(queues) if queue), None)
+        if level is None:
+            time = upcoming.arrival_time
+            continue
+        
+        job = queues[level].popleft()
+        ran = min(quanta[level] - job[3], job[1])
+        if level > 0 and upcoming is not None:
+            # A new arrival enters the top level and preempts this job
+            ran = min(ran, upcoming.arrival_time - time)
+        if boost_interval:
+            ran = min(ran, next_boost - time)
+        yield (job[0].process_id, time, time + ran)
+        count += 1
+        
+        time += ran
+        job[1] -= ran
+        job[3] += ran
+        if job[1] == 0:
+            continue
+        if job[3] >= quanta[level]:
+            # Used its whole allotment: demote
+            job[2] = min(level + 1, lowest)
+            job[3] = 0
+            queues[job[2]].append(job)
+        else:
+            queues[level].appendleft(job)
+
+def mlfq_slices(arrivals, quanta=(2, 4, 8), boost_interval=100, counters=None):
+    """Multi-Level Feedback Queue.
+
+    New jobs enter the top level. A job that uses its level's whole quantum
+    moves down one level, and the lowest level is round robin. Higher levels
+    always run first, and an arrival preempts a job running below the top
+    level. Every boost_interval time units all jobs return to the top level
+    (0 disables boosting).
+    """
+    check_mlfq(quanta, boost_interval)
+    return _merged(_mlfq_slices(arrivals, quanta, boost_interval, counters=counters))
+
+def mlfq_scheduling(processes, quanta=(2, 4, 8), boost_interval=100, progress=None, instrument=None):
+    processes = as_processes(processes)
+    slices = mlfq_slices(by_arrival(processes), quanta, boost_interval, counters_of(instrument))
+    schedule = collect(slices, processes, progress, instrument)
+    return build_result(schedule, processes, "MLFQ", instrument)
+
+ALGORITHMS = {
+    "FCFS": fcfs_scheduling,
+    "SJF": sjf_scheduling,
+    "Priority": priority_scheduling,
+    "Preemptive Priority": partial(priority_scheduling, preemptive=True),
+    "Round Robin": round_robin_scheduling,
+    "SRTF": srtf_scheduling,
+    "CFS": cfs_scheduling,
+    "MLFQ": mlfq_scheduling
+}
@@ -0,0 +1,234 @@
+"""Multi-core (SMP) scheduling simulation.
+
+Every single-CPU algorithm is modelled as a ready-queue policy (a key for the
+queue, whether arrivals preempt, and an optional quantum). Cores either share
+one global run queue or own per-CPU queues:
+
+- "global": one shared queue; any idle core takes the best ready process.
+- "balanced": per-CPU queues; arrivals are placed on the least-loaded core,
+  and a core dispatching from a queue more than one shorter than the longest
+  (or from an empty one) first moves the best process of the longest queue
+  over to its own.
+- "stealing": per-CPU queues filled round-robin; an idle core with an empty
+  queue steals the best process from the longest queue.
+
+Preempted and quantum-expired processes go back to the queue of the core they
+ran on, so migrations only happen through rebalancing or stealing. While every
+core is busy, each arrival is checked for preemption as it is queued, so a
+displaced process queues behind the arrival that displaced it but ahead of
+later arrivals at the same instant; on one CPU this matches the single-CPU
+algorithms exactly.
+"""
+from .instrumentation import counters_of, heap_ops, phase
+from .models import Schedule, as_processes
+from .scheduler import (
+    PROGRESS_INTERVAL,
+    build_result,
+    by_arrival,
+    shortest_burst,
+    highest_priority,
+    shortest_remaining
+)
+
+
+def first_come(process, remaining):
+    return 0
+
+# algorithm -> (ready-queue key, preemptive)
+POLICIES = {
+    "FCFS": (first_come, False),
+    "SJF": (shortest_burst, False),
+    "Priority": (highest_priority, False),
+    "Preemptive Priority": (highest_priority, True),
+    "Round Robin": (first_come, False),
+    "SRTF": (shortest_remaining, True)
+}
+
+QUEUE_MODES = ("global", "balanced", "stealing")
+
+
+def smp_scheduling(processes, algorithm="FCFS", num_cpus=2, queue_mode="global", time_quantum=2,
+                   progress=None, instrument=None):
+    if algorithm not in POLICIES:
+        raise ValueError(f"Algorithm not supported on multiple CPUs: {algorithm}")
+    if queue_mode not in QUEUE_MODES:
+        raise ValueError(f"Unknown queue mode: {queue_mode}")
+    if num_cpus < 1:
+        raise ValueError("num_cpus must be at least 1")
+
+    key, preemptive = POLICIES[algorithm]
+    quantum = time_quantum if algorithm == "Round Robin" else None
+    shared = queue_mode == "global"
+
+    counters = counters_of(instrument)
+    push, pop = heap_ops(counters)
+
+    processes = as_processes(processes)
+    total_burst = sum(p.burst_time for p in processes)
+    arrivals = by_arrival(processes)
+    upcoming = next(arrivals, None)
+
+    cpus = range(num_cpus)
+    # Queue entries are (key, seq, remaining_time, process)
+    queues = [[]] if shared else [[] for _ in cpus]
+    # running[cpu] is [process, remaining_at_start, start_time, stop_time]
+    running = [None] * num_cpus
+    schedule = Schedule()
+    core_schedules = [Schedule() for _ in cpus]
+    busy_time = [0] * num_cpus
+    context_switches = [0] * num_cpus
+    last_pid = [None] * num_cpus
+    last_cpu = {}
+    migrations = 0
+    seq = 0
+    placement = 0
+
+    def enqueue(process, remaining, cpu=None):
+        nonlocal seq, placement
+        if shared:
+            cpu = 0
+        elif cpu is not None:
+            pass
+        elif queue_mode == "balanced":
+            cpu = min(cpus, key=lambda c: len(queues[c]) + (running[c] is not None))
+        else:
+            cpu = placement % num_cpus
+            placement += 1
+        push(queues[cpu], (key(process, remaining), seq, remaining, process))
+        seq += 1
+        return cpu
+
+    def stop(cpu, time):
+        process, remaining, start, _ = running[cpu]
+        running[cpu] = None
+        schedule.append(process.process_id, start, time)
+        core_schedules[cpu].append(process.process_id, start, time)
+        busy_time[cpu] += time - start
+        if last_pid[cpu] is not None and last_pid[cpu] != process.process_id:
+            context_switches[cpu] += 1
+        last_pid[cpu] = process.process_id
+        if progress is not None and len(schedule) % PROGRESS_INTERVAL == 0:
+            progress(sum(busy_time), total_burst)
+        return process, remaining - (time - start)
+
+    def dispatch(cpu, time):
+        nonlocal migrations
+        queue = queues[0] if shared else queues[cpu]
+        if queue_mode == "stealing" and not queue:
+            queue = queues[max(cpus, key=lambda c: len(queues[c]))]
+        elif queue_mode == "balanced":
+            longest = queues[max(cpus, key=lambda c: len(queues[c]))]
+            if longest and (not queue or len(longest) > len(queue) + 1):
+                push(queue, pop(longest))
+        if not queue:
+            return
+        _, _, remaining, process = pop(queue)
+        if last_cpu.get(process.process_id, cpu) != cpu:
+            migrations += 1
+        last_cpu[process.process_id] = cpu
+        run_for = remaining if quantum is None else min(quantum, remaining)
+        running[cpu] = [process, remaining, time, time + run_for]
+
+    def running_key(cpu, time):
+        process, remaining, start, _ = running[cpu]
+        return key(process, remaining - (time - start))
+
+    def preempt(cpu, time):
+        process, remaining = stop(cpu, time)
+        enqueue(process, remaining, cpu)
+        dispatch(cpu, time)
+
+    with phase(instrument, "scheduling"):
+        time = 0
+        while True:
+            if counters is not None:
+                counters["iterations"] += 1
+            expired = []
+            for cpu in cpus:
+                if running[cpu] is not None and running[cpu][3] <= time:
+                    process, remaining = stop(cpu, time)
+                    if remaining > 0:
+                        expired.append((process, remaining, cpu))
+
+            while upcoming is not None and upcoming.arrival_time <= time:
+                cpu = enqueue(upcoming, upcoming.burst_time)
+                arrival_key = key(upcoming, upcoming.burst_time)
+                upcoming = next(arrivals, None)
+                if not preemptive:
+                    continue
+                # With every core busy, preempt as each arrival comes in; the
+                # freed core is dispatched below once all arrivals are queued
+                if shared:
+                    if None in running:
+                        continue
+                    worst = max(cpus, key=lambda c: running_key(c, time))
+                else:
+                    worst = cpu
+                    if running[worst] is None:
+                        continue
+                if counters is not None:
+                    counters["comparisons"] += 1
+                if arrival_key < running_key(worst, time):
+                    process, remaining = stop(worst, time)
+                    enqueue(process, remaining, worst)
+
+            # Quantum-expired processes queue up behind the new arrivals
+            for process, remaining, cpu in expired:
+                enqueue(process, remaining, cpu)
+
+            for cpu in cpus:
+                if running[cpu] is None:
+                    dispatch(cpu, time)
+
+            if preemptive:
+                if shared:
+                    queue = queues[0]
+                    while queue:
+                        worst = max((c for c in cpus if running[c] is not None),
+                                    key=lambda c: running_key(c, time), default=None)
+                        if worst is None or not queue[0][0] < running_key(worst, time):
+                            break
+                        preempt(worst, time)
+                else:
+                    for cpu in cpus:
+                        queue = queues[cpu]
+                        if running[cpu] is not None and queue and queue[0][0] < running_key(cpu, time):
+                            preempt(cpu, time)
+
+            next_time = upcoming.arrival_time if upcoming is not None else None
+            for cpu in cpus:
+                if running[cpu] is not None and (next_time is None or running[cpu][3] < next_time):
+                    next_time = running[cpu][3]
+            if next_time is None:
+                break
+            time = max(time, next_time)
+
+        if progress is not None:
+            progress(sum(busy_time), total_burst)
+
+    with phase(instrument, "metrics"):
+        result = build_result(schedule, processes, algorithm)
+        span = 0
+        if schedule:
+            span = max(schedule.end_times) - min(p.arrival_time for p in processes)
+        total_busy = sum(busy_time)
+        mean_busy = total_busy / num_cpus
+
+        result["cores"] = [{
+            "cpu": cpu,
+            "schedule": core_schedules[cpu],
+            "busy_time": busy_time[cpu],
+            "utilization": busy_time[cpu] / span if span else 0.0,
+            "context_switches": context_switches[cpu]
+        } for cpu in cpus]
+        result.update({
+            "num_cpus": num_cpus,
+            "queue_mode": queue_mode,
+            "context_switches": sum(context_switches),
+            "cpu_utilization": total_busy / (span * num_cpus) if span else 0.0,
+            "migrations": migrations,
+            "imbalance": (max(busy_time) - min(busy_time)) / mean_busy if mean_busy else 0.0
+        })
+    if instrument is not None:
+        result["stats"] = instrument.finish(result)
+    return result
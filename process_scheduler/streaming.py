@@ -0,0 +1,138 @@
+"""Online scheduling over a live stream of arrivals.
+
+Each *_stream function pulls processes lazily from an iterable ordered by
+arrival time (dicts or Process objects), and yields (process_id, start_time,
+end_time) slices as soon as they are final. Only processes that have arrived
+and not yet completed are kept in memory. Pass a RunningMetrics instance to
+read aggregate metrics at any point while the stream is being consumed.
+"""
+from .models import as_process
+from .scheduler import (
+    fcfs_slices,
+    round_robin_slices,
+    ready_queue_slices,
+    cfs_slices,
+    mlfq_slices,
+    shortest_burst,
+    highest_priority,
+    shortest_remaining
+)
+
+
+class RunningMetrics:
+    """Aggregate metrics over a stream; completed processes are folded into totals.
+
+    on_complete(process_id, stats), if given, receives each process's own
+    metrics as it completes.
+    """
+
+    def __init__(self, on_complete=None):
+        self.on_complete = on_complete
+        self.live = {}
+        self.completed = 0
+        self.total_waiting = 0
+        self.total_turnaround = 0
+        self.total_response = 0
+        self.busy_time = 0
+        self.context_switches = 0
+        self.first_arrival = None
+        self.time = 0
+        self.last_pid = None
+
+    def arrive(self, process):
+        # [arrival_time, burst_time, first_start, executed]
+        self.live[process.process_id] = [process.arrival_time, process.burst_time, None, 0]
+        if self.first_arrival is None:
+            self.first_arrival = process.arrival_time
+
+    def add(self, pid, start, end):
+        stats = self.live[pid]
+        if stats[2] is None:
+            stats[2] = start
+        stats[3] += end - start
+
+        self.busy_time += end - start
+        if self.last_pid is not None and pid != self.last_pid:
+            self.context_switches += 1
+        self.last_pid = pid
+        if end > self.time:
+            self.time = end
+
+        if stats[3] >= stats[1]:
+            arrival, burst, first_start, _ = self.live.pop(pid)
+            self.completed += 1
+            self.total_turnaround += end - arrival
+            self.total_waiting += end - arrival - burst
+            self.total_response += first_start - arrival
+            if self.on_complete is not None:
+                self.on_complete(pid, {
+                    "arrival_time": arrival,
+                    "completion_time": end,
+                    "waiting_time": end - arrival - burst,
+                    "turnaround_time": end - arrival,
+                    "response_time": first_start - arrival
+                })
+
+    def snapshot(self):
+        span = self.time - self.first_arrival if self.first_arrival is not None else 0
+        completed = self.completed
+        return {
+            "time": self.time,
+            "completed": completed,
+            "live": len(self.live),
+            "avg_waiting_time": self.total_waiting / completed if completed else 0.0,
+            "avg_turnaround_time": self.total_turnaround / completed if completed else 0.0,
+            "avg_response_time": self.total_response / completed if completed else 0.0,
+            "context_switches": self.context_switches,
+            "cpu_utilization": self.busy_time / span if span > 0 else 0.0,
+            "throughput": completed / span if span > 0 else 0.0
+        }
+
+
+def _pull(arrivals, metrics):
+    last_arrival = None
+    for process in arrivals:
+        process = as_process(process)
+        if last_arrival is not None and process.arrival_time < last_arrival:
+            raise ValueError("Arrivals must be ordered by arrival_time")
+        last_arrival = process.arrival_time
+        if metrics is not None:
+            metrics.arrive(process)
+        yield process
+
+
+def _emit(slices, metrics):
+    if metrics is None:
+        yield from slices
+        return
+    for pid, start, end in slices:
+        metrics.add(pid, start, end)
+        yield (pid, start, end)
+
+
+def fcfs_stream(arrivals, metrics=None):
+    return _emit(fcfs_slices(_pull(arrivals, metrics)), metrics)
+
+
+def round_robin_stream(arrivals, time_quantum=2, metrics=None):
+    return _emit(round_robin_slices(_pull(arrivals, metrics), time_quantum), metrics)
+
+
+def sjf_stream(arrivals, metrics=None):
+    return _emit(ready_queue_slices(_pull(arrivals, metrics), shortest_burst), metrics)
+
+
+def srtf_stream(arrivals, metrics=None):
+    return _emit(ready_queue_slices(_pull(arrivals, metrics), shortest_remaining, preemptive=True), metrics)
+
+
+def priority_stream(arrivals, preemptive=False, metrics=None):
+    return _emit(ready_queue_slices(_pull(arrivals, metrics), highest_priority, preemptive), metrics)
+
+
+def cfs_stream(arrivals, target_latency=20, min_granularity=4, metrics=None):
+    return _emit(cfs_slices(_pull(arrivals, metrics), target_latency, min_granularity), metrics)
+
+
+def mlfq_stream(arrivals, quanta=(2, 4, 8), boost_interval=100, metrics=None):
+    return _emit(mlfq_slices(_pull(arrivals, metrics), quanta, boost_interval), metrics)
@@ -0,0 +1,192 @@
+"""Parameter sweeps over the schedulers with an on-disk result cache.
+
+Each (algorithm, params) combination runs in a worker process. Summaries are
+cached on disk under a hash of the workload, the parameters and the scheduler
+source code, so running the same sweep again only reads the cache, and a
+change to the schedulers invalidates it.
+
+    python -m process_scheduler.sweep workload.csv --quanta 1 2 4 8
+"""
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .metrics import percentile
+from .models import Process, as_processes, processes_from_records
+from .scheduler import ALGORITHMS
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "os-scheduler", "sweep")
+# Modules whose code determines a summary; they are hashed into every cache key
+CODE_SOURCES = ("scheduler.py", "metrics.py", "models.py", "instrumentation.py", "sweep.py")
+_code_version = None
+
+
+def default_configs(quanta=(1, 2, 4, 8, 16)):
+    configs = [(name, {}) for name in ALGORITHMS if name != "Round Robin"]
+    configs += [("Round Robin", {"time_quantum": q}) for q in quanta]
+    return configs
+
+
+def code_version():
+    """Hash of CODE_SOURCES, computed once per process."""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256()
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for name in CODE_SOURCES:
+            with open(os.path.join(directory, name), "rb") as f:
+                digest.update(f.read())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+
+def workload_fingerprint(processes):
+    digest = hashlib.sha256()
+    for p in processes:
+        digest.update(f"{p.process_id},{p.arrival_time},{p.burst_time},{p.priority}\n".encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Directory of JSON results with size-bounded LRU eviction (by mtime)."""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=64 * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(fingerprint, algorithm, params):
+        config = json.dumps([algorithm, params], sort_keys=True)
+        return hashlib.sha256(f"{code_version()}:{fingerprint}:{config}".encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                row = json.load(f)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)
+        return row
+
+    def put(self, key, row):
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(row, f)
+        os.replace(tmp, path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+
+def summarize(algorithm, params, rows):
+    processes = [Process(*row) for row in rows]
+    result = ALGORITHMS[algorithm](processes, **params)
+    waiting = sorted(result["waiting_times"].values())
+    turnaround = sorted(result["turnaround_times"].values())
+    summary = {"algorithm": algorithm, "params": params}
+    for name, values in (("waiting", waiting), ("turnaround", turnaround)):
+        summary[f"avg_{name}"] = sum(values) / len(values) if values else 0.0
+        for p in (50, 95, 99):
+            summary[f"p{p}_{name}"] = percentile(values, p)
+    summary["context_switches"] = result["context_switches"]
+    summary["cpu_utilization"] = result["cpu_utilization"]
+    summary["throughput"] = result["throughput"]
+    return summary
+
+
+def run_sweep(processes, configs=None, max_workers=None, cache=None):
+    """Run every (algorithm, params) config and return one summary row each."""
+    processes = as_processes(processes)
+    configs = default_configs() if configs is None else configs
+    fingerprint = workload_fingerprint(processes)
+    rows = [(p.process_id, p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+    results = [None] * len(configs)
+    keys = [ResultCache.key(fingerprint, algorithm, params) for algorithm, params in configs]
+    todo = []
+    for i, key in enumerate(keys):
+        if cache is not None:
+            results[i] = cache.get(key)
+        if results[i] is None:
+            todo.append(i)
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {i: pool.submit(summarize, configs[i][0], configs[i][1], rows) for i in todo}
+            for i, future in futures.items():
+                results[i] = future.result()
+                if cache is not None:
+                    cache.put(keys[i], results[i])
+    return results
+
+
+def format_table(results):
+    header = ["Algorithm", "Avg Wait", "P95 Wait", "P99 Wait", "Avg Turn", "P95 Turn", "P99 Turn"]
+    lines = ["{:<32}{:>10}{:>10}{:>10}{:>10}{:>10}{:>10}".format(*header)]
+    for row in results:
+        name = row["algorithm"]
+        if row["params"]:
+            name += " (" + ", ".join(f"{k}={v}" for k, v in row["params"].items()) + ")"
+        lines.append("{:<32}{:>10.1f}{:>10}{:>10}{:>10.1f}{:>10}{:>10}".format(
+            name, row["avg_waiting"], row["p95_waiting"], row["p99_waiting"],
+            row["avg_turnaround"], row["p95_turnaround"], row["p99_turnaround"]))
+    return "\n".join(lines)
+
+
+def read_workload(path):
+    """Processes from a CSV or binary trace, via workload.load_process_trace.
+
+    A CSV row with fewer than three values, or a non-integer one, raises
+    ValueError naming the file and line.
+    """
+    from workload import load_process_trace
+    return processes_from_records(load_process_trace(path))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare scheduling algorithms on one workload")
+    parser.add_argument("workload", help="CSV or binary trace of pid,arrival,burst[,priority]")
+    parser.add_argument("--quanta", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                        help="Round Robin time quanta to sweep")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--cache-size", type=int, default=64, help="cache size limit in MiB")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print rows as JSON")
+    args = parser.parse_args(argv)
+
+    cache = None if args.no_cache else ResultCache(args.cache_dir, args.cache_size * 2**20)
+    try:
+        processes = read_workload(args.workload)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    results = run_sweep(processes, default_configs(args.quanta), args.workers, cache)
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,36 @@
+import queue
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
-from .scheduler import (
-    fcfs_scheduling, 
-    round_robin_scheduling,
-    sjf_scheduling,
-    priority_scheduling,
-    srtf_scheduling
-)
-from .visualization import plot_schedule
+from tkinter import ttk, messagebox, filedialog
+from .instrumentation import Instrumentation, format_stats
+from workload import load_process_trace
+from .batch import fcfs_batch, sjf_batch, priority_batch, as_result
+from .scheduler import SchedulingCancelled
+from .incremental import IncrementalScheduler
+from .models import Process, processes_from_records
+from .smp import QUEUE_MODES, smp_scheduling
+from .table import ProcessTableModel
+from .virtual_table import VirtualTable
+
+# Algorithms with a columnar NumPy implementation on a single CPU
+BATCH_ALGORITHMS = ("FCFS", "SJF", "Priority")
+# Milliseconds between checks on a running worker
+POLL_MS = 50
 
 class ProcessSchedulerTab:
     def __init__(self, parent):
+        self.model = ProcessTableModel()
+        self.last_result = None
+        # Single-CPU schedule kept up to date by queue edits, and the
+        # (algorithm, quantum) it was built for
+        self.incremental = None
+        self.incremental_key = None
+        self.next_incremental = None
+        self.pending_added = []
+        self.pending_removed = []
+        self.worker = None
+        self.cancel_event = threading.Event()
+        self.messages = queue.Queue()
         self.frame = ttk.Frame(parent)
         self.frame.pack(expand=True, fill="both") 
         self.frame.pack_propagate(True)
@@ -58,6 +78,7 @@ class ProcessSchedulerTab:
         ttk.Button(btn_frame, text="Add Process", command=self.add_process).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Remove Selected", command=self.remove_process).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Clear All", command=self.clear_processes).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Load Trace", command=self.load_trace).pack(side="left", padx=5)
 
         # ===== PROCESS TABLE =====
         table_frame = tk.LabelFrame(self.frame, text="Process Queue",
@@ -65,19 +86,17 @@ class ProcessSchedulerTab:
                                   padx=15, pady=15)
         table_frame.pack(fill="both", expand=True, pady=10)
         
-        self.process_list = ttk.Treeview(table_frame, columns=("PID", "Burst", "Arrival", "Priority"), 
-                                       show="headings", height=8)
-        
-        # Configure columns
-        for col in ["PID", "Burst", "Arrival", "Priority"]:
-            self.process_list.heading(col, text=col)
-            self.process_list.column(col, width=100, anchor="center")
+        filter_frame = tk.Frame(table_frame)
+        filter_frame.pack(fill="x", pady=(0, 5))
+        tk.Label(filter_frame, text="Filter:").pack(side="left")
+        self.filter_entry = ttk.Entry(filter_frame, width=25)
+        self.filter_entry.pack(side="left", padx=5)
+        self.filter_entry.bind("<Return>", lambda e: self.apply_filter())
+        ttk.Button(filter_frame, text="Apply", command=self.apply_filter).pack(side="left")
+        tk.Label(filter_frame, text="e.g. Burst > 10", fg="gray").pack(side="left", padx=5)
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.process_list.yview)
-        self.process_list.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side="right", fill="y")
-        self.process_list.pack(fill="both", expand=True)
+        self.table = VirtualTable(table_frame, self.model)
+        self.table.pack()
 
         # ===== ALGORITHM SELECTION =====
         algo_frame = tk.LabelFrame(self.frame, text="Scheduling Algorithm",
@@ -91,8 +110,11 @@ class ProcessSchedulerTab:
             ("FCFS", "First-Come First-Served"),
             ("SJF", "Shortest Job First"),
             ("Priority", "Priority Scheduling"),
+            ("Preemptive Priority", "Preemptive Priority"),
             ("Round Robin", "Round Robin"),
-            ("SRTF", "Shortest Remaining Time First")
+            ("SRTF", "Shortest Remaining Time First"),
+            ("CFS", "Completely Fair Scheduler"),
+            ("MLFQ", "Multi-Level Feedback Queue")
         ]
         
         for i, (value, text) in enumerate(algorithms):
@@ -100,12 +122,24 @@ class ProcessSchedulerTab:
                           value=value).grid(row=i//2, column=i%2, sticky="w", padx=5, pady=2)
         
         quantum_frame = tk.Frame(algo_frame)
-        quantum_frame.grid(row=2, column=1, sticky="w")
+        quantum_frame.grid(row=len(algorithms)//2, column=len(algorithms) % 2, sticky="w")
         
         tk.Label(quantum_frame, text="Time Quantum:").pack(side="left")
         self.quantum_entry = ttk.Entry(quantum_frame, width=5)
         self.quantum_entry.pack(side="left", padx=5)
         self.quantum_entry.insert(0, "2")
+        
+        cores_frame = tk.Frame(algo_frame)
+        cores_frame.grid(row=len(algorithms)//2 + 1, column=0, columnspan=2, sticky="w")
+        
+        tk.Label(cores_frame, text="CPU Cores:").pack(side="left")
+        self.cores_var = tk.StringVar(value="1")
+        ttk.Spinbox(cores_frame, from_=1, to=256, width=5,
+                   textvariable=self.cores_var).pack(side="left", padx=5)
+        tk.Label(cores_frame, text="Run Queue:").pack(side="left", padx=(10, 0))
+        self.queue_mode_var = tk.StringVar(value="global")
+        ttk.Combobox(cores_frame, textvariable=self.queue_mode_var, values=QUEUE_MODES,
+                    width=9, state="readonly").pack(side="left", padx=5)
 
         run_frame = tk.Frame(self.frame)
         run_frame.pack(pady=15)
@@ -120,11 +154,30 @@ class ProcessSchedulerTab:
         self.run_btn.pack(side="left", padx=5)
         self.frame.update()
         
+        self.cancel_btn = ttk.Button(run_frame,
+                  text="■ Cancel",
+                  command=self.cancel_scheduler,
+                  state="disabled")
+        self.cancel_btn.pack(side="left", padx=5)
+        
         ttk.Button(run_frame,
                   text="Clear Metrics",
                   command=self.clear_metrics).pack(side="left", padx=5)
+        
+        ttk.Button(run_frame,
+                  text="Save Chart",
+                  command=self.save_chart).pack(side="left", padx=5)
+        
+        self.count_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(run_frame, text="Count operations",
+                       variable=self.count_var).pack(side="left", padx=5)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(run_frame, text="Profile",
+                       variable=self.profile_var).pack(side="left", padx=5)
 
         # ===== STATUS BAR =====
+        self.progress_bar = ttk.Progressbar(self.frame, mode="determinate", maximum=1.0)
+        self.progress_bar.pack(fill="x")
         self.status_var = tk.StringVar(value="Ready to schedule processes")
         ttk.Label(self.frame, textvariable=self.status_var, relief="sunken",
                 anchor="w").pack(fill="x")
@@ -136,7 +189,9 @@ class ProcessSchedulerTab:
             arrival = int(self.arrival_entry.get())
             priority = int(self.priority_entry.get() or 0)
             
-            self.process_list.insert("", "end", values=(pid, burst, arrival, priority))
+            self.model.append(pid, arrival, burst, priority)
+            self.table.refresh()
+            self.pending_added.append(Process(pid, arrival, burst, priority))
             
             # Clear entries
             self.pid_entry.delete(0, tk.END)
@@ -150,83 +205,240 @@ class ProcessSchedulerTab:
             messagebox.showerror("Input Error", "Please enter valid numbers!")
 
     def remove_process(self):
-        selected = self.process_list.selection()
-        if selected:
-            pid = self.process_list.item(selected[0], "values")[0]
-            self.process_list.delete(selected[0])
+        pid = self.table.selected_pid()
+        if pid is not None:
+            self.model.remove(pid)
+            self.table.refresh()
+            self.pending_added = [p for p in self.pending_added if p.process_id != pid]
+            self.pending_removed.append(pid)
             self.status_var.set(f"Process P{pid} removed")
         else:
             messagebox.showwarning("Selection Error", "No process selected")
 
     def clear_processes(self):
-        for item in self.process_list.get_children():
-            self.process_list.delete(item)
+        self.model.clear()
+        self.table.refresh()
+        self.reset_incremental()
         self.status_var.set("All processes cleared")
 
+    def load_trace(self):
+        path = filedialog.askopenfilename(
+            title="Load process trace",
+            filetypes=[("Trace files", "*.csv *.bin *.trace"), ("All files", "*")])
+        if not path:
+            return
+        try:
+            trace = load_process_trace(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Trace Error", f"Could not load trace: {e}")
+            return
+        
+        self.model.load(trace)
+        self.table.refresh()
+        self.reset_incremental()
+        self.status_var.set(f"Loaded {len(trace)} processes")
+
+    def reset_incremental(self):
+        self.incremental = None
+        self.incremental_key = None
+        self.pending_added = []
+        self.pending_removed = []
+
+    def apply_filter(self):
+        try:
+            self.model.filter(self.filter_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Filter Error", str(e))
+            return
+        self.table.refresh()
+        self.status_var.set(f"Showing {len(self.model.view)} of {len(self.model)} processes")
+
     def clear_metrics(self):
-        """Remove waiting/turnaround time columns"""
-        self.process_list["columns"] = ("PID", "Burst", "Arrival", "Priority")
-        for col in self.process_list["columns"]:
-            self.process_list.heading(col, text=col)
+        """Remove waiting/turnaround times"""
+        self.model.clear_metrics()
+        self.table.refresh()
         self.status_var.set("Metrics cleared")
 
+    def save_chart(self):
+        if self.last_result is None:
+            messagebox.showwarning("Save Chart", "Run a schedule first")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Save Gantt chart",
+            defaultextension=".png",
+            filetypes=[("PNG image", "*.png"), ("SVG image", "*.svg")])
+        if not path:
+            return
+        try:
+            from .visualization import export_schedule
+            export_schedule(self.last_result, path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Save Chart", f"Could not save chart: {e}")
+            return
+        self.status_var.set(f"Chart saved to {path}")
+
     def run_scheduler(self):
-        processes = []
-        for item in self.process_list.get_children():
-            pid, burst, arrival, priority = self.process_list.item(item, "values")
-            processes.append({
-                "process_id": int(pid),
-                "burst_time": int(burst),
-                "arrival_time": int(arrival),
-                "priority": int(priority)
-            })
-        
-        if not processes:
+        if self.worker is not None:
+            return
+        algorithm = self.algorithm_var.get()
+        try:
+            quantum = int(self.quantum_entry.get()) if algorithm == "Round Robin" else None
+            num_cpus = int(self.cores_var.get())
+            if num_cpus < 1 or (quantum is not None and quantum < 1):
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Input Error", "Time quantum and cores must be positive integers!")
+            return
+        queue_mode = self.queue_mode_var.get()
+        records = self.model.records
+        
+        if len(records) == 0:
             messagebox.showerror("Error", "No processes to schedule!")
             return
         
-        algorithm = self.algorithm_var.get()
-        quantum = int(self.quantum_entry.get()) if algorithm == "Round Robin" else None
+        # Phase timers are always on; counting and profiling slow the run down
+        instrument = Instrumentation(count=self.count_var.get(), profile=self.profile_var.get())
+        key = (algorithm, quantum)
+        incremental = self.incremental if self.incremental_key == key else None
+        added, removed = self.pending_added, self.pending_removed
+        self.pending_added, self.pending_removed = [], []
+        if num_cpus == 1 and algorithm not in BATCH_ALGORITHMS:
+            self.incremental_key = key
+        else:
+            self.incremental_key = None
+        self.incremental = self.next_incremental = None
         
-        try:
-            self.status_var.set(f"Running {algorithm}...")
-            self.frame.update()
+        def job(progress):
+            if num_cpus == 1 and algorithm in BATCH_ALGORITHMS:
+                # Columnar fast path straight from the model's arrays
+                columns = (records["process_id"], records["arrival_time"], records["burst_time"])
+                with instrument.phase("scheduling"):
+                    if algorithm == "FCFS":
+                        batch = fcfs_batch(*columns)
+                    elif algorithm == "SJF":
+                        batch = sjf_batch(*columns)
+                    else:
+                        batch = priority_batch(*columns, records["priority"])
+                with instrument.phase("metrics"):
+                    result = as_result(batch)
+                result["stats"] = instrument.finish(result)
+                return result
             
-            if algorithm == "FCFS":
-                result = fcfs_scheduling(processes)
-            elif algorithm == "SJF":
-                result = sjf_scheduling(processes)
-            elif algorithm == "Priority":
-                result = priority_scheduling(processes)
-            elif algorithm == "Round Robin":
-                result = round_robin_scheduling(processes, quantum)
-            elif algorithm == "SRTF":
-                result = srtf_scheduling(processes)
+            if num_cpus > 1:
+                processes = processes_from_records(records)
+                return smp_scheduling(processes, algorithm, num_cpus, queue_mode, quantum or 2,
+                                      progress, instrument)
             
+            # Re-simulate only from the earliest edit since the last run; a
+            # failed or cancelled run leaves self.incremental unset, so the
+            # next run starts over from the table
+            if incremental is None:
+                params = {"time_quantum": quantum} if quantum else {}
+                self.next_incremental = IncrementalScheduler(
+                    algorithm, processes_from_records(records), progress, instrument, **params)
+                return self.next_incremental.result()
+            result = incremental.update(added, removed, progress, instrument)
+            self.next_incremental = incremental
+            return result
+        
+        self.cancel_event.clear()
+        self.messages = queue.Queue()
+        self.worker = threading.Thread(target=self.work, args=(job,), daemon=True)
+        self.run_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
+        self.progress_bar["value"] = 0
+        self.status_var.set(f"Running {algorithm}...")
+        self.worker.start()
+        self.frame.after(POLL_MS, self.poll_worker, algorithm, num_cpus)
+
+    def work(self, job):
+        # Runs on the worker thread: only talk to Tk through self.messages
+        try:
+            result = job(self.report_progress)
+            if self.cancel_event.is_set():
+                raise SchedulingCancelled()
+            self.messages.put(("done", result))
+        except SchedulingCancelled:
+            self.messages.put(("cancelled", None))
+        except Exception as e:
+            self.messages.put(("error", e))
+
+    def report_progress(self, done, total):
+        if self.cancel_event.is_set():
+            raise SchedulingCancelled()
+        self.messages.put(("progress", done / total if total else 1.0))
+
+    def cancel_scheduler(self):
+        if self.worker is not None:
+            self.cancel_event.set()
+            self.status_var.set("Cancelling...")
+
+    def poll_worker(self, algorithm, num_cpus):
+        while True:
+            try:
+                kind, payload = self.messages.get_nowait()
+            except queue.Empty:
+                self.frame.after(POLL_MS, self.poll_worker, algorithm, num_cpus)
+                return
+            if kind != "progress":
+                break
+            self.progress_bar["value"] = payload
+            if not self.cancel_event.is_set():
+                self.status_var.set(f"Running {algorithm}... {payload:.0%}")
+        
+        self.worker = None
+        self.run_btn.config(state="normal")
+        self.cancel_btn.config(state="disabled")
+        if kind == "cancelled":
+            self.progress_bar["value"] = 0
+            self.status_var.set(f"{algorithm} cancelled")
+        elif kind == "error":
+            messagebox.showerror("Error", f"Scheduling failed: {str(payload)}")
+            self.status_var.set("Error during scheduling")
+        else:
+            if self.incremental_key is not None:
+                self.incremental = self.next_incremental
+            self.progress_bar["value"] = 1.0
+            self.show_result(algorithm, num_cpus, payload)
+
+    def show_result(self, algorithm, num_cpus, result):
+        try:
             # Update table with metrics
-            self.process_list["columns"] = ("PID", "Burst", "Arrival", "Priority", "Waiting", "Turnaround")
-            for col in self.process_list["columns"]:
-                self.process_list.heading(col, text=col)
-                self.process_list.column(col, width=80, anchor="center")
-            
-            for item in self.process_list.get_children():
-                values = list(self.process_list.item(item, "values"))
-                pid = int(values[0])
-                new_values = values + [
-                    result["waiting_times"][pid],
-                    result["turnaround_times"][pid]
-                ]
-                self.process_list.item(item, values=new_values)
+            self.model.set_metrics(result["waiting_times"], result["turnaround_times"])
+            self.table.refresh()
             
-            # Show visualization
+            # Show visualization (matplotlib is only imported on first use)
+            from .visualization import plot_schedule
+            self.last_result = result
             plot_schedule(result)
             
-            avg_wait = sum(result["waiting_times"].values()) / len(processes)
-            avg_turn = sum(result["turnaround_times"].values()) / len(processes)
-            self.status_var.set(
-                f"{algorithm} completed | Avg Wait: {avg_wait:.1f} | Avg Turnaround: {avg_turn:.1f}"
-            )
+            count = len(result["waiting_times"])
+            avg_wait = sum(result["waiting_times"].values()) / count
+            avg_turn = sum(result["turnaround_times"].values()) / count
+            status = f"{algorithm} completed | Avg Wait: {avg_wait:.1f} | Avg Turnaround: {avg_turn:.1f}"
+            if "incremental" in result:
+                status += (f" | Reused {result['incremental']['reused']}"
+                           f" / recomputed {result['incremental']['recomputed']} slices")
+            if num_cpus > 1:
+                status += (f" | {num_cpus} CPUs | Util: {result['cpu_utilization']:.0%}"
+                           f" | Migrations: {result['migrations']} | Imbalance: {result['imbalance']:.2f}")
+            if "stats" in result:
+                status += f" | {format_stats(result['stats'])}"
+                if "profile" in result["stats"]:
+                    self.show_profile(algorithm, result["stats"]["profile"])
+            self.status_var.set(status)
             
         except Exception as e:
             messagebox.showerror("Error", f"Scheduling failed: {str(e)}")
-            self.status_var.set("Error during scheduling")
\ No newline at end of file
+            self.status_var.set("Error during scheduling")
+
+    def show_profile(self, algorithm, report):
+        window = tk.Toplevel(self.frame)
+        window.title(f"{algorithm} profile")
+        text = tk.Text(window, width=120, height=35, wrap="none", font=("Courier", 9))
+        scrollbar = ttk.Scrollbar(window, command=text.yview)
+        text.config(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        text.pack(fill="both", expand=True)
+        text.insert(tk.END, report)
+        text.config(state="disabled")
@@ -0,0 +1,140 @@
+"""Array-backed process table.
+
+ProcessTableModel keeps the workload as a PROCESS_DTYPE record array plus
+waiting/turnaround columns, with sorting and filtering done as index arrays
+over it. The Tk view lives in virtual_table.py.
+"""
+import operator
+import re
+import numpy as np
+from workload import PROCESS_DTYPE
+
+# Displayed column -> model field
+COLUMNS = {
+    "PID": "process_id",
+    "Burst": "burst_time",
+    "Arrival": "arrival_time",
+    "Priority": "priority",
+    "Waiting": "waiting",
+    "Turnaround": "turnaround"
+}
+
+FILTER_OPERATORS = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "!=": operator.ne,
+    "==": operator.eq,
+    "=": operator.eq,
+    "<": operator.lt,
+    ">": operator.gt
+}
+FILTER_PATTERN = re.compile(r"^\s*(\w+)\s*(<=|>=|!=|==|=|<|>)\s*(-?\d+(?:\.\d*)?)\s*$")
+
+class ProcessTableModel:
+    def __init__(self, records=None):
+        self.load(np.empty(0, dtype=PROCESS_DTYPE) if records is None else records)
+
+    def load(self, records):
+        """Replace the workload with a PROCESS_DTYPE record array."""
+        self.records = records
+        self.waiting = np.full(len(records), np.nan)
+        self.turnaround = np.full(len(records), np.nan)
+        self.sort_column = None
+        self.descending = False
+        self.condition = None
+        self.refresh_view()
+
+    def __len__(self):
+        return len(self.records)
+
+    def column(self, name):
+        field = COLUMNS[name]
+        if field in PROCESS_DTYPE.names:
+            return self.records[field]
+        return getattr(self, field)
+
+    def append(self, pid, arrival, burst, priority=0):
+        record = np.array([(pid, arrival, burst, priority)], dtype=PROCESS_DTYPE)
+        self.records = np.concatenate([self.records, record])
+        self.waiting = np.append(self.waiting, np.nan)
+        self.turnaround = np.append(self.turnaround, np.nan)
+        self.refresh_view()
+
+    def remove(self, pid):
+        keep = self.records["process_id"] != pid
+        self.records = self.records[keep]
+        self.waiting = self.waiting[keep]
+        self.turnaround = self.turnaround[keep]
+        self.refresh_view()
+
+    def clear(self):
+        self.load(np.empty(0, dtype=PROCESS_DTYPE))
+
+    def set_metrics(self, waiting_times, turnaround_times):
+        """Fill the metric columns from {pid: value} dicts in one vectorized pass."""
+        pids = self.records["process_id"]
+        for target, values in ((self.waiting, waiting_times), (self.turnaround, turnaround_times)):
+            target[:] = np.nan
+            if not values:
+                continue
+            keys = np.fromiter(values.keys(), dtype=np.int64, count=len(values))
+            data = np.fromiter(values.values(), dtype=float, count=len(values))
+            order = np.argsort(keys)
+            keys, data = keys[order], data[order]
+            index = np.minimum(np.searchsorted(keys, pids), len(keys) - 1)
+            found = keys[index] == pids
+            target[found] = data[index[found]]
+        self.refresh_view()
+
+    def clear_metrics(self):
+        self.waiting[:] = np.nan
+        self.turnaround[:] = np.nan
+        self.refresh_view()
+
+    def sort(self, name, descending=False):
+        self.sort_column = name
+        self.descending = descending
+        self.refresh_view()
+
+    def filter(self, expression):
+        """Show only rows matching "<column> <op> <number>", e.g. "Burst > 10".
+
+        An empty expression shows every row. Raises ValueError when the
+        expression cannot be parsed.
+        """
+        if not expression.strip():
+            self.condition = None
+        else:
+            match = FILTER_PATTERN.match(expression)
+            names = {name.lower(): name for name in COLUMNS}
+            if match is None or match.group(1).lower() not in names:
+                raise ValueError(f"Invalid filter: {expression!r}")
+            name, op, value = match.groups()
+            self.condition = (names[name.lower()], FILTER_OPERATORS[op], float(value))
+        self.refresh_view()
+
+    def refresh_view(self):
+        # self.view holds the record indices in display order
+        if self.sort_column is None:
+            view = np.arange(len(self.records))
+        else:
+            view = np.argsort(self.column(self.sort_column), kind="stable")
+            if self.descending:
+                view = view[::-1]
+        if self.condition is not None:
+            name, op, value = self.condition
+            view = view[op(self.column(name), value)[view]]
+        self.view = view
+
+    def rows(self, start, stop):
+        """Display tuples for view positions start..stop."""
+        index = self.view[start:stop]
+        records = self.records[index].tolist()
+        metrics = zip(self.waiting[index].tolist(), self.turnaround[index].tolist())
+        return [(pid, burst, arrival, priority, format_metric(waiting), format_metric(turnaround))
+                for (pid, arrival, burst, priority), (waiting, turnaround) in zip(records, metrics)]
+
+def format_metric(value):
+    if value != value:
+        return ""
+    return int(value) if value == int(value) else round(value, 2)
@@ -0,0 +1,73 @@
+"""Virtualized Tk view of a ProcessTableModel.
+
+The Treeview only ever holds the rows currently scrolled into view, so the
+widget costs the same for ten processes as for a million.
+"""
+from tkinter import ttk
+from .table import COLUMNS
+
+class VirtualTable:
+    """A Treeview showing only the visible window of a ProcessTableModel."""
+
+    def __init__(self, parent, model, height=8):
+        self.model = model
+        self.offset = 0
+        self.visible_rows = height
+        self.tree = ttk.Treeview(parent, columns=tuple(COLUMNS), show="headings",
+                                 height=height, selectmode="browse")
+        for col in COLUMNS:
+            self.tree.heading(col, text=col, command=lambda c=col: self.sort_by(c))
+            self.tree.column(col, width=80, anchor="center")
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.scroll)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda e: self.scroll("scroll", -1, "units"))
+        self.tree.bind("<Button-5>", lambda e: self.scroll("scroll", 1, "units"))
+        self.tree.bind("<Configure>", self.resize)
+
+    def pack(self):
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(fill="both", expand=True)
+
+    def resize(self, event):
+        row_height = ttk.Style().lookup("Treeview", "rowheight") or 20
+        rows = max(1, (event.height - 25) // int(row_height))
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.refresh()
+
+    def scroll(self, action, amount, unit=None):
+        total = len(self.model.view)
+        if action == "moveto":
+            offset = int(float(amount) * total)
+        elif unit == "pages":
+            offset = self.offset + int(amount) * self.visible_rows
+        else:
+            offset = self.offset + int(amount)
+        self.offset = max(0, min(offset, total - self.visible_rows))
+        self.refresh()
+        return "break"
+
+    def sort_by(self, col):
+        descending = self.model.sort_column == col and not self.model.descending
+        self.model.sort(col, descending)
+        for name in COLUMNS:
+            arrow = (" ▼" if descending else " ▲") if name == col else ""
+            self.tree.heading(name, text=name + arrow)
+        self.refresh()
+
+    def refresh(self):
+        total = len(self.model.view)
+        self.offset = max(0, min(self.offset, total - self.visible_rows))
+        self.tree.delete(*self.tree.get_children())
+        for row in self.model.rows(self.offset, self.offset + self.visible_rows):
+            self.tree.insert("", "end", values=row)
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible_rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def selected_pid(self):
+        selected = self.tree.selection()
+        if not selected:
+            return None
+        return int(self.tree.item(selected[0], "values")[0])
@@ -1,47 +1,148 @@
-import matplotlib.pyplot as plt
-from matplotlib.colors import ListedColormap
+from matplotlib import cm
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 
-def plot_schedule(schedule_data):
+# Beyond these counts, ticks are left to matplotlib and metrics drawn as lines
+MAX_LABELED_PROCESSES = 40
+MAX_METRIC_BARS = 200
+# Bar outlines only help when bars are wide enough to see them
+MAX_OUTLINED_BARS = 2000
+
+class GanttChart:
+    """All schedule slices of an axes in one PolyCollection.
+
+    Slices are kept as NumPy columns (lane, process, start, end) sorted by lane,
+    process and start. Whenever the x-range changes only the visible slices are
+    drawn, and slices of the same process in the same lane separated by less
+    than a pixel are merged into one bar, so the number of drawn rectangles is
+    bounded by the axes width rather than by the schedule length.
+    """
+
+    def __init__(self, ax, lanes, pids, starts, ends, color_map):
+        order = np.lexsort((starts, pids, lanes))
+        self.ax = ax
+        self.lanes = lanes[order]
+        self.pids = pids[order]
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.color_map = color_map
+        self.collection = PolyCollection([], edgecolors="black")
+        ax.add_collection(self.collection, autolim=False)
+        ax.set_xlim(self.starts.min(), max(self.ends.max(), self.starts.min() + 1))
+        ax.set_ylim(self.lanes.min() - 1, self.lanes.max() + 1)
+        self.update(ax)
+        # Callbacks hold weak references; draw_schedule keeps the chart on the axes
+        ax.callbacks.connect("xlim_changed", self.update)
+
+    def visible_bars(self, x0, x1, min_gap):
+        keep = (self.ends >= x0) & (self.starts <= x1)
+        lanes, pids = self.lanes[keep], self.pids[keep]
+        starts, ends = self.starts[keep], self.ends[keep]
+        if len(starts) > 1 and min_gap > 0:
+            first = np.ones(len(starts), dtype=bool)
+            first[1:] = ((starts[1:] - ends[:-1] >= min_gap) |
+                         (pids[1:] != pids[:-1]) | (lanes[1:] != lanes[:-1]))
+            index = np.flatnonzero(first)
+            lanes, pids, starts = lanes[index], pids[index], starts[index]
+            ends = np.maximum.reduceat(ends, index)
+        return lanes, pids, starts, ends
+
+    def update(self, ax=None):
+        x0, x1 = self.ax.get_xlim()
+        width = self.ax.get_window_extent().width
+        min_gap = (x1 - x0) / width if width > 0 else 0
+        lanes, pids, starts, ends = self.visible_bars(x0, x1, min_gap)
+
+        verts = np.empty((len(starts), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = starts
+        verts[:, 2, 0] = verts[:, 3, 0] = ends
+        verts[:, 0, 1] = verts[:, 3, 1] = lanes - 0.4
+        verts[:, 1, 1] = verts[:, 2, 1] = lanes + 0.4
+        self.collection.set_verts(verts)
+        self.collection.set_facecolors(self.color_map(pids))
+        self.collection.set_linewidths(0.5 if len(starts) <= MAX_OUTLINED_BARS else 0)
+        self.ax.figure.canvas.draw_idle()
+
+def columns(schedule):
+    return (np.frombuffer(schedule.process_ids, dtype=np.int64),
+            np.frombuffer(schedule.start_times, dtype=np.int64),
+            np.frombuffer(schedule.end_times, dtype=np.int64))
+
+def draw_schedule(fig, schedule_data):
+    """Draw the Gantt chart and metrics of a result onto fig."""
     schedule = schedule_data["schedule"]
-    if not schedule:
-        print("No schedule to visualize!")
-        return
+    ax1, ax2 = fig.subplots(2, 1, gridspec_kw={'height_ratios': [3, 1]})
 
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), 
-                         gridspec_kw={'height_ratios': [3, 1]})
-    
-    unique_pids = list({p["process_id"] for p in schedule})
-    colors = plt.cm.tab20(np.linspace(0, 1, len(unique_pids)))
-    color_map = {pid: colors[i] for i, pid in enumerate(unique_pids)}
-
-    for process in schedule:
-        duration = process["end_time"] - process["start_time"]
-        ax1.broken_barh([(process["start_time"], duration)],
-                       (process["process_id"] - 0.4, 0.8),
-                       facecolors=color_map[process["process_id"]],
-                       edgecolor='black',
-                       linewidth=0.5)
+    pids, starts, ends = columns(schedule)
+    unique_pids = np.unique(pids)
+    colors = cm.tab20(np.linspace(0, 1, len(unique_pids)))
+
+    def color_map(p):
+        return colors[np.searchsorted(unique_pids, p)]
+
+    if "cores" in schedule_data:
+        # One lane per core, coloured by process
+        core_columns = [columns(core["schedule"]) for core in schedule_data["cores"]]
+        lanes = np.concatenate([np.full(len(core["schedule"]), core["cpu"])
+                                for core in schedule_data["cores"]])
+        pids, starts, ends = (np.concatenate(column) for column in zip(*core_columns))
+        ax1.chart = GanttChart(ax1, lanes, pids, starts, ends, color_map)
+        cpus = [core["cpu"] for core in schedule_data["cores"]]
+        ax1.set_ylabel("CPU")
+        ax1.set_yticks(cpus)
+        ax1.set_yticklabels([f'CPU{cpu}' for cpu in cpus])
+    else:
+        ax1.chart = GanttChart(ax1, pids, pids, starts, ends, color_map)
+        ax1.set_ylabel("Process ID")
+        if len(unique_pids) <= MAX_LABELED_PROCESSES:
+            ax1.set_yticks(unique_pids)
+            ax1.set_yticklabels([f'P{pid}' for pid in unique_pids])
 
     ax1.set_title("Process Scheduling Gantt Chart", pad=15)
     ax1.set_xlabel("Time Units")
-    ax1.set_ylabel("Process ID")
-    ax1.set_yticks(unique_pids)
-    ax1.set_yticklabels([f'P{pid}' for pid in unique_pids])
     ax1.grid(True, axis='x', linestyle='--')
 
     metrics = ['Waiting Time', 'Turnaround Time']
     for i, metric in enumerate(metrics):
-        values = [schedule_data[f"{metric.lower().replace(' ', '_')}s"].get(pid, 0) 
-                 for pid in unique_pids]
-        ax2.bar(np.array(unique_pids) + (i*0.4) - 0.2, values, 0.4, 
-               label=metric, color=[color_map[pid] for pid in unique_pids])
+        values = schedule_data[f"{metric.lower().replace(' ', '_')}s"]
+        values = [values.get(pid, 0) for pid in unique_pids.tolist()]
+        if len(unique_pids) <= MAX_METRIC_BARS:
+            ax2.bar(unique_pids + (i*0.4) - 0.2, values, 0.4,
+                   label=metric, color=colors)
+        else:
+            ax2.plot(unique_pids, values, linewidth=0.8, label=metric)
 
     ax2.set_title("Process Metrics")
-    ax2.set_xticks(unique_pids)
-    ax2.set_xticklabels([f'P{pid}' for pid in unique_pids])
+    if len(unique_pids) <= MAX_LABELED_PROCESSES:
+        ax2.set_xticks(unique_pids)
+        ax2.set_xticklabels([f'P{pid}' for pid in unique_pids])
     ax2.legend()
     ax2.grid(True, axis='y', linestyle='--')
 
-    plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    fig.tight_layout()
+    ax1.chart.update()
+
+def plot_schedule(schedule_data):
+    if not schedule_data["schedule"]:
+        print("No schedule to visualize!")
+        return
+
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(12, 8))
+    draw_schedule(fig, schedule_data)
+    plt.show()
+
+def export_schedule(schedule_data, path, dpi=100):
+    """Render a result to an image file (format from the extension, e.g. .png
+    or .svg) without pyplot, so it works with no display."""
+    if not schedule_data["schedule"]:
+        raise ValueError("No schedule to export")
+
+    fig = Figure(figsize=(12, 8), dpi=dpi)
+    FigureCanvasAgg(fig)
+    draw_schedule(fig, schedule_data)
+    fig.savefig(path)
+    return path
@@ -0,0 +1,424 @@
+"""Local scheduling service: submit workloads as JSON over HTTP.
+
+    python service.py --port 8750
+    python service.py --unix /tmp/os-scheduler.sock
+
+    POST /process  {"algorithm": "Round Robin", "params": {"time_quantum": 4},
+                    "processes": [[pid, arrival, burst, priority], ...]}
+    POST /disk     {"algorithm": "C-LOOK", "head": 53, "direction": "right",
+                    "options": {"disk_size": 200}, "requests": [98, 183, 37, ...]}
+    GET  /health   pool, queue and cache counters
+
+Runs execute on a bounded process pool. Once a run finishes, its result (the
+same JSON lines cli.py writes) is sent back with chunked encoding; writes
+wait for the client to drain, so a slow reader holds only its own
+connection. At most max_queued runs may be queued or running at once;
+beyond that the service answers 503 instead of buffering more work. A run that takes longer than timeout gets a 504; a
+queued run is dropped, but one a worker has started runs to completion,
+since a process pool cannot interrupt it, and counts as active until then.
+Process rows must be integers with arrival and burst in 0..MAX_TIME, params
+positive integers (quanta a list of them), and a run that could produce more
+than MAX_SLICES slices is refused with a 400, so one request cannot keep a
+worker busy for long. Workers take the default SIGTERM action, so they can
+be killed even though they fork from the service's event loop. Identical
+requests are answered from an LRU of recent encoded results.
+
+The service binds to 127.0.0.1 (or a Unix socket) only.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import signal
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from cli import disk_records, disk_summary
+from disk_scheduler.algorithms import ALGORITHMS as DISK_ALGORITHMS, run_algorithm
+from process_scheduler.models import Process
+from process_scheduler.scheduler import ALGORITHMS as PROCESS_ALGORITHMS
+
+# Keyword arguments each process algorithm takes besides the processes
+PROCESS_OPTIONS = {
+    "Round Robin": ("time_quantum",),
+    "CFS": ("target_latency", "min_granularity"),
+    "MLFQ": ("quanta", "boost_interval")
+}
+MAX_BODY = 64 * 2**20
+# Largest process arrival or burst time, and slices a process run may produce
+MAX_TIME = 10**9
+MAX_SLICES = 10**6
+# Bytes per chunk of a response
+CHUNK_BYTES = 64 * 1024
+# Seconds a client may take to send a request, and to stay idle between them
+READ_TIMEOUT = 30
+STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+          408: "Request Timeout", 413: "Payload Too Large", 500: "Internal Server Error",
+          503: "Service Unavailable", 504: "Gateway Timeout"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def encode(records):
+    return "".join(json.dumps(record) + "\n" for record in records).encode()
+
+
+def run_process(algorithm, rows, params):
+    """Worker: schedule rows of [pid, arrival, burst, priority] and return JSON lines."""
+    processes = [Process(*row[:4]) for row in rows]
+    if "quanta" in params:
+        params = {**params, "quanta": tuple(params["quanta"])}
+    result = PROCESS_ALGORITHMS[algorithm](processes, **params)
+    records = [{"algorithm": algorithm, "record": "slice", "process_id": pid,
+                "start_time": start, "end_time": end} for pid, start, end in result["schedule"]]
+    turnaround = result["turnaround_times"]
+    for pid in turnaround:
+        records.append({"algorithm": algorithm, "record": "process", "process_id": pid,
+                        "waiting_time": result["waiting_times"][pid],
+                        "turnaround_time": turnaround[pid],
+                        "response_time": result["response_times"][pid]})
+    completed = len(turnaround)
+    records.append({
+        "algorithm": algorithm,
+        "record": "summary",
+        "completed": completed,
+        "avg_waiting_time": sum(result["waiting_times"].values()) / completed if completed else 0.0,
+        "avg_turnaround_time": sum(turnaround.values()) / completed if completed else 0.0,
+        "avg_response_time": sum(result["response_times"].values()) / completed if completed else 0.0,
+        "context_switches": result["context_switches"],
+        "cpu_utilization": result["cpu_utilization"],
+        "throughput": result["throughput"]
+    })
+    return encode(records)
+
+
+def run_disk(algorithm, tracks, head, direction, options):
+    """Worker: run a disk algorithm and return JSON lines."""
+    result = run_algorithm(algorithm, tracks, head, direction, **options)
+    return encode([*disk_records(algorithm, result, head), disk_summary(algorithm, result)])
+
+
+def int_in(value, low, high):
+    return isinstance(value, int) and not isinstance(value, bool) and low <= value <= high
+
+
+def positive_int(value):
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def valid_row(row):
+    return (isinstance(row, list) and 3 <= len(row) <= 4
+            and all(int_in(value, -MAX_TIME, MAX_TIME) for value in row)
+            and row[1] >= 0 and row[2] >= 0)
+
+
+def slice_bound(algorithm, rows, params):
+    """Upper bound on the slices (engine loop iterations) a process run takes."""
+    n = len(rows)
+    bursts = sum(row[2] for row in rows)
+    if algorithm == "Round Robin":
+        return bursts // params.get("time_quantum", 2) + n
+    if algorithm == "CFS":
+        # A low-weight task's timeslice can be a single time unit
+        return bursts + n
+    if algorithm == "MLFQ":
+        quanta = params.get("quanta", (2, 4, 8))
+        boost_interval = params.get("boost_interval", 100)
+        end = max((row[1] for row in rows), default=0) + bursts
+        # Every boost cuts the running slice and requeues every job
+        boosts = end // boost_interval if boost_interval else 0
+        return bursts // min(quanta) + n * len(quanta) + boosts * (n + 1)
+    # The rest preempt at most once per arrival
+    return 2 * n
+
+
+def init_worker():
+    # Forked workers inherit the event loop's SIGTERM handler, which ignores it
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.set_wakeup_fd(-1)
+
+
+def parse_job(path, payload):
+    """(worker function, args) for a request body, or HTTPError 400."""
+    if not isinstance(payload, dict):
+        raise HTTPError(400, "Body must be a JSON object")
+    algorithm = payload.get("algorithm")
+    if path == "/process":
+        if algorithm not in PROCESS_ALGORITHMS:
+            raise HTTPError(400, f"Unknown process algorithm: {algorithm}")
+        rows = payload.get("processes")
+        if not isinstance(rows, list) or not all(map(valid_row, rows)):
+            raise HTTPError(400, "processes must be a list of [pid, arrival, burst, priority] "
+                                 f"integers with arrival and burst in 0..{MAX_TIME}")
+        params = payload.get("params", {})
+        if not isinstance(params, dict):
+            raise HTTPError(400, "params must be an object")
+        params = {key: value for key, value in params.items()
+                  if key in PROCESS_OPTIONS.get(algorithm, ())}
+        for key, value in params.items():
+            if key == "quanta":
+                if not isinstance(value, list) or not value or not all(map(positive_int, value)):
+                    raise HTTPError(400, f"{key} must be a non-empty list of positive integers")
+            elif not positive_int(value):
+                raise HTTPError(400, f"{key} must be a positive integer")
+        bound = slice_bound(algorithm, rows, params)
+        if bound > MAX_SLICES:
+            raise HTTPError(400, f"Run could take {bound} slices, more than the limit of "
+                                 f"{MAX_SLICES}; use a larger quantum or a smaller workload")
+        return run_process, (algorithm, rows, params)
+    if algorithm not in DISK_ALGORITHMS:
+        raise HTTPError(400, f"Unknown disk algorithm: {algorithm}")
+    tracks = payload.get("requests")
+    if not isinstance(tracks, list):
+        raise HTTPError(400, "requests must be a list of tracks")
+    direction = payload.get("direction", "right")
+    if direction not in ("right", "left"):
+        raise HTTPError(400, "direction must be 'right' or 'left'")
+    options = payload.get("options", {})
+    if not isinstance(options, dict):
+        raise HTTPError(400, "options must be an object")
+    return run_disk, (algorithm, tracks, payload.get("head", 0), direction, options)
+
+
+class LRUCache:
+    """Encoded results by request key, bounded by entry count and total bytes."""
+
+    def __init__(self, max_entries=128, max_bytes=64 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        if len(value) > self.max_bytes:
+            return
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key))
+        self.entries[key] = value
+        self.size += len(value)
+        while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+
+class SchedulingService:
+    """Connection handler for asyncio.start_server / start_unix_server."""
+
+    def __init__(self, max_workers=None, max_queued=64, timeout=30.0, cache_size=128):
+        self.pool = ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker)
+        self.workers = max_workers or os.cpu_count() or 1
+        self.max_queued = max_queued
+        self.timeout = timeout
+        self.cache = LRUCache(cache_size)
+        self.active = 0
+        self.counts = {"served": 0, "rejected": 0, "timeouts": 0, "errors": 0}
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def health(self):
+        return {
+            "workers": self.workers,
+            "active": self.active,
+            "max_queued": self.max_queued,
+            **self.counts,
+            "cache": {"entries": len(self.cache.entries), "bytes": self.cache.size,
+                      "hits": self.cache.hits, "misses": self.cache.misses}
+        }
+
+    async def handle(self, reader, writer):
+        try:
+            while await self.handle_request(reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, reader, writer):
+        """Serve one request; returns False when the connection should close."""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), READ_TIMEOUT)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            return False
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, version = lines[0].split(" ")
+        except ValueError:
+            await self.respond_error(writer, HTTPError(400, "Malformed request line"))
+            return False
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+        try:
+            length = int(headers.get("content-length", 0))
+            if length > MAX_BODY:
+                raise HTTPError(413, f"Body is larger than {MAX_BODY} bytes")
+            try:
+                body = await asyncio.wait_for(reader.readexactly(length), READ_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise HTTPError(408, "Timed out reading the request body")
+            if path == "/health":
+                if method != "GET":
+                    raise HTTPError(405, "Use GET")
+                await self.respond(writer, 200, json.dumps(self.health()).encode() + b"\n",
+                                   keep_alive)
+                return keep_alive
+            if path not in ("/process", "/disk"):
+                raise HTTPError(404, f"No such endpoint: {path}")
+            if method != "POST":
+                raise HTTPError(405, "Use POST")
+            await self.stream(writer, await self.run(path, body), keep_alive)
+            return keep_alive
+        except ValueError:
+            await self.respond_error(writer, HTTPError(400, "Malformed request"))
+            return False
+        except HTTPError as e:
+            await self.respond_error(writer, e, keep_alive and e.status not in (408, 413))
+            return keep_alive and e.status not in (408, 413)
+
+    async def run(self, path, body):
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise HTTPError(400, "Body is not valid JSON")
+        function, args = parse_job(path, payload)
+        key = hashlib.sha256(path.encode() + b"\0" + body).hexdigest()
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.counts["served"] += 1
+            return cached
+        if self.active >= self.max_queued:
+            self.counts["rejected"] += 1
+            raise HTTPError(503, "Too many queued runs, retry later")
+
+        loop = asyncio.get_running_loop()
+
+        def done(job):
+            # Runs on the pool's thread; at shutdown the loop may be closed already
+            try:
+                loop.call_soon_threadsafe(self.release)
+            except RuntimeError:
+                pass
+
+        self.active += 1
+        job = None
+        try:
+            # A run stays active until a worker is done with it, even after a 504
+            job = self.pool.submit(function, *args)
+            job.add_done_callback(done)
+            result = await asyncio.wait_for(asyncio.wrap_future(job), self.timeout)
+        except asyncio.TimeoutError:
+            self.counts["timeouts"] += 1
+            raise HTTPError(504, f"Run took longer than {self.timeout} s")
+        except (ValueError, TypeError, KeyError) as e:
+            self.counts["errors"] += 1
+            raise HTTPError(400, str(e))
+        except Exception as e:
+            self.counts["errors"] += 1
+            raise HTTPError(500, f"{type(e).__name__}: {e}")
+        finally:
+            if job is None:
+                self.active -= 1
+        self.cache.put(key, result)
+        self.counts["served"] += 1
+        return result
+
+    def release(self):
+        self.active -= 1
+
+    async def stream(self, writer, body, keep_alive):
+        writer.write(self.status_line(200, keep_alive, "application/x-ndjson") +
+                     b"Transfer-Encoding: chunked\r\n\r\n")
+        for start in range(0, len(body), CHUNK_BYTES):
+            chunk = body[start:start + CHUNK_BYTES]
+            writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def respond(self, writer, status, body, keep_alive, extra=b""):
+        writer.write(self.status_line(status, keep_alive, "application/json") + extra +
+                     b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        await writer.drain()
+
+    async def respond_error(self, writer, error, keep_alive=False):
+        extra = b"Retry-After: 1\r\n" if error.status == 503 else b""
+        body = json.dumps({"error": str(error)}).encode() + b"\n"
+        await self.respond(writer, error.status, body, keep_alive, extra)
+
+    @staticmethod
+    def status_line(status, keep_alive, content_type):
+        return (f"HTTP/1.1 {status} {STATUS[status]}\r\nContent-Type: {content_type}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n").encode()
+
+
+async def serve(port=8750, unix=None, ready=None, **options):
+    """Run the service until cancelled. ready(address) is called once listening."""
+    service = SchedulingService(**options)
+    try:
+        # Stop on SIGTERM too, so the worker pool is shut down with the service
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except (NotImplementedError, RuntimeError):
+        # No signal handlers on Windows, or outside the main thread
+        pass
+    try:
+        if unix is not None:
+            server = await asyncio.start_unix_server(service.handle, path=unix)
+            address = unix
+        else:
+            server = await asyncio.start_server(service.handle, "127.0.0.1", port)
+            address = "http://127.0.0.1:%d" % server.sockets[0].getsockname()[1]
+        if ready is not None:
+            ready(address)
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+        if unix is not None and os.path.exists(unix):
+            os.remove(unix)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the schedulers over local HTTP")
+    parser.add_argument("--port", type=int, default=8750, help="TCP port on 127.0.0.1 (0 picks one)")
+    parser.add_argument("--unix", help="listen on this Unix socket path instead")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--max-queued", type=int, default=64,
+                        help="runs queued or running before new ones get 503")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds per run")
+    parser.add_argument("--cache-size", type=int, default=128, help="results kept in the LRU")
+    args = parser.parse_args(argv)
+
+    def ready(address):
+        print(f"Listening on {address}", flush=True)
+
+    try:
+        asyncio.run(serve(args.port, args.unix, ready, max_workers=args.workers,
+                          max_queued=args.max_queued, timeout=args.timeout,
+                          cache_size=args.cache_size))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+from .simulator import simulate_system
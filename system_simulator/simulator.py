@@ -0,0 +1,196 @@
+"""Coupled CPU + disk I/O discrete-event simulation.
+
+Each process alternates CPU bursts with disk requests:
+
+    {"process_id": 1, "arrival_time": 0, "priority": 0,
+     "cpu_bursts": [5, 3, 2], "io_tracks": [98, 37]}
+
+After every CPU burst but the last, the process blocks on the disk queue.
+The disk serves pending requests in batches ordered by look_algorithm or
+c_look_algorithm from the current head position, with service time
+seek_settle + seek_per_track * distance + transfer_time. Requests that arrive
+while a batch is being served wait for the next sweep. When the request
+completes, the process re-enters the CPU ready queue. All events share one
+heap.
+"""
+import heapq
+from collections import deque
+
+from disk_scheduler.algorithms import look_algorithm, c_look_algorithm
+from process_scheduler.metrics import percentile
+
+CPU_POLICIES = ("FCFS", "SJF", "Priority", "Round Robin")
+DISK_POLICIES = {"LOOK": look_algorithm, "C-LOOK": c_look_algorithm}
+
+ARRIVAL, CPU_DONE, DISK_DONE = 0, 1, 2
+
+
+class _Job:
+    __slots__ = ("process_id", "arrival_time", "priority", "cpu_bursts", "io_tracks",
+                 "phase", "remaining", "completion_time")
+
+    def __init__(self, process):
+        self.process_id = process["process_id"]
+        self.arrival_time = process["arrival_time"]
+        self.priority = process.get("priority", 0)
+        self.cpu_bursts = process["cpu_bursts"]
+        self.io_tracks = process.get("io_tracks", [])
+        if len(self.io_tracks) != len(self.cpu_bursts) - 1:
+            raise ValueError(f"Process {self.process_id} needs one I/O request between each pair of CPU bursts")
+        self.phase = 0
+        self.remaining = self.cpu_bursts[0]
+        self.completion_time = None
+
+
+class _QueueDepth:
+    """Time-weighted average and maximum of a queue length."""
+
+    def __init__(self):
+        self.depth = 0
+        self.max_depth = 0
+        self.area = 0
+        self.last_time = 0
+
+    def update(self, time, depth):
+        self.area += self.depth * (time - self.last_time)
+        self.last_time = time
+        self.depth = depth
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+
+def simulate_system(processes, cpu_policy="FCFS", disk_policy="LOOK", time_quantum=2,
+                    head=0, direction="right", seek_settle=1.0, seek_per_track=0.1,
+                    transfer_time=1.0):
+    if cpu_policy not in CPU_POLICIES:
+        raise ValueError(f"Unknown CPU policy: {cpu_policy}")
+    if disk_policy not in DISK_POLICIES:
+        raise ValueError(f"Unknown disk policy: {disk_policy}")
+    order_requests = DISK_POLICIES[disk_policy]
+
+    jobs = [_Job(p) for p in processes]
+    events = []
+    seq = 0
+
+    def push(time, kind, job):
+        nonlocal seq
+        heapq.heappush(events, (time, seq, kind, job))
+        seq += 1
+
+    # Arrivals are fed into the heap one at a time to keep it small
+    arrivals = iter(sorted(jobs, key=lambda job: job.arrival_time))
+    first = next(arrivals, None)
+    if first is not None:
+        push(first.arrival_time, ARRIVAL, first)
+
+    # CPU state
+    ready = []
+    running = None
+    cpu_busy = 0
+    cpu_depth = _QueueDepth()
+
+    # Disk state: pending requests wait for the next sweep, batch is the sweep in progress
+    pending = []
+    batch = deque()
+    disk_job = None
+    disk_busy = 0
+    head_movement = 0
+    disk_depth = _QueueDepth()
+
+    def cpu_key(job):
+        if cpu_policy == "SJF":
+            return job.remaining
+        if cpu_policy == "Priority":
+            return job.priority
+        return 0
+
+    def make_ready(job, time):
+        nonlocal seq
+        heapq.heappush(ready, (cpu_key(job), seq, job))
+        seq += 1
+        cpu_depth.update(time, len(ready))
+
+    def start_cpu(time):
+        nonlocal running, cpu_busy
+        _, _, job = heapq.heappop(ready)
+        cpu_depth.update(time, len(ready))
+        run_for = job.remaining
+        if cpu_policy == "Round Robin":
+            run_for = min(time_quantum, run_for)
+        running = job
+        cpu_busy += run_for
+        job.remaining -= run_for
+        push(time + run_for, CPU_DONE, job)
+
+    def start_disk(time):
+        nonlocal disk_job, disk_busy, head, direction, head_movement
+        if not batch:
+            by_track = {}
+            for track, job in pending:
+                by_track.setdefault(track, deque()).append(job)
+            result = order_requests([track for track, _ in pending], head, direction)
+            for track in result["sequence"]:
+                batch.append((track, by_track[track].popleft()))
+            pending.clear()
+        track, job = batch.popleft()
+        distance = abs(track - head)
+        if disk_policy == "LOOK" and track != head:
+            direction = "right" if track > head else "left"
+        service = (seek_settle + seek_per_track * distance if distance else 0) + transfer_time
+        head = track
+        head_movement += distance
+        disk_busy += service
+        disk_job = job
+        push(time + service, DISK_DONE, job)
+
+    time = 0
+    while events:
+        time, _, kind, job = heapq.heappop(events)
+
+        if kind == ARRIVAL:
+            make_ready(job, time)
+            following = next(arrivals, None)
+            if following is not None:
+                push(following.arrival_time, ARRIVAL, following)
+        elif kind == CPU_DONE:
+            running = None
+            if job.remaining > 0:
+                make_ready(job, time)
+            elif job.phase < len(job.io_tracks):
+                pending.append((job.io_tracks[job.phase], job))
+                disk_depth.update(time, len(pending) + len(batch))
+            else:
+                job.completion_time = time
+        else:
+            disk_job = None
+            job.phase += 1
+            job.remaining = job.cpu_bursts[job.phase]
+            make_ready(job, time)
+
+        if running is None and ready:
+            start_cpu(time)
+        if disk_job is None and (batch or pending):
+            start_disk(time)
+            disk_depth.update(time, len(pending) + len(batch))
+
+    makespan = time - min((job.arrival_time for job in jobs), default=0)
+    cpu_depth.update(time, 0)
+    disk_depth.update(time, 0)
+    response_times = {job.process_id: job.completion_time - job.arrival_time for job in jobs}
+    values = sorted(response_times.values())
+
+    return {
+        "response_times": response_times,
+        "avg_response_time": sum(values) / len(values) if values else 0.0,
+        "p95_response_time": percentile(values, 95),
+        "p99_response_time": percentile(values, 99),
+        "makespan": makespan,
+        "throughput": len(jobs) / makespan if makespan > 0 else 0.0,
+        "cpu_utilization": cpu_busy / makespan if makespan > 0 else 0.0,
+        "disk_utilization": disk_busy / makespan if makespan > 0 else 0.0,
+        "total_head_movement": head_movement,
+        "avg_cpu_queue_depth": cpu_depth.area / makespan if makespan > 0 else 0.0,
+        "max_cpu_queue_depth": cpu_depth.max_depth,
+        "avg_disk_queue_depth": disk_depth.area / makespan if makespan > 0 else 0.0,
+        "max_disk_queue_depth": disk_depth.max_depth
+    }
@@ -0,0 +1,9 @@
+from .traces import (
+    PROCESS_DTYPE,
+    DISK_DTYPE,
+    load_process_trace,
+    load_disk_trace,
+    write_process_trace,
+    write_disk_trace
+)
+from .generator import generate_processes, generate_disk_requests
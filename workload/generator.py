@@ -0,0 +1,219 @@
+"""Seeded synthetic process workloads and disk request streams.
+
+Everything is drawn from one np.random.default_rng(seed) with whole-array
+NumPy operations, so a seed always produces the same workload and ten
+million rows take seconds. The results are PROCESS_DTYPE / DISK_DTYPE
+records ordered by arrival, ready for write_process_trace or
+processes_from_records:
+
+    records = generate_processes(1_000_000, seed=1, arrivals="bursty", bursts="pareto")
+    write_process_trace("big.trace", records)
+
+    python -m workload.generator process big.trace -n 10000000 --arrivals bursty
+    python -m workload.generator disk requests.csv -n 100000 --pattern zipf --format csv
+"""
+import argparse
+
+import numpy as np
+
+from .traces import PROCESS_DTYPE, DISK_DTYPE, write_process_trace, write_disk_trace
+
+ARRIVALS = ("poisson", "bursty")
+BURSTS = ("exponential", "pareto")
+PATTERNS = ("uniform", "sequential", "hotspot", "zipf")
+
+
+def arrival_times(rng, n, rate=1.0, arrivals="poisson", burstiness=10.0, burst_size=20):
+    """Integer arrival times with a long-run rate of `rate` per time unit.
+
+    "poisson" has exponential gaps. "bursty" groups arrivals into clusters of
+    burst_size on average (geometric): gaps inside a cluster are burstiness
+    times shorter than the mean, and the gaps between clusters are stretched
+    so the overall rate is unchanged.
+    """
+    if arrivals not in ARRIVALS:
+        raise ValueError(f"Unknown arrival process: {arrivals}")
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+    mean = 1 / rate
+    if arrivals == "poisson":
+        gaps = rng.exponential(mean, n)
+    else:
+        if burstiness < 1 or burst_size < 1:
+            raise ValueError("burstiness and burst_size must be at least 1")
+        p = 1 / burst_size
+        short = mean / burstiness
+        idle = (mean - (1 - p) * short) / p
+        starts = rng.random(n) < p
+        gaps = rng.exponential(1.0, n) * np.where(starts, idle, short)
+    return np.floor(np.cumsum(gaps)).astype(np.int64)
+
+
+def burst_times(rng, n, bursts="exponential", mean_burst=10.0, pareto_shape=1.5, max_burst=None):
+    """Positive integer burst lengths with mean roughly mean_burst.
+
+    "pareto" draws from a Pareto distribution with the given shape (> 1),
+    scaled to mean_burst, for a heavy tail of long jobs; max_burst caps it.
+    """
+    if bursts not in BURSTS:
+        raise ValueError(f"Unknown burst distribution: {bursts}")
+    if mean_burst <= 0:
+        raise ValueError("mean_burst must be positive")
+    if bursts == "exponential":
+        values = rng.exponential(mean_burst, n)
+    else:
+        if pareto_shape <= 1:
+            raise ValueError("pareto_shape must be greater than 1 for a finite mean")
+        scale = mean_burst * (pareto_shape - 1) / pareto_shape
+        values = (rng.pareto(pareto_shape, n) + 1) * scale
+    if max_burst is not None:
+        values = np.minimum(values, max_burst)
+    # Round up so no burst is zero, and keep heavy tails within int64
+    return np.ceil(np.minimum(values, 2**53)).astype(np.int64).clip(1)
+
+
+def generate_processes(n, seed=0, arrivals="poisson", rate=1.0, burstiness=10.0, burst_size=20,
+                       bursts="exponential", mean_burst=10.0, pareto_shape=1.5, max_burst=None,
+                       priorities=None):
+    """n processes as PROCESS_DTYPE records, pids 1..n in arrival order.
+
+    priorities maps priority -> weight (e.g. {0: 0.7, 1: 0.2, 5: 0.1});
+    without it every process has priority 0.
+    """
+    rng = np.random.default_rng(seed)
+    records = np.empty(n, dtype=PROCESS_DTYPE)
+    records["process_id"] = np.arange(1, n + 1)
+    records["arrival_time"] = arrival_times(rng, n, rate, arrivals, burstiness, burst_size)
+    records["burst_time"] = burst_times(rng, n, bursts, mean_burst, pareto_shape, max_burst)
+    if priorities:
+        levels = np.fromiter(priorities.keys(), dtype=np.int64)
+        weights = np.fromiter(priorities.values(), dtype=float)
+        if (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError("priority weights must be non-negative and not all zero")
+        records["priority"] = rng.choice(levels, n, p=weights / weights.sum())
+    else:
+        records["priority"] = 0
+    return records
+
+
+def tracks(rng, n, pattern="uniform", disk_size=200, run_length=16, hotspot_fraction=0.1,
+           hotspot_weight=0.9, zipf_s=1.1):
+    """n track numbers in 0..disk_size-1.
+
+    "sequential" is runs of consecutive tracks (geometric lengths averaging
+    run_length, wrapping at the edge) from random starts. "hotspot" sends
+    hotspot_weight of the requests to one band covering hotspot_fraction of
+    the disk. "zipf" gives track popularity ~ 1 / rank**zipf_s, with the
+    ranks shuffled over the disk.
+    """
+    if pattern not in PATTERNS:
+        raise ValueError(f"Unknown track pattern: {pattern}")
+    if disk_size < 1:
+        raise ValueError("disk_size must be positive")
+    if pattern == "uniform":
+        return rng.integers(0, disk_size, n)
+    if pattern == "sequential":
+        if run_length < 1:
+            raise ValueError("run_length must be at least 1")
+        starts = rng.random(n) < 1 / run_length
+        starts[:1] = True
+        run = np.cumsum(starts) - 1
+        first = np.flatnonzero(starts)
+        offset = np.arange(n) - first[run]
+        return (rng.integers(0, disk_size, len(first))[run] + offset) % disk_size
+    if pattern == "hotspot":
+        if not 0 < hotspot_fraction <= 1 or not 0 <= hotspot_weight <= 1:
+            raise ValueError("hotspot_fraction must be in (0, 1] and hotspot_weight in [0, 1]")
+        width = max(1, int(disk_size * hotspot_fraction))
+        low = rng.integers(0, disk_size - width + 1)
+        hot = rng.random(n) < hotspot_weight
+        return np.where(hot, rng.integers(low, low + width, n), rng.integers(0, disk_size, n))
+    if zipf_s <= 0:
+        raise ValueError("zipf_s must be positive")
+    # Bounded Zipf: sample ranks from the cumulative weights, then map ranks to tracks
+    cumulative = np.cumsum(np.arange(1, disk_size + 1, dtype=float) ** -zipf_s)
+    ranks = np.searchsorted(cumulative, rng.random(n) * cumulative[-1], side="right")
+    return rng.permutation(disk_size)[np.minimum(ranks, disk_size - 1)]
+
+
+def generate_disk_requests(n, seed=0, pattern="uniform", disk_size=200, arrivals="poisson",
+                           rate=1.0, burstiness=10.0, burst_size=20, run_length=16,
+                           hotspot_fraction=0.1, hotspot_weight=0.9, zipf_s=1.1):
+    """n disk requests as DISK_DTYPE records in timestamp order (see tracks)."""
+    rng = np.random.default_rng(seed)
+    records = np.empty(n, dtype=DISK_DTYPE)
+    records["timestamp"] = arrival_times(rng, n, rate, arrivals, burstiness, burst_size)
+    records["track"] = tracks(rng, n, pattern, disk_size, run_length, hotspot_fraction,
+                              hotspot_weight, zipf_s)
+    return records
+
+
+def write_csv(path, records):
+    """Write records as a CSV trace with a header row."""
+    np.savetxt(path, records.view((np.int64, len(records.dtype.names))).reshape(len(records), -1),
+               fmt="%d", delimiter=",", header=",".join(records.dtype.names), comments="")
+
+
+def parse_priorities(text):
+    """"0:0.7,1:0.2,5:0.1" -> {0: 0.7, 1: 0.2, 5: 0.1}"""
+    priorities = {}
+    for item in text.split(","):
+        level, _, weight = item.partition(":")
+        priorities[int(level)] = float(weight or 1)
+    return priorities
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic workload trace")
+    subparsers = parser.add_subparsers(dest="kind", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("output", help="trace file to write")
+    common.add_argument("-n", type=int, default=100000, help="rows to generate")
+    common.add_argument("--seed", type=int, default=0)
+    common.add_argument("--format", choices=("binary", "csv"), default="binary")
+    common.add_argument("--arrivals", choices=ARRIVALS, default="poisson")
+    common.add_argument("--rate", type=float, default=1.0, help="mean arrivals per time unit")
+    common.add_argument("--burstiness", type=float, default=10.0,
+                        help="how much denser arrivals are inside a burst")
+    common.add_argument("--burst-size", type=float, default=20, help="mean arrivals per burst")
+
+    process = subparsers.add_parser("process", parents=[common], help="pid,arrival,burst,priority rows")
+    process.add_argument("--bursts", choices=BURSTS, default="exponential")
+    process.add_argument("--mean-burst", type=float, default=10.0)
+    process.add_argument("--pareto-shape", type=float, default=1.5)
+    process.add_argument("--max-burst", type=int, default=None)
+    process.add_argument("--priorities", type=parse_priorities, default=None,
+                         help="priority:weight list, e.g. 0:0.7,1:0.2,5:0.1")
+
+    disk = subparsers.add_parser("disk", parents=[common], help="timestamp,track rows")
+    disk.add_argument("--pattern", choices=PATTERNS, default="uniform")
+    disk.add_argument("--disk-size", type=int, default=200)
+    disk.add_argument("--run-length", type=float, default=16, help="mean sequential run length")
+    disk.add_argument("--hotspot-fraction", type=float, default=0.1)
+    disk.add_argument("--hotspot-weight", type=float, default=0.9)
+    disk.add_argument("--zipf-s", type=float, default=1.1)
+    args = parser.parse_args(argv)
+
+    arrivals = dict(seed=args.seed, arrivals=args.arrivals, rate=args.rate,
+                    burstiness=args.burstiness, burst_size=args.burst_size)
+    if args.kind == "process":
+        records = generate_processes(args.n, bursts=args.bursts, mean_burst=args.mean_burst,
+                                     pareto_shape=args.pareto_shape, max_burst=args.max_burst,
+                                     priorities=args.priorities, **arrivals)
+        write = write_process_trace
+    else:
+        records = generate_disk_requests(args.n, pattern=args.pattern, disk_size=args.disk_size,
+                                         run_length=args.run_length,
+                                         hotspot_fraction=args.hotspot_fraction,
+                                         hotspot_weight=args.hotspot_weight, zipf_s=args.zipf_s,
+                                         **arrivals)
+        write = write_disk_trace
+    if args.format == "csv":
+        write_csv(args.output, records)
+    else:
+        write(args.output, records)
+
+
+if __name__ == "__main__":
+    main()
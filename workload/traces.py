@@ -0,0 +1,137 @@
+"""Bulk loading of process and disk request traces.
+
+Traces come either as CSV or as a compact fixed-width binary file: a 16-byte
+header (magic b"OSTR", format version, record kind, record count) followed by
+little-endian int64 records. Binary traces are memory-mapped, CSV traces are
+parsed by NumPy's C reader, so both load into NumPy structured arrays
+without creating a Python object per row.
+
+Process records: process_id, arrival_time, burst_time, priority
+Disk records:    timestamp, track
+"""
+import struct
+
+import numpy as np
+
+PROCESS_DTYPE = np.dtype([
+    ("process_id", "<i8"),
+    ("arrival_time", "<i8"),
+    ("burst_time", "<i8"),
+    ("priority", "<i8")
+])
+DISK_DTYPE = np.dtype([
+    ("timestamp", "<i8"),
+    ("track", "<i8")
+])
+
+MAGIC = b"OSTR"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQ")
+KINDS = {1: PROCESS_DTYPE, 2: DISK_DTYPE}
+KIND_OF = {PROCESS_DTYPE: 1, DISK_DTYPE: 2}
+
+
+def _is_binary(path):
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _load_binary(path, dtype):
+    with open(path, "rb") as f:
+        magic, version, kind, count = HEADER.unpack(f.read(HEADER.size))
+    if version != VERSION:
+        raise ValueError(f"Unsupported trace version {version} in {path}")
+    if KINDS.get(kind) != dtype:
+        raise ValueError(f"{path} is not a {'process' if dtype == PROCESS_DTYPE else 'disk'} trace")
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=HEADER.size, shape=(count,))
+
+
+def _has_header(path):
+    """True if the first line is a header, i.e. its first value is not a number at all."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                try:
+                    float(line.split(",")[0])
+                except ValueError:
+                    return True
+                return False
+    return False
+
+
+def _bad_row(path, skip, min_columns):
+    """ValueError naming the first row that is not min_columns+ integers like the rest."""
+    width = None
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            if number <= skip or not line.strip():
+                continue
+            fields = line.strip().split(",")
+            try:
+                [int(v) for v in fields]
+            except ValueError:
+                return ValueError(f"{path}, line {number}: expected integers, got {line.strip()!r}")
+            if len(fields) < min_columns:
+                return ValueError(f"{path}, line {number}: expected at least {min_columns} "
+                                  f"values, got {len(fields)}")
+            if width is not None and len(fields) != width:
+                return ValueError(f"{path}, line {number}: expected {width} values like the "
+                                  f"rows before it, got {len(fields)}")
+            width = len(fields)
+    return None
+
+
+def _load_csv(path, dtype, min_columns):
+    skip = 1 if _has_header(path) else 0
+    try:
+        data = np.loadtxt(path, delimiter=",", dtype=np.int64, ndmin=2, skiprows=skip)
+    except ValueError:
+        error = _bad_row(path, skip, min_columns)
+        if error is None:
+            raise
+        raise error from None
+    if len(data) and data.shape[1] < min_columns:
+        raise _bad_row(path, skip, min_columns)
+    records = np.zeros(len(data), dtype=dtype)
+    for i, name in enumerate(dtype.names[:data.shape[1]]):
+        records[name] = data[:, i]
+    return records, data.shape[1]
+
+
+def load_process_trace(path):
+    """Load pid,arrival,burst[,priority] records from a CSV or binary trace.
+
+    A CSV row with fewer than three values, or a non-integer one, raises
+    ValueError naming the file and line.
+    """
+    if _is_binary(path):
+        return _load_binary(path, PROCESS_DTYPE)
+    return _load_csv(path, PROCESS_DTYPE, 3)[0]
+
+
+def load_disk_trace(path):
+    """Load timestamp,track records; a single-column CSV is read as tracks only."""
+    if _is_binary(path):
+        return _load_binary(path, DISK_DTYPE)
+    records, columns = _load_csv(path, DISK_DTYPE, 1)
+    if columns == 1:
+        records["track"] = records["timestamp"]
+        records["timestamp"] = 0
+    return records
+
+
+def _write_binary(path, records, dtype):
+    records = np.ascontiguousarray(records, dtype=dtype)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, KIND_OF[dtype], len(records)))
+        records.tofile(f)
+
+
+def write_process_trace(path, records):
+    _write_binary(path, records, PROCESS_DTYPE)
+
+
+def write_disk_trace(path, records):
+    _write_binary(path, records, DISK_DTYPE)